@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""End-to-end benchmarks of the integration against a local upstream stand-in.
+
+A local aiohttp server (own thread and event loop) serves tempoLight, the RTE
+season calendar, joursTempo, Open-DPE light/full and the tariff CSVs; the
+integration's upstream URL constants are pointed at it. The script measures:
+
+* cold ``async_setup_entry`` (empty store, every source downloaded) and warm
+  setup (store written by the previous unload);
+* per-coordinator refresh latency, with the hub memo cleared, and for the
+  conditional resources also with the ETag kept (HTTP 304 path);
+* peak traced memory of each phase (tracemalloc, all threads);
+* time spent running callbacks on the Home Assistant loop versus in executor
+  jobs submitted through ``hass.async_add_executor_job``.
+
+Results are written as JSON (stdout or ``--output``); ``--baseline`` compares
+against a previous run and exits with status 1 on regressions.
+
+    pip install -r benchmarks/requirements.txt
+    python benchmarks/bench.py --iterations 20 --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+import json
+import logging
+import os
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Any
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(BENCH_DIR))
+
+from fixtures import FILES, generate, load_recorded  # noqa: E402
+from server import UpstreamStandIn  # noqa: E402
+
+DOMAIN = "tempo_rte_forecast"
+SCHEMA_VERSION = 1
+
+# Regressions below these absolute deltas are noise
+MIN_TIME_DELTA = 0.002
+MIN_MEM_DELTA = 256 * 1024
+
+_CONTRACT_URLS = {
+    "Base": "PRICE_BASE_URL",
+    "Heures Creuses": "PRICE_HPHC_URL",
+    "Tempo": "PRICE_TEMPO_URL",
+}
+
+
+class Counters:
+    """Loop and executor busy time, accumulated across threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.loop_s = 0.0
+        self.executor_s = 0.0
+        self.executor_jobs = 0
+
+    def add_loop(self, seconds: float) -> None:
+        self.loop_s += seconds  # loop thread only
+
+    def add_executor(self, seconds: float) -> None:
+        with self._lock:
+            self.executor_s += seconds
+            self.executor_jobs += 1
+
+    def snapshot(self) -> tuple[float, float, int]:
+        with self._lock:
+            return self.loop_s, self.executor_s, self.executor_jobs
+
+
+def instrument_loop(loop: asyncio.AbstractEventLoop, counters: Counters) -> None:
+    """Time every callback run by ``loop`` (task steps, timers, I/O callbacks)."""
+    original = asyncio.events.Handle._run
+
+    def _run(handle: asyncio.Handle) -> None:
+        if handle._loop is not loop:  # noqa: SLF001
+            original(handle)
+            return
+        start = time.perf_counter()
+        try:
+            original(handle)
+        finally:
+            counters.add_loop(time.perf_counter() - start)
+
+    asyncio.events.Handle._run = _run
+
+
+def instrument_executor(hass: Any, counters: Counters) -> None:
+    """Time jobs submitted through ``hass.async_add_executor_job``."""
+    original = hass.async_add_executor_job
+
+    def async_add_executor_job(target: Callable[..., Any], *args: Any) -> asyncio.Future:
+        def run() -> Any:
+            start = time.perf_counter()
+            try:
+                return target(*args)
+            finally:
+                counters.add_executor(time.perf_counter() - start)
+
+        return original(run)
+
+    hass.async_add_executor_job = async_add_executor_job
+
+
+class Probe:
+    """Measures one phase: wall time, loop/executor time, peak memory, requests."""
+
+    def __init__(self, counters: Counters, server: UpstreamStandIn) -> None:
+        self.counters = counters
+        self.server = server
+
+    @contextmanager
+    def measure(self) -> Iterator[dict[str, Any]]:
+        sample: dict[str, Any] = {}
+        loop0, exec0, jobs0 = self.counters.snapshot()
+        hits0 = sum(self.server.hits.values())
+        not_modified0 = sum(self.server.not_modified.values())
+        tracemalloc.reset_peak()
+        mem0 = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield sample
+        finally:
+            wall = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory()
+            loop1, exec1, jobs1 = self.counters.snapshot()
+            sample.update(
+                wall_s=wall,
+                loop_s=loop1 - loop0,
+                executor_s=exec1 - exec0,
+                executor_jobs=jobs1 - jobs0,
+                peak_mem_bytes=peak - mem0,
+                retained_mem_bytes=current - mem0,
+                requests=sum(self.server.hits.values()) - hits0,
+                not_modified=sum(self.server.not_modified.values()) - not_modified0,
+            )
+
+
+def summarize(samples: list[dict[str, Any]]) -> dict[str, Any]:
+    walls = sorted(s["wall_s"] for s in samples)
+    p95 = walls[min(len(walls) - 1, round(0.95 * (len(walls) - 1)))]
+    return {
+        "iterations": len(samples),
+        "min_s": walls[0],
+        "median_s": statistics.median(walls),
+        "p95_s": p95,
+        "max_s": walls[-1],
+        "loop_median_s": statistics.median(s["loop_s"] for s in samples),
+        "executor_median_s": statistics.median(s["executor_s"] for s in samples),
+        "executor_jobs": samples[-1]["executor_jobs"],
+        "peak_mem_bytes": max(s["peak_mem_bytes"] for s in samples),
+        "requests": samples[-1]["requests"],
+        "not_modified": samples[-1]["not_modified"],
+    }
+
+
+class ServerThread:
+    """Runs the stand-in on its own loop so it does not count as integration loop time."""
+
+    def __init__(self, server: UpstreamStandIn) -> None:
+        self.server = server
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="upstream", daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self.loop).result()
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+def redirect_upstream(urls: dict[str, str]) -> None:
+    """Point the integration's upstream URL constants at the stand-in."""
+    from custom_components.tempo_rte_forecast import (
+        const,
+        forecast_coordinator,
+        tariffs,
+        tempo_coordinator,
+    )
+
+    for module in (const, tempo_coordinator, forecast_coordinator, tariffs):
+        for name, url in urls.items():
+            if hasattr(module, name):
+                setattr(module, name, url)
+    for contract, (_url, row_parser) in list(tariffs.TARIFF_GRIDS.items()):
+        tariffs.TARIFF_GRIDS[contract] = (urls[_CONTRACT_URLS[contract]], row_parser)
+
+
+async def run_benchmarks(args: argparse.Namespace, fixtures_source: str, fixtures: Any) -> dict[str, Any]:
+    from homeassistant import loader
+    from homeassistant.const import __version__ as ha_version
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_test_home_assistant,
+    )
+
+    counters = Counters()
+    server = UpstreamStandIn(fixtures, latency=args.latency_ms / 1000, etag=not args.no_etag)
+    server_thread = ServerThread(server)
+    server_thread.start()
+    results: dict[str, Any] = {}
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="tempo-bench-") as config_dir:
+            os.symlink(ROOT / "custom_components", Path(config_dir) / "custom_components")
+            sys.path.insert(0, config_dir)
+            redirect_upstream(server.urls())
+
+            async with async_test_home_assistant(config_dir=config_dir) as hass:
+                hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+                hass.config.language = args.language
+                instrument_loop(hass.loop, counters)
+                instrument_executor(hass, counters)
+                probe = Probe(counters, server)
+
+                entry = MockConfigEntry(
+                    domain=DOMAIN,
+                    title="Benchmark",
+                    data={},
+                    options={
+                        "contract": args.contract,
+                        "subscribed_power": args.subscribed_power,
+                        "opendpe_service_type": args.opendpe,
+                    },
+                )
+                entry.add_to_hass(hass)
+
+                tracemalloc.start()
+                with probe.measure() as sample:
+                    assert await hass.config_entries.async_setup(entry.entry_id)
+                    await hass.async_block_till_done()
+                results["setup_cold"] = sample
+
+                results["refresh"] = await _bench_refreshes(hass, entry, probe, args.iterations)
+
+                with probe.measure() as sample:
+                    assert await hass.config_entries.async_unload(entry.entry_id)
+                    await hass.async_block_till_done()
+                results["unload"] = sample
+
+                with probe.measure() as sample:
+                    assert await hass.config_entries.async_setup(entry.entry_id)
+                    await hass.async_block_till_done()
+                results["setup_warm"] = sample
+
+                await hass.config_entries.async_unload(entry.entry_id)
+                await hass.async_block_till_done()
+                tracemalloc.stop()
+    finally:
+        server_thread.stop()
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "homeassistant": ha_version,
+            "integration": json.loads(
+                (ROOT / "custom_components" / DOMAIN / "manifest.json").read_text()
+            )["version"],
+            "git": _git_revision(),
+            "fixtures": fixtures_source,
+        },
+        "config": {
+            "iterations": args.iterations,
+            "contract": args.contract,
+            "subscribed_power": args.subscribed_power,
+            "opendpe": args.opendpe,
+            "latency_ms": args.latency_ms,
+            "etag": not args.no_etag,
+            "fixture_bytes": {name: len(fixtures[name]) for name in FILES},
+        },
+        "results": results,
+    }
+
+
+async def _bench_refreshes(hass: Any, entry: Any, probe: Probe, iterations: int) -> dict[str, Any]:
+    runtime = entry.runtime_data
+    hub = hass.data[DOMAIN]["hub"]
+
+    async def refresh_prices() -> None:
+        await runtime.price_coordinator._update_prices(force=True)  # noqa: SLF001
+        await runtime.price_coordinator.async_refresh()
+
+    # name -> (refresh, keep conditional validators)
+    scenarios: dict[str, tuple[Callable[[], Awaitable[None]], bool]] = {
+        "tempo": (runtime.tempo_coordinator.async_refresh, False),
+        "forecast": (runtime.forecast_coordinator.async_refresh, False),
+        "forecast_not_modified": (runtime.forecast_coordinator.async_refresh, True),
+        "prices": (refresh_prices, False),
+        "prices_not_modified": (refresh_prices, True),
+    }
+    out = {}
+    for name, (refresh, keep_validators) in scenarios.items():
+        samples = []
+        for _ in range(iterations):
+            # Measure the upstream path, not the hub's 60 s memo
+            hub._results.clear()  # noqa: SLF001
+            if not keep_validators:
+                hub._conditional.clear()  # noqa: SLF001
+            with probe.measure() as sample:
+                await refresh()
+                await hass.async_block_till_done()
+            samples.append(sample)
+        out[name] = summarize(samples)
+    return out
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _metrics(report: dict[str, Any]) -> dict[str, float]:
+    """Comparable metrics: setup wall time/memory, refresh median/memory."""
+    flat = {}
+    results = report["results"]
+    for phase in ("setup_cold", "setup_warm"):
+        if phase in results:
+            flat[f"{phase}.wall_s"] = results[phase]["wall_s"]
+            flat[f"{phase}.peak_mem_bytes"] = results[phase]["peak_mem_bytes"]
+    for name, summary in results.get("refresh", {}).items():
+        flat[f"refresh.{name}.median_s"] = summary["median_s"]
+        flat[f"refresh.{name}.peak_mem_bytes"] = summary["peak_mem_bytes"]
+    return flat
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[dict[str, Any]]:
+    """Metrics worse than the baseline by more than ``threshold`` (relative)."""
+    regressions = []
+    old = _metrics(baseline)
+    for key, new_value in _metrics(report).items():
+        old_value = old.get(key)
+        if old_value is None:
+            continue
+        floor = MIN_MEM_DELTA if key.endswith("_bytes") else MIN_TIME_DELTA
+        if new_value - old_value > max(floor, old_value * threshold):
+            regressions.append({"metric": key, "baseline": old_value, "current": new_value})
+    return regressions
+
+
+async def record(directory: Path) -> None:
+    """Capture the real upstream payloads into ``directory``."""
+    import aiohttp
+
+    sys.path.insert(0, str(ROOT))
+    from custom_components.tempo_rte_forecast import const
+
+    today = date.today()
+    season_start = today.year - (1 if today.month < 8 else 0)
+    urls = {
+        "tempo_light": const.RTE_API_URL,
+        "tempo_full": const.RTE_API_FULL_URL.format(season=f"{season_start}-{season_start + 1}"),
+        "jours_tempo": (
+            f"{const.COULEUR_TEMPO_API_BASE}/api/joursTempo"
+            f"?dateJour[]={today.isoformat()}&dateJour[]={(today + timedelta(days=1)).isoformat()}"
+        ),
+        "opendpe_light": const.OPEN_DPE_LIGHT_URL,
+        "opendpe_full": const.OPEN_DPE_FULL_URL,
+        "price_base": const.PRICE_BASE_URL,
+        "price_hphc": const.PRICE_HPHC_URL,
+        "price_tempo": const.PRICE_TEMPO_URL,
+    }
+    directory.mkdir(parents=True, exist_ok=True)
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=60)) as session:
+        for name, url in urls.items():
+            async with session.get(url) as response:
+                response.raise_for_status()
+                (directory / FILES[name]).write_bytes(await response.read())
+            print(f"{name}: {url}", file=sys.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--contract", choices=list(_CONTRACT_URLS), default="Tempo")
+    parser.add_argument("--subscribed-power", default="9")
+    parser.add_argument("--opendpe", choices=("light", "full"), default="light")
+    parser.add_argument("--language", default="fr")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated upstream latency")
+    parser.add_argument("--no-etag", action="store_true", help="upstream sends no validators")
+    parser.add_argument("--fixtures", type=Path, help="serve payloads recorded with --record")
+    parser.add_argument("--record", type=Path, help="capture real upstream payloads and exit")
+    parser.add_argument("--output", type=Path, help="JSON report path (default: stdout)")
+    parser.add_argument("--baseline", type=Path, help="previous report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative regression threshold")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+
+    if args.record:
+        asyncio.run(record(args.record))
+        return 0
+
+    if args.fixtures:
+        fixtures, source = load_recorded(args.fixtures), f"recorded:{args.fixtures}"
+    else:
+        fixtures, source = generate(date.today()), "generated"
+
+    from homeassistant import runner
+
+    asyncio.set_event_loop_policy(runner.HassEventLoopPolicy(False))
+    report = asyncio.run(run_benchmarks(args, source, fixtures))
+
+    status = 0
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text()), args.threshold)
+        report["regressions"] = regressions
+        for reg in regressions:
+            print(
+                f"REGRESSION {reg['metric']}: {reg['baseline']:.6g} -> {reg['current']:.6g}",
+                file=sys.stderr,
+            )
+        status = 1 if regressions else 0
+
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
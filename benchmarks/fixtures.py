@@ -0,0 +1,159 @@
+"""Upstream payloads served by the benchmark server.
+
+Payloads are generated around a reference date so the coordinators find J and
+J+1 and take their normal (successful) path. ``load_recorded`` serves files
+captured from the real services with ``bench.py --record`` instead; their
+dates are frozen, so the Tempo chain may fall through to its fallbacks.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+import json
+from pathlib import Path
+import random
+
+RTE_COLORS = ("BLUE", "WHITE", "RED")
+FR_COLORS = {"BLUE": "bleu", "WHITE": "blanc", "RED": "rouge"}
+CODES = {"BLUE": 1, "WHITE": 2, "RED": 3}
+
+# Route -> file name, shared by the server and the recorder
+FILES = {
+    "tempo_light": "tempoLight.json",
+    "tempo_full": "tempo_full.json",
+    "jours_tempo": "joursTempo.json",
+    "opendpe_light": "tempo_days_lite.json",
+    "opendpe_full": "tempo_days.json",
+    "price_base": "price_base.csv",
+    "price_hphc": "price_hphc.csv",
+    "price_tempo": "price_tempo.csv",
+}
+
+POWERS = ("3", "6", "9", "12", "15", "18", "24", "30", "36")
+
+
+@dataclass(slots=True)
+class Fixtures:
+    """Raw bodies, keyed like ``FILES``."""
+
+    bodies: dict[str, bytes]
+
+    def __getitem__(self, name: str) -> bytes:
+        return self.bodies[name]
+
+
+def _season_start(day: date) -> date:
+    return date(day.year - (1 if day.month < 8 else 0), 8, 1)
+
+
+def _season_colors(today: date, rng: random.Random) -> dict[str, str]:
+    """Season calendar up to J+1, with realistic proportions."""
+    colors = {}
+    day = _season_start(today)
+    while day <= today + timedelta(days=1):
+        winter = day.month in (11, 12, 1, 2, 3) and day.weekday() < 5
+        colors[day.isoformat()] = (
+            rng.choices(RTE_COLORS, (60, 25, 15))[0] if winter else "BLUE"
+        )
+        day += timedelta(days=1)
+    return colors
+
+
+def _opendpe(today: date, rng: random.Random, full: bool) -> list[dict]:
+    rows = []
+    for offset in range(1, 10):
+        day = today + timedelta(days=offset)
+        color = FR_COLORS[rng.choice(RTE_COLORS)]
+        p_blue, p_white = rng.random() * 0.6, rng.random() * 0.3
+        if full:
+            rows.append({
+                "date": day.isoformat(),
+                "forecast": rng.randint(40000, 80000),
+                "consumption_net": rng.randint(40000, 80000),
+                "stock_blanc": rng.randint(0, 43),
+                "stock_rouge": rng.randint(0, 22),
+                "tempo_color": color,
+                "probability": round(p_blue + p_white, 2) if offset > 1 else 1,
+                "probability_bleu": round(p_blue, 2),
+                "probability_blanc": round(p_white, 2),
+                "probability_rouge": round(max(0.0, 1 - p_blue - p_white), 2),
+            })
+        else:
+            rows.append({
+                "date": day.isoformat(),
+                "couleur": color,
+                "probability": round(rng.random(), 2) if offset > 1 else 1,
+            })
+    return rows
+
+
+def _tariff_csv(columns: list[str], row_values, years: int) -> bytes:
+    """History of yearly grids for every power (newest one open-ended)."""
+    lines = [";".join(["DATE_DEBUT", "DATE_FIN", "P_SOUSCRITE", "PART_FIXE_TTC", *columns])]
+    first_year = date.today().year - years + 1
+    for year in range(first_year, first_year + years):
+        start = date(year, 2, 1)
+        end = "" if year == first_year + years - 1 else date(year + 1, 1, 31).strftime("%d/%m/%Y")
+        for power in POWERS:
+            values = [f"{v:.4f}".replace(".", ",") for v in row_values(year, int(power))]
+            fixed = f"{int(power) * 1.9 + year % 7:.2f}".replace(".", ",")
+            lines.append(";".join([start.strftime("%d/%m/%Y"), end, power, fixed, *values]))
+    return ("\n".join(lines) + "\n").encode("utf-8-sig")
+
+
+def generate(today: date, *, seed: int = 42, tariff_years: int = 12) -> Fixtures:
+    """Deterministic payloads for ``today``."""
+    rng = random.Random(seed)
+    season = _season_colors(today, rng)
+    tomorrow = today + timedelta(days=1)
+    light = {d: c for d, c in season.items() if date.fromisoformat(d) >= today - timedelta(days=1)}
+    jours = [
+        {
+            "dateJour": d,
+            "codeJour": CODES[season[d]],
+            "periode": f"{_season_start(today).year}-{_season_start(today).year + 1}",
+            "libCouleur": FR_COLORS[season[d]].capitalize(),
+        }
+        for d in (today.isoformat(), tomorrow.isoformat())
+    ]
+
+    def base(year: int, power: int) -> list[float]:
+        return [0.17 + (year % 10) * 0.004]
+
+    def hphc(year: int, power: int) -> list[float]:
+        return [0.19 + (year % 10) * 0.004, 0.14 + (year % 10) * 0.003]
+
+    def tempo(year: int, power: int) -> list[float]:
+        k = (year % 10) * 0.003
+        return [0.12 + k, 0.15 + k, 0.14 + k, 0.17 + k, 0.15 + k, 0.65 + k]
+
+    bodies = {
+        "tempo_light": json.dumps({"values": light}).encode(),
+        "tempo_full": json.dumps({"values": season}).encode(),
+        "jours_tempo": json.dumps(jours).encode(),
+        "opendpe_light": json.dumps(_opendpe(today, rng, full=False)).encode(),
+        "opendpe_full": json.dumps(_opendpe(today, rng, full=True)).encode(),
+        "price_base": _tariff_csv(["PART_VARIABLE_TTC"], base, tariff_years),
+        "price_hphc": _tariff_csv(
+            ["PART_VARIABLE_HP_TTC", "PART_VARIABLE_HC_TTC"], hphc, tariff_years
+        ),
+        "price_tempo": _tariff_csv(
+            [
+                "PART_VARIABLE_HCBleu_TTC",
+                "PART_VARIABLE_HPBleu_TTC",
+                "PART_VARIABLE_HCBlanc_TTC",
+                "PART_VARIABLE_HPBlanc_TTC",
+                "PART_VARIABLE_HCRouge_TTC",
+                "PART_VARIABLE_HPRouge_TTC",
+            ],
+            tempo,
+            tariff_years,
+        ),
+    }
+    return Fixtures(bodies)
+
+
+def load_recorded(directory: Path) -> Fixtures:
+    """Bodies previously captured by ``bench.py --record``."""
+    return Fixtures({name: (directory / file).read_bytes() for name, file in FILES.items()})
@@ -0,0 +1,83 @@
+"""Local aiohttp stand-in for RTE, api-couleur-tempo.fr, Open-DPE and data.gouv.fr."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import hashlib
+
+from aiohttp import hdrs, web
+
+from fixtures import Fixtures
+
+# Path on the local server -> fixture name
+ROUTES = {
+    "/rte/tempoLight": "tempo_light",
+    "/rte/tempo": "tempo_full",
+    "/couleur/api/joursTempo": "jours_tempo",
+    "/opendpe/tempo_days_lite.json": "opendpe_light",
+    "/opendpe/tempo_days.json": "opendpe_full",
+    "/datagouv/base.csv": "price_base",
+    "/datagouv/hphc.csv": "price_hphc",
+    "/datagouv/tempo.csv": "price_tempo",
+}
+
+_CONTENT_TYPES = {"csv": "text/csv", "json": "application/json"}
+
+
+class UpstreamStandIn:
+    """Serves the fixtures with ETag support and an optional simulated latency."""
+
+    def __init__(self, fixtures: Fixtures, *, latency: float = 0.0, etag: bool = True) -> None:
+        self.fixtures = fixtures
+        self.latency = latency
+        self.etag = etag
+        self.hits: Counter[str] = Counter()
+        self.not_modified: Counter[str] = Counter()
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        name = ROUTES[request.path]
+        self.hits[name] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        body = self.fixtures[name]
+        content_type = _CONTENT_TYPES["csv" if name.startswith("price_") else "json"]
+        headers = {}
+        if self.etag:
+            tag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            headers[hdrs.ETAG] = tag
+            if request.headers.get(hdrs.IF_NONE_MATCH) == tag:
+                self.not_modified[name] += 1
+                return web.Response(status=304, headers=headers)
+        return web.Response(body=body, content_type=content_type, headers=headers)
+
+    async def start(self) -> None:
+        app = web.Application()
+        for path in ROUTES:
+            app.router.add_get(path, self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.base_url = f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def urls(self) -> dict[str, str]:
+        """Replacement values for the integration's upstream URL constants."""
+        b = self.base_url
+        return {
+            "RTE_API_URL": f"{b}/rte/tempoLight",
+            "RTE_API_FULL_URL": f"{b}/rte/tempo?season={{season}}",
+            "COULEUR_TEMPO_API_BASE": f"{b}/couleur",
+            "OPEN_DPE_LIGHT_URL": f"{b}/opendpe/tempo_days_lite.json",
+            "OPEN_DPE_FULL_URL": f"{b}/opendpe/tempo_days.json",
+            "PRICE_BASE_URL": f"{b}/datagouv/base.csv",
+            "PRICE_HPHC_URL": f"{b}/datagouv/hphc.csv",
+            "PRICE_TEMPO_URL": f"{b}/datagouv/tempo.csv",
+        }
@@ -4,25 +4,32 @@ Copyright (C) 2025 Christophe Bansart
 """
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 import logging
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import config_validation as cv
 
 from .const import (
     DOMAIN
 )
 from .forecast_coordinator import ForecastCoordinator
+from .hub import async_release_hub
 from .prices_coordinator import PriceCoordinator
+from .snapshot import TempoSnapshotPublisher
+from .statistics_import import TempoStatisticsImporter
+from .storage import TempoStore
+from .tariffs import TARIFF_GRIDS
 from .tempo_coordinator import TempoDataCoordinator
 
-PLATFORMS = ["sensor"]
+PLATFORMS = ["sensor", "calendar"]
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,7 +37,7 @@ DATA_REFRESH_SERVICE_REGISTERED = "refresh_service_registered"
 
 
 async def _async_ensure_refresh_service(hass: HomeAssistant) -> None:
-    """Register tempo_rte_forecast.refresh once (manual API re-fetch)."""
+    """Register tempo_rte_forecast.refresh (manual API re-fetch) and get_prices once."""
     reg = hass.data.setdefault(DOMAIN, {})
     if reg.get(DATA_REFRESH_SERVICE_REGISTERED):
         return
@@ -43,31 +50,61 @@ async def _async_ensure_refresh_service(hass: HomeAssistant) -> None:
             if runtime is None:
                 continue
             title = ent.title
-            try:
-                await runtime.forecast_coordinator.async_refresh()
-            except Exception as err:
-                _LOGGER.warning("%s: manual forecast refresh failed: %s", title, err)
-            try:
-                await runtime.tempo_coordinator.async_refresh()
-            except Exception as err:
-                _LOGGER.warning("%s: manual Tempo refresh failed: %s", title, err)
+            # Concurrently: both updates land in the same snapshot write window
+            results = await asyncio.gather(
+                runtime.forecast_coordinator.async_refresh(),
+                runtime.tempo_coordinator.async_refresh(),
+                return_exceptions=True,
+            )
+            for name, result in zip(("forecast", "Tempo"), results):
+                if isinstance(result, Exception):
+                    _LOGGER.warning("%s: manual %s refresh failed: %s", title, name, result)
             try:
                 await runtime.price_coordinator._update_prices(force=True)
                 await runtime.price_coordinator.async_refresh()
             except Exception as err:
                 _LOGGER.warning("%s: manual price refresh failed: %s", title, err)
 
+    async def async_handle_get_prices(call: ServiceCall) -> ServiceResponse:
+        """Prices valid at a date, looked up in the in-memory tariff indexes."""
+        day = call.data["date"]
+        entries = {}
+        for ent in hass.config_entries.async_entries(DOMAIN):
+            if ent.state != ConfigEntryState.LOADED or ent.runtime_data is None:
+                continue
+            coordinator = ent.runtime_data.price_coordinator
+            contract = call.data.get("contract") or coordinator.contract
+            power = call.data.get("subscribed_power") or coordinator.subscribed_power
+            entries[ent.entry_id] = {
+                "title": ent.title,
+                "contract": contract,
+                "subscribed_power": power,
+                "prices": coordinator.get_prices_at(day, power=power, contract=contract),
+            }
+        return {"date": day.isoformat(), "entries": entries}
+
     hass.services.async_register(
         DOMAIN,
         "refresh",
         async_handle_refresh,
         schema=vol.Schema({}),
     )
+    hass.services.async_register(
+        DOMAIN,
+        "get_prices",
+        async_handle_get_prices,
+        schema=vol.Schema({
+            vol.Required("date"): cv.date,
+            vol.Optional("contract"): vol.In(list(TARIFF_GRIDS)),
+            vol.Optional("subscribed_power"): cv.string,
+        }),
+        supports_response=SupportsResponse.ONLY,
+    )
     reg[DATA_REFRESH_SERVICE_REGISTERED] = True
 
 
 def _remove_refresh_service_if_last(hass: HomeAssistant, unloaded_entry_id: str) -> None:
-    """Unregister the service when no loaded config entries remain."""
+    """Unregister the services and drop the fetch hub when no loaded config entries remain."""
     others = [
         e
         for e in hass.config_entries.async_entries(DOMAIN)
@@ -77,7 +114,9 @@ def _remove_refresh_service_if_last(hass: HomeAssistant, unloaded_entry_id: str)
     if others:
         return
     hass.services.async_remove(DOMAIN, "refresh")
+    hass.services.async_remove(DOMAIN, "get_prices")
     hass.data.get(DOMAIN, {}).pop(DATA_REFRESH_SERVICE_REGISTERED, None)
+    async_release_hub(hass)
 
 
 @dataclass
@@ -87,6 +126,8 @@ class TempoRuntimeData:
     tempo_coordinator: TempoDataCoordinator
     forecast_coordinator: ForecastCoordinator
     price_coordinator: PriceCoordinator
+    store: TempoStore
+    snapshots: TempoSnapshotPublisher
 
 
 type TempoConfigEntry = ConfigEntry[TempoRuntimeData]
@@ -100,27 +141,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: TempoConfigEntry) -> boo
     # Cleanup old ghost devices
     await _async_cleanup_devices(hass, entry)
 
+    # Warm restore: last valid data from disk, network only for what is missing or stale.
+    store = TempoStore(hass, entry.entry_id)
+    await store.async_load()
+
     tempo_coordinator = TempoDataCoordinator(hass, entry)
     forecast_coordinator = ForecastCoordinator(hass, entry)
 
     # Forecast first so Open-DPE data exists if RTE is down (maintenance, etc.).
-    try:
-        await forecast_coordinator.async_config_entry_first_refresh()
-    except ConfigEntryNotReady:
-        _LOGGER.warning(
-            "Open-DPE forecast not ready at startup; continuing. "
-            "Forecast entities may be unavailable until the next refresh."
-        )
-
-    try:
-        await tempo_coordinator.async_config_entry_first_refresh()
-    except ConfigEntryNotReady:
-        _LOGGER.warning(
-            "RTE Tempo not ready at startup; continuing. "
-            "RTE-backed entities may be unavailable until the API recovers."
-        )
+    if forecast_coordinator.async_restore(store):
+        forecast_coordinator.async_set_updated_data(forecast_coordinator.tempo_data)
+    else:
+        try:
+            await forecast_coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            _LOGGER.warning(
+                "Open-DPE forecast not ready at startup; continuing. "
+                "Forecast entities may be unavailable until the next refresh."
+            )
+
+    if tempo_coordinator.async_restore(store):
+        tempo_coordinator.async_set_updated_data(tempo_coordinator.tempo_data)
+    else:
+        try:
+            await tempo_coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            _LOGGER.warning(
+                "RTE Tempo not ready at startup; continuing. "
+                "RTE-backed entities may be unavailable until the API recovers."
+            )
 
     price_coordinator = PriceCoordinator(hass, entry, tempo_coordinator)
+    price_coordinator.async_restore(store)
+    price_coordinator.async_start()
     try:
         await price_coordinator.async_config_entry_first_refresh()
     except ConfigEntryNotReady:
@@ -128,10 +181,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: TempoConfigEntry) -> boo
             "Price coordinator not ready at startup; continuing."
         )
 
+    # Subscribed before the platforms: the snapshot is rebuilt before entities read it.
+    snapshots = TempoSnapshotPublisher(entry, tempo_coordinator, forecast_coordinator)
+    entry.async_on_unload(snapshots.async_start())
+
+    # Long-term statistics of colors and prices (backfilled once, then appended)
+    if "recorder" in hass.config.components:
+        importer = TempoStatisticsImporter(hass, tempo_coordinator, price_coordinator)
+        entry.async_on_unload(importer.async_start())
+
     entry.runtime_data = TempoRuntimeData(
         tempo_coordinator=tempo_coordinator,
         forecast_coordinator=forecast_coordinator,
         price_coordinator=price_coordinator,
+        store=store,
+        snapshots=snapshots,
     )
 
     # Listen for option changes
@@ -193,10 +257,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: TempoConfigEntry) -> bo
         await entry.runtime_data.tempo_coordinator.async_shutdown()
         await entry.runtime_data.forecast_coordinator.async_shutdown()
         await entry.runtime_data.price_coordinator.async_shutdown()
+        await entry.runtime_data.store.async_flush()
     if unload_ok:
         _remove_refresh_service_if_last(hass, entry_id)
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the persistent cache of a removed entry."""
+    await TempoStore(hass, entry.entry_id).async_remove()
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
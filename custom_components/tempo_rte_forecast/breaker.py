@@ -0,0 +1,125 @@
+"""Per-upstream circuit breaker held by the fetch hub.
+
+After ``BREAKER_FAILURE_THRESHOLD`` consecutive failures (timeout, connection
+error, HTTP 5xx/429, unreadable body) a source is skipped for a cool-down
+period. Once it elapses a single request is let through (half-open probe): a
+success closes the breaker, a failure re-opens it with a doubled cool-down,
+capped at ``BREAKER_MAX_COOLDOWN``.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import BREAKER_COOLDOWN, BREAKER_FAILURE_THRESHOLD, BREAKER_MAX_COOLDOWN
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# A probe that never reported back (cancelled) no longer blocks the next one after this delay
+PROBE_TIMEOUT = 60
+
+
+class CircuitOpenError(Exception):
+    """The source is skipped: its breaker is open."""
+
+    def __init__(self, source: str, retry_in: float) -> None:
+        super().__init__(f"circuit open for {source}, next probe in {retry_in:.0f}s")
+        self.source = source
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Closed / open / half-open state of one upstream source."""
+
+    __slots__ = (
+        "source",
+        "state",
+        "failures",
+        "trips",
+        "cooldown",
+        "_open_until",
+        "_probe_started",
+        "opened_at",
+        "last_change",
+    )
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.cooldown = float(BREAKER_COOLDOWN)
+        self._open_until = 0.0
+        self._probe_started: float | None = None
+        self.opened_at: datetime | None = None
+        self.last_change: datetime | None = None
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 when closed)."""
+        if self.state == STATE_CLOSED:
+            return 0.0
+        return max(0.0, self._open_until - time.monotonic())
+
+    def allow(self) -> bool:
+        """Whether a request may go out now; moves to half-open when the cool-down is over."""
+        if self.state == STATE_CLOSED:
+            return True
+        now = time.monotonic()
+        if self.state == STATE_OPEN:
+            if now < self._open_until:
+                return False
+            self._set_state(STATE_HALF_OPEN)
+        elif self._probe_started is not None and now - self._probe_started < PROBE_TIMEOUT:
+            return False  # a probe is already in flight
+        self._probe_started = now
+        return True
+
+    def record_success(self) -> None:
+        """The source answered (even with a client error): close the breaker."""
+        self.failures = 0
+        self._probe_started = None
+        if self.state != STATE_CLOSED:
+            self.cooldown = float(BREAKER_COOLDOWN)
+            self.opened_at = None
+            self._set_state(STATE_CLOSED)
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_started = None
+        if self.state == STATE_HALF_OPEN:
+            self.cooldown = min(self.cooldown * 2, BREAKER_MAX_COOLDOWN)
+            self._open()
+        elif self.state == STATE_CLOSED and self.failures >= BREAKER_FAILURE_THRESHOLD:
+            self._open()
+
+    def _open(self) -> None:
+        self.trips += 1
+        self._open_until = time.monotonic() + self.cooldown
+        self.opened_at = dt_util.utcnow()
+        self._set_state(STATE_OPEN)
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        self.last_change = dt_util.utcnow()
+
+    def as_dict(self) -> dict[str, Any]:
+        retry_in = self.retry_in()
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+            "cooldown_s": int(self.cooldown),
+            "opened_at": self.opened_at.isoformat() if self.opened_at else None,
+            "next_probe": (
+                (dt_util.utcnow() + timedelta(seconds=retry_in)).isoformat()
+                if self.state == STATE_OPEN
+                else None
+            ),
+            "last_change": self.last_change.isoformat() if self.last_change else None,
+        }
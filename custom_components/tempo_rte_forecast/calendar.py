@@ -0,0 +1,148 @@
+"""Calendar of Tempo days: RTE-confirmed colors and Open-DPE forecasts."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Mapping
+from datetime import date, datetime, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import TempoConfigEntry
+from .colors import resolve_color
+from .entity import WriteOnChangeMixin, tempo_device_info
+from .forecast_coordinator import ForecastCoordinator
+from .sensor_types import ForecastSensor
+from .tempo_coordinator import TempoDataCoordinator
+from .utils import get_tempo_date
+
+
+def _confirmed_event(day: date, color_key: str, uid: str) -> CalendarEvent:
+    color = resolve_color(color_key)
+    return CalendarEvent(
+        start=day,
+        end=day + timedelta(days=1),
+        summary=f"{color.emoji} Tempo {color.name}",
+        description="Couleur confirmée par RTE",
+        uid=uid,
+    )
+
+
+def _forecast_event(day: date, forecast: ForecastSensor, uid: str) -> CalendarEvent:
+    color = resolve_color(forecast.color)
+    # Mixed forecasts carry one emoji per color and the matching probabilities
+    label = f"{color.emoji} Prévision Tempo {color.name}" if color else f"{forecast.color} Prévision Tempo"
+    if forecast.probability is not None:
+        label = f"{label} ({forecast.probability} %)"
+    return CalendarEvent(
+        start=day,
+        end=day + timedelta(days=1),
+        summary=label,
+        description="Prévision Open-DPE",
+        uid=uid,
+    )
+
+
+class TempoDayIndex:
+    """All-day events sorted by date ordinal; range queries are two binary searches."""
+
+    __slots__ = ("_ordinals", "_events")
+
+    def __init__(
+        self,
+        confirmed: Mapping[str, str],
+        forecasts: Mapping[str, ForecastSensor],
+        uid_prefix: str,
+    ) -> None:
+        by_day: dict[int, CalendarEvent] = {}
+        for day_str, forecast in forecasts.items():
+            day = date.fromisoformat(day_str)
+            by_day[day.toordinal()] = _forecast_event(day, forecast, f"{uid_prefix}_{day_str}")
+        # RTE colors take precedence over the forecast of the same day
+        for day_str, color_key in confirmed.items():
+            day = date.fromisoformat(day_str)
+            by_day[day.toordinal()] = _confirmed_event(day, color_key, f"{uid_prefix}_{day_str}")
+        self._ordinals = sorted(by_day)
+        self._events = [by_day[o] for o in self._ordinals]
+
+    def get(self, day: date) -> CalendarEvent | None:
+        i = bisect_left(self._ordinals, day.toordinal())
+        if i < len(self._ordinals) and self._ordinals[i] == day.toordinal():
+            return self._events[i]
+        return None
+
+    def between(self, start: date, end: date) -> list[CalendarEvent]:
+        """Events of the days in ``[start, end)``."""
+        lo = bisect_left(self._ordinals, start.toordinal())
+        hi = bisect_left(self._ordinals, end.toordinal(), lo)
+        return self._events[lo:hi]
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: TempoConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Setup the Tempo calendar from a config entry."""
+    runtime = entry.runtime_data
+    async_add_entities(
+        [TempoCalendar(runtime.tempo_coordinator, runtime.forecast_coordinator, entry)]
+    )
+
+
+class TempoCalendar(WriteOnChangeMixin, CalendarEntity):
+    """One all-day event per Tempo day, served from an in-memory index."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "tempo_calendar"
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        tempo: TempoDataCoordinator,
+        forecast: ForecastCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        self._tempo = tempo
+        self._forecast = forecast
+        self._attr_unique_id = f"{entry.entry_id}_calendar"
+        self._attr_device_info = tempo_device_info(entry.entry_id)
+        self._index: TempoDayIndex | None = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        for coordinator in (self._tempo, self._forecast):
+            self.async_on_remove(coordinator.async_add_listener(self._handle_coordinator_update))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Rebuilt on next read only
+        self._index = None
+        self.async_write_ha_state_if_changed()
+
+    @property
+    def _day_index(self) -> TempoDayIndex:
+        if self._index is None:
+            self._index = TempoDayIndex(
+                self._tempo.calendar.days,
+                self._forecast.tempo_data or {},
+                self._attr_unique_id,
+            )
+        return self._index
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Tempo day in progress (J)."""
+        today = date.fromisoformat(get_tempo_date(0, self._tempo.tempo_day_change_time_str))
+        return self._day_index.get(today)
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        end = end_date.date()
+        if end_date.time() != datetime.min.time():
+            end += timedelta(days=1)
+        return self._day_index.between(start_date.date(), end)
@@ -0,0 +1,100 @@
+"""Tempo color model.
+
+One immutable record per color, built once at import time from ``COLORS``.
+Every alias (French/English name, any case, numeric code) resolves to the same
+canonical object, so callers compare with ``is`` and read attributes instead of
+normalizing strings and looking dicts up on each access.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from .const import (
+    COLORS,
+    CONF_ICON_COLOR_BLUE,
+    CONF_ICON_COLOR_RED,
+    CONF_ICON_COLOR_UNKNOWN,
+    CONF_ICON_COLOR_WHITE,
+    DEFAULT_ICON_COLOR_BLUE,
+    DEFAULT_ICON_COLOR_RED,
+    DEFAULT_ICON_COLOR_UNKNOWN,
+    DEFAULT_ICON_COLOR_WHITE,
+)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TempoColor:
+    """A Tempo day color (identity-compared, one instance per color)."""
+
+    key: str
+    code: int
+    name: str
+    name_en: str
+    emoji: str
+
+    @property
+    def known(self) -> bool:
+        return self.code != 0
+
+    def __repr__(self) -> str:
+        return f"TempoColor({self.key})"
+
+
+BLUE, WHITE, RED, UNKNOWN = (
+    TempoColor(key, meta["code"], meta["name"], meta["name_en"], meta["emoji"])
+    for key, meta in ((k, COLORS[k]) for k in ("blue", "white", "red", "unknown"))
+)
+
+TEMPO_COLORS: tuple[TempoColor, ...] = (BLUE, WHITE, RED)
+BY_KEY: Mapping[str, TempoColor] = {c.key: c for c in (*TEMPO_COLORS, UNKNOWN)}
+BY_CODE: Mapping[int, TempoColor] = {c.code: c for c in (*TEMPO_COLORS, UNKNOWN)}
+
+_ALIASES: dict[str, TempoColor] = {}
+for _color in (*TEMPO_COLORS, UNKNOWN):
+    for _alias in (_color.key, _color.name, _color.name_en, str(_color.code)):
+        for _variant in (_alias, _alias.lower(), _alias.upper()):
+            _ALIASES[_variant] = _color
+del _color, _alias, _variant
+
+# Icon color option and default per color key
+_ICON_OPTIONS: dict[str, tuple[str, str]] = {
+    "blue": (CONF_ICON_COLOR_BLUE, DEFAULT_ICON_COLOR_BLUE),
+    "white": (CONF_ICON_COLOR_WHITE, DEFAULT_ICON_COLOR_WHITE),
+    "red": (CONF_ICON_COLOR_RED, DEFAULT_ICON_COLOR_RED),
+    "unknown": (CONF_ICON_COLOR_UNKNOWN, DEFAULT_ICON_COLOR_UNKNOWN),
+}
+
+
+def resolve_color(value: str | int | None) -> TempoColor | None:
+    """Canonical color of a raw API/option value, ``None`` when not a color."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, int):
+        return BY_CODE.get(value)
+    color = _ALIASES.get(value)
+    if color is None:
+        color = _ALIASES.get(value.strip().lower())
+    return color
+
+
+def color_of(value: str | int | None) -> TempoColor:
+    """Like ``resolve_color`` but falls back to ``UNKNOWN``."""
+    return resolve_color(value) or UNKNOWN
+
+
+class IconPalette:
+    """Icon colors of a config entry, resolved once from its options."""
+
+    __slots__ = ("_by_key",)
+
+    def __init__(self, options: Mapping[str, Any]) -> None:
+        self._by_key = {
+            key: options.get(conf, default) for key, (conf, default) in _ICON_OPTIONS.items()
+        }
+
+    def __getitem__(self, color: TempoColor | str) -> str:
+        key = color.key if isinstance(color, TempoColor) else color
+        return self._by_key.get(key, self._by_key["unknown"])
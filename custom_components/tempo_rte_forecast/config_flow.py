@@ -25,6 +25,8 @@ from .const import (
     TEMPO_DAY_CHANGE_TIME,
     CONF_TEMPO_RETRY_DELAY,
     CONF_FORECAST_RETRY_DELAY,
+    CONF_RETRY_MAX_BACKOFF,
+    DEFAULT_RETRY_MAX_BACKOFF_MINUTES,
     CONF_OPENDPE_SERVICE_TYPE,
     OPENDPE_SERVICE_LIGHT,
     OPENDPE_SERVICE_FULL,
@@ -32,6 +34,10 @@ from .const import (
     DEFAULT_RTE_TEMPO_COLOR_REFRESH_TIME,
     CONF_EDF_TEMPO_COLOR_REFRESH_TIME,
     DEFAULT_EDF_TEMPO_COLOR_REFRESH_TIME,
+    CONF_TEMPO_HEDGE_DELAY,
+    DEFAULT_TEMPO_HEDGE_DELAY,
+    CONF_TEMPO_FETCH_DEADLINE,
+    DEFAULT_TEMPO_FETCH_DEADLINE,
     CONF_CONTRACT,
     CONF_OFFPEAK_RANGES,
     DEFAULT_OFFPEAK_RANGES,
@@ -39,6 +45,8 @@ from .const import (
     DEFAULT_SUBSCRIBED_POWER,
     CONF_PRICE_UPDATE_INTERVAL,
     DEFAULT_PRICE_UPDATE_INTERVAL,
+    CONF_ENERGY_ENTITY,
+    CONF_LOAD_PROFILE,
     CONF_ICON_COLOR_BLUE,
     CONF_ICON_COLOR_WHITE,
     CONF_ICON_COLOR_RED,
@@ -49,9 +57,43 @@ from .const import (
     DEFAULT_ICON_COLOR_UNKNOWN,
 )
 
+# Options of each step; a field left empty falls back to its default (or disables the feature)
+STEP_OPTIONS = {
+    "prices": (
+        CONF_CONTRACT,
+        CONF_SUBSCRIBED_POWER,
+        CONF_OFFPEAK_RANGES,
+        CONF_PRICE_UPDATE_INTERVAL,
+        CONF_ENERGY_ENTITY,
+        CONF_LOAD_PROFILE,
+    ),
+    "api": (
+        CONF_TEMPO_DAY_CHANGE_TIME,
+        CONF_RTE_TEMPO_COLOR_REFRESH_TIME,
+        CONF_EDF_TEMPO_COLOR_REFRESH_TIME,
+        CONF_OPENDPE_SERVICE_TYPE,
+        CONF_TEMPO_HEDGE_DELAY,
+        CONF_TEMPO_FETCH_DEADLINE,
+    ),
+    "retries": (CONF_TEMPO_RETRY_DELAY, CONF_FORECAST_RETRY_DELAY, CONF_RETRY_MAX_BACKOFF),
+    "icons": (CONF_ICON_COLOR_BLUE, CONF_ICON_COLOR_WHITE, CONF_ICON_COLOR_RED, CONF_ICON_COLOR_UNKNOWN),
+}
+
+
 class OptionsFlowHandler(OptionsFlow):
     """Handle options flow."""
 
+    def _merge_step(self, step: str, user_input: dict[str, Any]) -> None:
+        """Store the submitted options of ``step``; cleared fields are removed, not kept stale.
+
+        Home Assistant omits an emptied optional field from ``user_input``.
+        """
+        self._data.update(user_input)
+        for key in STEP_OPTIONS[step]:
+            value = user_input.get(key)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                self._data.pop(key, None)
+
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Manage the options."""
         # Options are copied on first step (HA 2025+ OptionsFlow provides config_entry on the handler).
@@ -66,7 +108,7 @@ class OptionsFlowHandler(OptionsFlow):
     async def async_step_prices(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Manage price settings."""
         if user_input is not None:
-            self._data.update(user_input)
+            self._merge_step("prices", user_input)
             return await self.async_step_init()
 
         return self.async_show_form(
@@ -92,12 +134,18 @@ class OptionsFlowHandler(OptionsFlow):
                             min=1, max=30, step=1, mode=selector.NumberSelectorMode.BOX
                         )
                     ),
+                    vol.Optional(CONF_ENERGY_ENTITY): selector.EntitySelector(
+                        selector.EntitySelectorConfig(domain="sensor", device_class="energy")
+                    ),
+                    vol.Optional(CONF_LOAD_PROFILE): selector.TextSelector(),
                 }),
                 {
                     CONF_CONTRACT: self._data.get(CONF_CONTRACT, "Tempo"),
                     CONF_SUBSCRIBED_POWER: self._data.get(CONF_SUBSCRIBED_POWER, DEFAULT_SUBSCRIBED_POWER),
                     CONF_OFFPEAK_RANGES: self._data.get(CONF_OFFPEAK_RANGES, DEFAULT_OFFPEAK_RANGES),
                     CONF_PRICE_UPDATE_INTERVAL: int(self._data.get(CONF_PRICE_UPDATE_INTERVAL) or DEFAULT_PRICE_UPDATE_INTERVAL),
+                    CONF_ENERGY_ENTITY: self._data.get(CONF_ENERGY_ENTITY),
+                    CONF_LOAD_PROFILE: self._data.get(CONF_LOAD_PROFILE, ""),
                 }
             ),
         )
@@ -105,7 +153,7 @@ class OptionsFlowHandler(OptionsFlow):
     async def async_step_api(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Manage API settings."""
         if user_input is not None:
-            self._data.update(user_input)
+            self._merge_step("api", user_input)
             return await self.async_step_init()
 
         return self.async_show_form(
@@ -122,12 +170,20 @@ class OptionsFlowHandler(OptionsFlow):
                             mode=selector.SelectSelectorMode.DROPDOWN,
                         )
                     ),
+                    vol.Optional(CONF_TEMPO_HEDGE_DELAY): selector.NumberSelector(
+                        selector.NumberSelectorConfig(min=1, max=60, mode=selector.NumberSelectorMode.BOX)
+                    ),
+                    vol.Optional(CONF_TEMPO_FETCH_DEADLINE): selector.NumberSelector(
+                        selector.NumberSelectorConfig(min=5, max=300, mode=selector.NumberSelectorMode.BOX)
+                    ),
                 }),
                 {
                     CONF_TEMPO_DAY_CHANGE_TIME: self._data.get(CONF_TEMPO_DAY_CHANGE_TIME, TEMPO_DAY_CHANGE_TIME),
                     CONF_RTE_TEMPO_COLOR_REFRESH_TIME: self._data.get(CONF_RTE_TEMPO_COLOR_REFRESH_TIME) or self._data.get("api_refresh_time") or DEFAULT_RTE_TEMPO_COLOR_REFRESH_TIME,
                     CONF_EDF_TEMPO_COLOR_REFRESH_TIME: self._data.get(CONF_EDF_TEMPO_COLOR_REFRESH_TIME, DEFAULT_EDF_TEMPO_COLOR_REFRESH_TIME),
                     CONF_OPENDPE_SERVICE_TYPE: self._data.get(CONF_OPENDPE_SERVICE_TYPE, OPENDPE_SERVICE_LIGHT),
+                    CONF_TEMPO_HEDGE_DELAY: int(self._data.get(CONF_TEMPO_HEDGE_DELAY) or DEFAULT_TEMPO_HEDGE_DELAY),
+                    CONF_TEMPO_FETCH_DEADLINE: int(self._data.get(CONF_TEMPO_FETCH_DEADLINE) or DEFAULT_TEMPO_FETCH_DEADLINE),
                 }
             ),
         )
@@ -135,7 +191,7 @@ class OptionsFlowHandler(OptionsFlow):
     async def async_step_retries(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Manage retry settings."""
         if user_input is not None:
-            self._data.update(user_input)
+            self._merge_step("retries", user_input)
             return await self.async_step_init()
 
         return self.async_show_form(
@@ -148,10 +204,14 @@ class OptionsFlowHandler(OptionsFlow):
                     vol.Optional(CONF_FORECAST_RETRY_DELAY): selector.NumberSelector(
                         selector.NumberSelectorConfig(min=1, max=1440, mode=selector.NumberSelectorMode.BOX)
                     ),
+                    vol.Optional(CONF_RETRY_MAX_BACKOFF): selector.NumberSelector(
+                        selector.NumberSelectorConfig(min=1, max=1440, mode=selector.NumberSelectorMode.BOX)
+                    ),
                 }),
                 {
                     CONF_TEMPO_RETRY_DELAY: int(self._data.get(CONF_TEMPO_RETRY_DELAY) or TEMPO_RETRY_DELAY_MINUTES),
                     CONF_FORECAST_RETRY_DELAY: int(self._data.get(CONF_FORECAST_RETRY_DELAY) or FORECAST_RETRY_DELAY_MINUTES),
+                    CONF_RETRY_MAX_BACKOFF: int(self._data.get(CONF_RETRY_MAX_BACKOFF) or DEFAULT_RETRY_MAX_BACKOFF_MINUTES),
                 }
             ),
         )
@@ -159,7 +219,7 @@ class OptionsFlowHandler(OptionsFlow):
     async def async_step_icons(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Manage icon settings."""
         if user_input is not None:
-            self._data.update(user_input)
+            self._merge_step("icons", user_input)
             return await self.async_step_init()
 
         return self.async_show_form(
@@ -44,8 +44,36 @@ DEFAULT_ICON_COLOR_UNKNOWN = "yellow"
 TEMPO_DAY_CHANGE_TIME = "06:00:00"
 HC_HOUR = 22
 
+# Persistent cache (.storage/tempo_rte_forecast.<entry_id>)
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30  # seconds, debounce between coordinator updates and disk write
+
+# Shared fetch hub: successful upstream results are reused by other entries for this long
+HUB_RESULT_TTL = 60  # seconds
+
+# Tempo and forecast updates landing within this window produce a single entity write
+SNAPSHOT_COALESCE_DELAY = 1.0  # seconds
+
 TEMPO_RETRY_DELAY_MINUTES = 30
 FORECAST_RETRY_DELAY_MINUTES = 5
+# Retries back off exponentially from the delays above, up to this cap, with +/-20% jitter
+CONF_RETRY_MAX_BACKOFF = "retry_max_backoff_minutes"
+DEFAULT_RETRY_MAX_BACKOFF_MINUTES = 240
+RETRY_JITTER = 0.2
+
+# Adaptive J+1 polling: cheap probe every N seconds inside the learned RTE publication window
+PUBLICATION_POLL_INTERVAL = 300
+PUBLICATION_HISTORY_DAYS = 30  # publication times remembered
+PUBLICATION_MIN_OBSERVATIONS = 3  # before that, the window is [RTE refresh time, EDF refresh time]
+PUBLICATION_WINDOW_MARGIN = 15  # minutes added around the learned 10th-90th percentiles
+
+# Past seasons imported once into long-term statistics (one RTE Full request each)
+STATISTICS_BACKFILL_SEASONS = 5
+
+# Per-upstream circuit breaker: opened after N consecutive failures, then one probe per cool-down
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN = 300  # seconds, doubled after each failed probe
+BREAKER_MAX_COOLDOWN = 3600
 
 # For forecast
 DEVICE_MANUFACTURER = "RTE"
@@ -63,6 +91,11 @@ CONF_RTE_TEMPO_COLOR_REFRESH_TIME = "rte_tempo_color_refresh_time"
 DEFAULT_RTE_TEMPO_COLOR_REFRESH_TIME = "07:05:00"
 CONF_EDF_TEMPO_COLOR_REFRESH_TIME = "edf_tempo_color_refresh_time"
 DEFAULT_EDF_TEMPO_COLOR_REFRESH_TIME = "11:05:00"
+# Hedged Tempo source chain (tempoLight -> api-couleur-tempo -> RTE Full)
+CONF_TEMPO_HEDGE_DELAY = "tempo_hedge_delay_seconds"
+DEFAULT_TEMPO_HEDGE_DELAY = 5
+CONF_TEMPO_FETCH_DEADLINE = "tempo_fetch_deadline_seconds"
+DEFAULT_TEMPO_FETCH_DEADLINE = 30
 
 # For tariffs
 # For prices
@@ -73,6 +106,11 @@ CONF_SUBSCRIBED_POWER = "subscribed_power"
 DEFAULT_SUBSCRIBED_POWER = "9"
 CONF_PRICE_UPDATE_INTERVAL = "price_update_interval"
 DEFAULT_PRICE_UPDATE_INTERVAL = 1
+# Optional kWh meter: enables the accumulated energy cost sensor
+CONF_ENERGY_ENTITY = "energy_entity"
+# Optional daily load profile (24 hourly kWh, or one daily kWh): enables the Tempo cost projection
+CONF_LOAD_PROFILE = "load_profile"
 PRICE_BASE_URL="https://www.data.gouv.fr/fr/datasets/r/c13d05e5-9e55-4d03-bf7e-042a2ade7e49"
 PRICE_HPHC_URL="https://www.data.gouv.fr/fr/datasets/r/f7303b3a-93c7-4242-813d-84919034c416"
-PRICE_TEMPO_URL="https://www.data.gouv.fr/fr/datasets/r/0c3d1d36-c412-4620-8566-e5cbb4fa2b5a"
\ No newline at end of file
+PRICE_TEMPO_URL="https://www.data.gouv.fr/fr/datasets/r/0c3d1d36-c412-4620-8566-e5cbb4fa2b5a"
+PRICE_CSV_MAX_BYTES = 8 * 1024 * 1024  # tariff history grows every year; refuse anything unreasonable
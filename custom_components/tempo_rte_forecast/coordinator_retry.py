@@ -5,15 +5,32 @@ Core schedules ``UpdateFailed(retry_after=...)`` only if ``update_interval`` is
 uses ``update_interval=None`` and ``async_track_time_change`` instead; the mixin
 below mirrors the core timer logic for the one-shot retry case.
 
+Consecutive failures back off exponentially from the ``retry_after`` given by the
+coordinator (``retry_after * 2**n``, capped at ``retry_max_backoff``) with +/-20%
+jitter, so entries do not all hammer an upstream in maintenance at the same second.
+
 Sensors override ``available`` based on cached values where applicable so a failed
 refresh (``last_update_success`` false) does not hide stale-but-valid data.
 """
 
 from __future__ import annotations
 
+import logging
+import random
+
 from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .const import DEFAULT_RETRY_MAX_BACKOFF_MINUTES, RETRY_JITTER
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def backoff_delay(base: float, attempt: int, cap: float, jitter: float = RETRY_JITTER) -> float:
+    """``base * 2**attempt`` capped at ``cap``, then spread by +/-``jitter``."""
+    delay = min(base * (2 ** min(attempt, 16)), max(cap, base))
+    return delay * random.uniform(1 - jitter, 1 + jitter)
+
 
 def _coordinator_wrap_handle_refresh(coordinator: DataUpdateCoordinator):
     """Bound callback for DataUpdateCoordinator.__wrap_handle_refresh_interval.
@@ -28,6 +45,10 @@ def _coordinator_wrap_handle_refresh(coordinator: DataUpdateCoordinator):
 class RetryWhenNoUpdateIntervalMixin:
     """Honor ``retry_after`` from ``UpdateFailed`` when ``update_interval`` is ``None``."""
 
+    # Seconds; coordinators set it from the ``retry_max_backoff_minutes`` option
+    retry_max_backoff: float = DEFAULT_RETRY_MAX_BACKOFF_MINUTES * 60
+    _retry_attempt = 0
+
     @callback
     def _schedule_refresh(self) -> None:
         if self._update_interval_seconds is not None:
@@ -35,6 +56,8 @@ class RetryWhenNoUpdateIntervalMixin:
             return
 
         if self._retry_after is None:
+            # Refresh succeeded (or no retry requested): back to the base delay
+            self._retry_attempt = 0
             return
 
         if self.config_entry and self.config_entry.pref_disable_polling:
@@ -43,8 +66,12 @@ class RetryWhenNoUpdateIntervalMixin:
         self._async_unsub_refresh()
         hass = self.hass
         loop = hass.loop
-        update_interval = self._retry_after
+        update_interval = backoff_delay(self._retry_after, self._retry_attempt, self.retry_max_backoff)
         self._retry_after = None
+        self._retry_attempt += 1
+        _LOGGER.debug(
+            "%s: nouvelle tentative n°%s dans %.0fs", self.name, self._retry_attempt, update_interval
+        )
         next_refresh = int(loop.time()) + self._microsecond + update_interval
         wrap = _coordinator_wrap_handle_refresh(self)
         self._unsub_refresh = loop.call_at(next_refresh, wrap).cancel
@@ -0,0 +1,166 @@
+"""Energy cost accumulated from a kWh meter, split by Tempo color and HP/HC period."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from homeassistant.components.sensor import (
+    RestoreSensor,
+    SensorDeviceClass,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
+    CURRENCY_EURO,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    UnitOfEnergy,
+)
+from homeassistant.core import Event, EventStateChangedData, callback
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.restore_state import ExtraStoredData
+from homeassistant.util.unit_conversion import EnergyConverter
+
+from .entity import WriteOnChangeMixin, tempo_device_info
+from .prices_coordinator import PriceCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CostAccumulatorData(ExtraStoredData):
+    """Totals restored across restarts, with the last meter reading (kWh)."""
+
+    total: float = 0.0
+    buckets: dict[str, dict[str, float]] = field(default_factory=dict)
+    last_reading: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"total": self.total, "buckets": self.buckets, "last_reading": self.last_reading}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CostAccumulatorData:
+        try:
+            return cls(
+                float(data.get("total") or 0.0),
+                {
+                    key: {"kwh": float(b["kwh"]), "cost": float(b["cost"])}
+                    for key, b in (data.get("buckets") or {}).items()
+                },
+                None if data.get("last_reading") is None else float(data["last_reading"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return cls()
+
+
+def bucket_key(data: dict[str, Any]) -> str:
+    """``blue_hp``, ``white_hc``... for Tempo, ``hp`` / ``hc`` otherwise."""
+    period = str(data.get("current_period") or "HP").lower()
+    color = data.get("tempo_color")
+    return f"{color}_{period}" if color else period
+
+
+class EnergyCostSensor(WriteOnChangeMixin, RestoreSensor):
+    """Cost of the configured energy meter, accumulated at the price of each delta.
+
+    Each meter update adds ``delta kWh x current price`` to the total and to the
+    bucket of the color/period resolved by the price coordinator at that moment:
+    one state write per meter update, no template re-evaluation.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "energy_cost"
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_native_unit_of_measurement = CURRENCY_EURO
+    _attr_suggested_display_precision = 2
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"energy_entity"})
+
+    def __init__(self, coordinator: PriceCoordinator, entry: ConfigEntry, energy_entity: str) -> None:
+        self._coordinator = coordinator
+        self._energy_entity = energy_entity
+        self._data = CostAccumulatorData()
+        self._attr_unique_id = f"{entry.entry_id}_energy_cost"
+        self._attr_device_info = tempo_device_info(entry.entry_id)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if (extra := await self.async_get_last_extra_data()) is not None:
+            self._data = CostAccumulatorData.from_dict(extra.as_dict())
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, [self._energy_entity], self._handle_meter_update
+            )
+        )
+        if self._data.last_reading is None and (state := self.hass.states.get(self._energy_entity)):
+            # First run: start counting from the current meter value
+            self._data.last_reading = _reading_kwh(state.state, state.attributes)
+
+    @callback
+    def _handle_meter_update(self, event: Event[EventStateChangedData]) -> None:
+        new_state = event.data["new_state"]
+        if new_state is None:
+            return
+        reading = _reading_kwh(new_state.state, new_state.attributes)
+        if reading is None:
+            return  # unavailable: keep the last valid reading, the delta is counted on recovery
+        previous = self._data.last_reading
+        if previous is None:
+            self._data.last_reading = reading
+            return
+        prices = self._coordinator.data
+        price = prices.get("price") if prices else None
+        if price is None:
+            # No real price (startup, Tempo color unknown, grid outage): keep the previous
+            # reading, the consumption in between is priced on the first update with a price
+            return
+        self._data.last_reading = reading
+        delta = reading - previous
+        if delta < 0:
+            # Meter reset (total_increasing semantics): count from zero
+            delta = reading
+        if not delta:
+            return
+        cost = delta * price
+        bucket = self._data.buckets.setdefault(bucket_key(prices), {"kwh": 0.0, "cost": 0.0})
+        bucket["kwh"] += delta
+        bucket["cost"] += cost
+        self._data.total += cost
+        self.async_write_ha_state_if_changed()
+
+    @property
+    def native_value(self) -> float:
+        return round(self._data.total, 4)
+
+    @property
+    def extra_restore_state_data(self) -> CostAccumulatorData:
+        return self._data
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        attributes: dict[str, Any] = {"energy_entity": self._energy_entity}
+        for key, bucket in sorted(self._data.buckets.items()):
+            attributes[f"{key}_kwh"] = round(bucket["kwh"], 3)
+            attributes[f"{key}_cost"] = round(bucket["cost"], 4)
+        return attributes
+
+
+def _reading_kwh(state: str, attributes: dict[str, Any]) -> float | None:
+    if state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return None
+    try:
+        value = float(state)
+    except ValueError:
+        return None
+    unit = attributes.get(ATTR_UNIT_OF_MEASUREMENT) or UnitOfEnergy.KILO_WATT_HOUR
+    if unit == UnitOfEnergy.KILO_WATT_HOUR:
+        return value
+    try:
+        return EnergyConverter.convert(value, unit, UnitOfEnergy.KILO_WATT_HOUR)
+    except Exception:
+        _LOGGER.warning("Unité d'énergie non supportée pour le coût: %s", unit)
+        return None
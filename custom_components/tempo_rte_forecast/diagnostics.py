@@ -0,0 +1,84 @@
+"""Diagnostics download: per-source fetch metrics, cache sizes, memory footprint."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import fields, is_dataclass
+import sys
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import TempoConfigEntry
+
+
+def _deep_size(obj: Any, seen: set[int] | None = None) -> int:
+    """Approximate retained size of ``obj`` in bytes (containers, slots and dataclasses followed)."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, Mapping):
+        return size + sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(_deep_size(v, seen) for v in obj)
+    if is_dataclass(obj):
+        return size + sum(_deep_size(getattr(obj, f.name), seen) for f in fields(obj))
+    for slot in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, slot):
+            size += _deep_size(getattr(obj, slot), seen)
+    return size
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: TempoConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime = entry.runtime_data
+    tempo = runtime.tempo_coordinator
+    forecast = runtime.forecast_coordinator
+    prices = runtime.price_coordinator
+    hub = tempo.hub
+
+    caches = {
+        "tempo": {"current": tempo.tempo_data, "history": tempo._cached_data},
+        "forecast": {"current": forecast.tempo_data, "history": forecast._cached_data},
+        "tariff_indexes": prices._tariff_indexes,
+        "store": runtime.store.data,
+        "snapshot": runtime.snapshots.snapshot,
+        "hub_memo": hub._results,
+        "hub_conditional": hub._conditional,
+    }
+
+    return {
+        "options": dict(entry.options),
+        "coordinators": {
+            name: {
+                "last_update_success": coordinator.last_update_success,
+                "last_exception": repr(coordinator.last_exception) if coordinator.last_exception else None,
+            }
+            for name, coordinator in (("tempo", tempo), ("forecast", forecast), ("prices", prices))
+        },
+        "publication": tempo._publication.as_dict(tempo.publication_window()),
+        "sources": hub.metrics.as_dict(),
+        "breakers": {name: b.as_dict() for name, b in sorted(hub.breakers.items())},
+        "cache_sizes": {
+            "tempo_days": len(tempo.tempo_data),
+            "tempo_history_days": len(tempo._cached_data),
+            "forecast_days": len(forecast.tempo_data or {}),
+            "forecast_history_days": len(forecast._cached_data),
+            "tariff_indexes": {
+                contract: {"powers": index.powers, "periods": index.period_count}
+                for contract, index in prices._tariff_indexes.items()
+            },
+            "store_sections": sorted(runtime.store.data),
+            "hub_inflight": len(hub._inflight),
+            "hub_memo_entries": len(hub._results),
+            "hub_conditional_entries": len(hub._conditional),
+        },
+        "memory_bytes": {name: _deep_size(value) for name, value in caches.items()},
+    }
@@ -0,0 +1,51 @@
+"""Shared entity helpers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DEVICE_MANUFACTURER, DEVICE_MODEL, DEVICE_NAME, DOMAIN
+
+
+def tempo_device_info(entry_id: str) -> DeviceInfo:
+    """Device grouping every entity of a config entry (built once per entity)."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry_id)},
+        name=DEVICE_NAME,
+        manufacturer=DEVICE_MANUFACTURER,
+        model=DEVICE_MODEL,
+    )
+
+
+def _frozen(attributes: Any) -> dict[str, Any] | None:
+    return dict(attributes) if attributes else None
+
+
+class WriteOnChangeMixin:
+    """Write the state only when availability, state or attributes actually changed.
+
+    Placed before ``CoordinatorEntity`` in the bases, it also replaces the
+    unconditional write on coordinator updates.
+    """
+
+    _write_fingerprint: tuple[Any, ...] | None = None
+
+    @callback
+    def async_write_ha_state_if_changed(self) -> None:
+        fingerprint = (
+            self.available,
+            self.state,
+            _frozen(self.state_attributes),
+            _frozen(self.extra_state_attributes),
+        )
+        if fingerprint == self._write_fingerprint:
+            return
+        self._write_fingerprint = fingerprint
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self.async_write_ha_state_if_changed()
@@ -1,23 +1,33 @@
 from __future__ import annotations
 
+import codecs
 import logging
-from datetime import date, datetime
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 import json
+import re
+from collections.abc import Iterator
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
 from babel.dates import format_date, get_date_format
 
 from .coordinator_retry import RetryWhenNoUpdateIntervalMixin
+from .hub import UpstreamHTTPError, async_get_hub
+from .metrics import opendpe_source
 from .sensor_types import ForecastSensor, ForecastDayLight, ForecastDay
+from .storage import TempoStore
 from .const import (
     OPEN_DPE_LIGHT_URL,
     OPEN_DPE_FULL_URL,
     FORECAST_RETRY_DELAY_MINUTES,
     CONF_FORECAST_RETRY_DELAY,
+    CONF_RETRY_MAX_BACKOFF,
+    DEFAULT_RETRY_MAX_BACKOFF_MINUTES,
     CONF_OPENDPE_SERVICE_TYPE,
     OPENDPE_SERVICE_LIGHT,
     OPENDPE_SERVICE_FULL,
@@ -26,6 +36,29 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Open-DPE publishes its runs before these times; the coordinator refreshes at each one.
+FORECAST_REFRESH_TIMES = (time(7, 0), time(15, 0))
+
+# Rows kept from the feed: up to J+10 (sensors expose J..J+9)
+FORECAST_WINDOW_DAYS = 10
+
+# Fields of a feed row read by _format_all_dates; consumption/stock columns are dropped
+_ROW_FIELDS = (
+    "date",
+    "couleur",
+    "tempo_color",
+    "probability",
+    "probability_bleu",
+    "probability_blanc",
+    "probability_rouge",
+)
+
+_DECODER = json.JSONDecoder()
+_WS = re.compile(r"[ \t\n\r]*")
+
+# (date, langue) déjà formatés : ~10 jours glissants par langue, quelques langues au plus
+FORMATTED_DATES_CACHE_SIZE = 256
+
 class ForecastCoordinator(RetryWhenNoUpdateIntervalMixin, DataUpdateCoordinator):
     """Coordinator in charge of fetching Open-DPE forecasts."""
 
@@ -36,41 +69,110 @@ class ForecastCoordinator(RetryWhenNoUpdateIntervalMixin, DataUpdateCoordinator)
             _LOGGER,
             name="Tempo Forecast Coordinator",
             update_interval=None,  # refresh none as provider do it at fixed hours
+            always_update=False,  # unchanged forecast (HTTP 304) does not rewrite entities
         )
 
         self.hass = hass
-        self.session = async_get_clientsession(hass)
+        self.hub = async_get_hub(hass)
         self.entry = entry
         self.retry_delay = entry.options.get(CONF_FORECAST_RETRY_DELAY, FORECAST_RETRY_DELAY_MINUTES)
+        self.retry_max_backoff = float(
+            entry.options.get(CONF_RETRY_MAX_BACKOFF, DEFAULT_RETRY_MAX_BACKOFF_MINUTES)
+        ) * 60
         self.service_type = entry.options.get(CONF_OPENDPE_SERVICE_TYPE, OPENDPE_SERVICE_LIGHT)
         self.tempo_data = {}
         self._cached_data = {}  # Cache pour garder les dernières données valides
         self._scheduled_listeners: list = []
+        self._store: TempoStore | None = None
+        self._last_fetch: datetime | None = None
 
         # Daily update after 7h00 and 15h00 with auto-retry and cache
-        self._scheduled_listeners.append(
-            async_track_time_change(
-                hass,
-                self._scheduled_refresh,
-                hour=7,
-                minute=0,
-                second=0,
-            )
-        )
-        self._scheduled_listeners.append(
-            async_track_time_change(
-                hass,
-                self._scheduled_refresh,
-                hour=15,
-                minute=0,
-                second=0,
+        for refresh_time in FORECAST_REFRESH_TIMES:
+            self._scheduled_listeners.append(
+                async_track_time_change(
+                    hass,
+                    self._scheduled_refresh,
+                    hour=refresh_time.hour,
+                    minute=refresh_time.minute,
+                    second=refresh_time.second,
+                )
             )
-        )
 
         _LOGGER.debug(
             "ForecastCoordinator initialisé : refresh programmé à 07:00 et 15:00"
         )
 
+    @callback
+    def async_restore(self, store: TempoStore) -> bool:
+        """Restore the forecast window from disk.
+
+        Returns True when the stored run is newer than the last scheduled refresh
+        (07:00 / 15:00), i.e. no download is needed at startup.
+        """
+        self._store = store
+        store.register("forecast", self._as_storage)
+        section = store.section("forecast")
+        lang = self.hass.config.language
+        if section.get("service_type") != self.service_type or section.get("lang") != lang:
+            return False
+
+        today = dt_util.now().date().isoformat()
+        restored: dict[str, ForecastSensor] = {}
+        for day, row in section.get("days", {}).items():
+            if day < today:
+                continue
+            try:
+                short_date, day_name, color, prob, *rest = row
+                restored[day] = ForecastSensor(
+                    date=date.fromisoformat(day),
+                    short_date=short_date,
+                    day=day_name,
+                    color=color,
+                    probability=prob,
+                    # Rows stored before Light stopped carrying made-up splits are dropped
+                    probabilities=(
+                        rest[0] if rest and self.service_type == OPENDPE_SERVICE_FULL else None
+                    ),
+                )
+            except (TypeError, ValueError):
+                continue
+        if not restored:
+            return False
+
+        self._cached_data.update(restored)
+        self.tempo_data = restored
+        fetched_at = dt_util.parse_datetime(section.get("fetched_at") or "")
+        self._last_fetch = fetched_at
+        _LOGGER.info("[Store] Open DPE: %s jours restaurés (run du %s)", len(restored), fetched_at)
+        return fetched_at is not None and fetched_at >= self._last_scheduled_run()
+
+    @staticmethod
+    def _last_scheduled_run() -> datetime:
+        """Most recent 07:00 / 15:00 slot (local time) not in the future."""
+        now = dt_util.now()
+        for days_back in (0, 1):
+            day = now.date() - timedelta(days=days_back)
+            for refresh_time in sorted(FORECAST_REFRESH_TIMES, reverse=True):
+                slot = datetime.combine(day, refresh_time, tzinfo=now.tzinfo)
+                if slot <= now:
+                    return slot
+        return now
+
+    @callback
+    def _as_storage(self) -> dict[str, Any]:
+        """Compact rows: {date: [short_date, day, color, probability, probabilities]}."""
+        today = dt_util.now().date().isoformat()
+        return {
+            "service_type": self.service_type,
+            "lang": self.hass.config.language,
+            "fetched_at": self._last_fetch.isoformat() if self._last_fetch else None,
+            "days": {
+                d: [f.short_date, f.day, f.color, f.probability, f.probabilities]
+                for d, f in sorted(self._cached_data.items())
+                if d >= today
+            },
+        }
+
     async def _scheduled_refresh(self, now: datetime) -> None:
         """Update at 07:00 every day."""
         _LOGGER.debug("Open DPE: lancement du refresh programmé à %s", now.strftime("%Hh%M"))
@@ -81,6 +183,9 @@ class ForecastCoordinator(RetryWhenNoUpdateIntervalMixin, DataUpdateCoordinator)
         try:
             forecasts = await async_fetch_opendpe_forecast(self)
             self.tempo_data = forecasts
+            self._last_fetch = dt_util.now()
+            if self._store is not None:
+                self._store.async_schedule_save()
             _LOGGER.debug("Open DPE: %s jours récupérés", len(forecasts))
             return forecasts
 
@@ -111,12 +216,9 @@ class ForecastCoordinator(RetryWhenNoUpdateIntervalMixin, DataUpdateCoordinator)
         return self._cached_data.get(date)
 
 
-#   Add formated day of week and short date to data
-def _format_all_dates(self: ForecastCoordinator, data: list[ForecastDayLight] | list[ForecastDay], lang: str) -> dict[str, ForecastSensor]:
-    # Cette fonction s'exécutera dans un thread séparé
-    forecasts = {}
-    
-    # Détermine le format de date court sans l'année selon la locale
+@lru_cache(maxsize=8)
+def _short_date_pattern(lang: str) -> str:
+    """Format de date court sans l'année pour la locale (calculé une fois par langue)."""
     date_fmt = "dd/MM"
     try:
         pattern = get_date_format("short", locale=lang).pattern
@@ -127,16 +229,50 @@ def _format_all_dates(self: ForecastCoordinator, data: list[ForecastDayLight] |
             date_fmt = date_fmt.replace(sep + sep, sep)
     except Exception:
         pass
+    return date_fmt
+
+
+@lru_cache(maxsize=FORMATTED_DATES_CACHE_SIZE)
+def _format_day(day: date, lang: str) -> tuple[str, str]:
+    """(date courte, jour abrégé) : les mêmes jours reviennent à chaque rafraîchissement."""
+    return (
+        format_date(day, _short_date_pattern(lang), locale=lang),
+        format_date(day, "EEE", locale=lang),
+    )
+
+
+def _color_probabilities(row: ForecastDayLight | ForecastDay) -> dict[str, float] | None:
+    """Numeric probability of each color (kept for the cost projection).
+
+    Only the Full service gives them (``probability_bleu/blanc/rouge``). The Light
+    service only has the probability of the predicted color: ``None``, nothing is
+    made up for the other colors.
+    """
+    per_color = {
+        "blue": row.get("probability_bleu") or 0.0,
+        "white": row.get("probability_blanc") or 0.0,
+        "red": row.get("probability_rouge") or 0.0,
+    }
+    if any(per_color.values()):
+        return per_color
+    return None
+
+
+#   Add formated day of week and short date to data
+def _format_all_dates(service_type: str, data: list[ForecastDayLight] | list[ForecastDay], lang: str) -> dict[str, ForecastSensor]:
+    # Cette fonction s'exécutera dans un thread séparé (résultat partagé entre les entrées)
+    forecasts = {}
 
     for f_date in data:
         try:
             # Determine color key based on service type
             color_key = "couleur"
-            if self.service_type == OPENDPE_SERVICE_FULL:
+            if service_type == OPENDPE_SERVICE_FULL:
                 color_key = "tempo_color"
 
             prob = f_date.get("probability", None)
             color = f_date.get(color_key, "").lower()
+            probabilities = _color_probabilities(f_date)
 
             if prob is not None and prob != 1:
                 p_blue = f_date.get("probability_bleu") or 0
@@ -158,59 +294,161 @@ def _format_all_dates(self: ForecastCoordinator, data: list[ForecastDayLight] |
                 prob = int(round(prob * 100))
 
             forecast_date = date.fromisoformat(f_date["date"])
+            short_date, day = _format_day(forecast_date, lang)
             sensor_item = ForecastSensor(
                 date        = forecast_date,
-                short_date  = format_date(forecast_date, date_fmt, locale=lang),
-                day         = format_date(forecast_date, "EEE", locale=lang),
+                short_date  = short_date,
+                day         = day,
                 color       = color,
-                probability = prob
+                probability = prob,
+                probabilities = probabilities,
                 )
             forecasts[f_date["date"]] = sensor_item
-            self._cached_data[f_date["date"]] = sensor_item
         except Exception as exc:
             _LOGGER.warning("Open DPE: ligne ignorée (%s) : %s", exc, f_date)
             continue
     return forecasts
 
+class _JsonArrayStream:
+    """Elements of a top-level JSON array, decoded as the bytes arrive.
+
+    Only the unparsed tail of the text is buffered: an element is decoded once
+    the separator that follows it has been received.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._opened = False
+        self._empty = True  # no element yet: "]" may close the array
+        self.done = False
+
+    def feed(self, chunk: bytes, final: bool = False) -> Iterator[Any]:
+        text = self._text + self._decoder.decode(chunk, final)
+        idx = _WS.match(text, 0).end()
+        if not self._opened:
+            if idx == len(text) and not final:
+                self._text = ""
+                return
+            if text[idx:idx + 1] != "[":
+                raise ValueError("JSON array expected")
+            self._opened = True
+            idx = _WS.match(text, idx + 1).end()
+        while not self.done and idx < len(text):
+            if self._empty and text[idx] == "]":
+                self.done = True
+                break
+            try:
+                item, end = _DECODER.raw_decode(text, idx)
+            except ValueError:
+                if final:
+                    raise
+                break  # element not fully received yet
+            end = _WS.match(text, end).end()
+            sep = text[end:end + 1]
+            if not sep and not final:
+                break  # a number may still be growing: wait for its separator
+            if sep not in (",", "]"):
+                raise ValueError(f"unexpected {sep!r} in JSON array")
+            self._empty = False
+            yield item
+            idx = _WS.match(text, end + 1).end()
+            self.done = sep == "]"
+        self._text = text[idx:]
+        if final and not self.done:
+            raise ValueError("truncated JSON array")
+
+
+class OpenDpeParser:
+    """``StreamParser`` of the Open-DPE feed, run in the executor.
+
+    Only the rows of the window and the fields exposed are kept while the JSON
+    downloads; the whole feed is never held as bytes or text.
+    """
+
+    def __init__(self, service_type: str, lang: str, window: tuple[str, str]) -> None:
+        self._service_type = service_type
+        self._lang = lang
+        self._first_day, self._last_day = window
+        self._stream = _JsonArrayStream()
+        self._rows: list[dict[str, Any]] = []
+        self._logged = False
+
+    def feed(self, chunk: bytes) -> bool:
+        if not self._logged and _LOGGER.isEnabledFor(logging.DEBUG):
+            # Lire le contenu brut pour diagnostic
+            _LOGGER.debug("[API] Réponse brute (500 premiers octets): %s", chunk[:500].decode("utf-8", "replace"))
+        self._logged = True
+        self._add_rows(self._stream.feed(chunk))
+        return self._stream.done
+
+    def close(self) -> dict[str, ForecastSensor]:
+        if not self._stream.done:
+            self._add_rows(self._stream.feed(b"", final=True))
+        return _format_all_dates(self._service_type, self._rows, self._lang)
+
+    def _add_rows(self, items: Iterator[Any]) -> None:
+        for row in items:
+            if not isinstance(row, dict):
+                continue
+            day = row.get("date")
+            # ISO dates: lexicographic comparison
+            if not isinstance(day, str) or not self._first_day <= day <= self._last_day:
+                continue
+            self._rows.append({k: row[k] for k in _ROW_FIELDS if k in row})
+
+
+def _forecast_window() -> tuple[str, str]:
+    """Dates kept from the feed: J-1 (Tempo day not yet changed) to J+FORECAST_WINDOW_DAYS."""
+    today = dt_util.now(dt_util.get_time_zone("Europe/Paris")).date()
+    return (
+        (today - timedelta(days=1)).isoformat(),
+        (today + timedelta(days=FORECAST_WINDOW_DAYS)).isoformat(),
+    )
+
 #   Main function (Open-DPE)
 async def async_fetch_opendpe_forecast(self: ForecastCoordinator) -> dict[str, ForecastSensor]:
     """Fetch Tempo forecasts from the Open DPE JSON."""
-    session = self.session
-    hass = self.hass
-    
+    lang = self.hass.config.language
+
     url = OPEN_DPE_LIGHT_URL
     if self.service_type == OPENDPE_SERVICE_FULL:
         url = OPEN_DPE_FULL_URL
 
     _LOGGER.debug("Open DPE: Service '%s' actif (URL: %s)", self.service_type, url)
+    window = _forecast_window()
 
     try:
-        async with session.get(url, timeout=10) as response:
-            if response.status != 200:
-                _LOGGER.error("Open-DPE: HTTP %s", response.status)
-                ra = float(self.retry_delay * 60)
-                if not self._cached_data:
-                    raise UpdateFailed(
-                        "Open DPE HTTP error and no cached data available",
-                        retry_after=ra,
-                    )
-                raise UpdateFailed(
-                    "Open DPE HTTP error; serving cached data",
-                    retry_after=ra,
-                )
-
-            # Lire le contenu brut pour diagnostic
-            response_text = await response.text()
-            _LOGGER.debug("[API] Réponse brute (500 premiers chars): %s", response_text[:500])
-            data: list[ForecastDayLight] | list[ForecastDay] = json.loads(response_text)
-
-            forecasts = await hass.async_add_executor_job(_format_all_dates, self, data, hass.config.language)
-            _LOGGER.debug("Open DPE: forecasts traité brute (500 premiers chars): %s", forecasts)
-
+        forecasts, modified = await self.hub.async_fetch_conditional(
+            url,
+            # Parsed in the executor while it downloads (skipped entirely on HTTP 304)
+            lambda: OpenDpeParser(self.service_type, lang, window),
+            # The parsed result depends on the window: validators reused within the same day only
+            key=("opendpe", url, lang, window),
+            timeout=10,
+            source=opendpe_source(self.service_type),
+        )
+        if not modified:
+            # Same object as the previous run: with always_update=False no listener fan-out.
+            _LOGGER.debug("Open DPE: JSON non modifié (304), données conservées")
             return forecasts
 
-    except UpdateFailed:
-        raise
+        _LOGGER.debug("Open DPE: forecasts traité brute (500 premiers chars): %s", forecasts)
+        self._cached_data.update(forecasts)
+        return forecasts
+
+    except UpstreamHTTPError as err:
+        _LOGGER.error("Open-DPE: HTTP %s", err.status)
+        ra = float(self.retry_delay * 60)
+        if not self._cached_data:
+            raise UpdateFailed(
+                "Open DPE HTTP error and no cached data available",
+                retry_after=ra,
+            ) from err
+        raise UpdateFailed(
+            "Open DPE HTTP error; serving cached data",
+            retry_after=ra,
+        ) from err
     except Exception as exc:
         _LOGGER.error("Open DPE: erreur lors de la récupération JSON : %s", exc)
         ra = float(self.retry_delay * 60)
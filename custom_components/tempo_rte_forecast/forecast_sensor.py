@@ -1,47 +1,42 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
-from dataclasses import asdict
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
-from .utils import get_tempo_date, normalize_color, get_icon_color
-from .const import (
-    DOMAIN,
-    DEVICE_MANUFACTURER,
-    DEVICE_MODEL,
-    COLORS,
-    DEVICE_NAME,
-    CONF_TEMPO_DAY_CHANGE_TIME,
-    TEMPO_DAY_CHANGE_TIME,
-)
 
+from .entity import tempo_device_info
 from .forecast_coordinator import ForecastCoordinator
+from .snapshot import DaySnapshot, SnapshotEntity, TempoSnapshotPublisher
 
-class OpenDPEForecastSensor(CoordinatorEntity, SensorEntity):
+class OpenDPEForecastSensor(SnapshotEntity, SensorEntity):
     """OpenDPE forecast sensor."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "tempo_forecast"
-
-    def __init__(self, coordinator: ForecastCoordinator, index: int, entry: ConfigEntry):
-        super().__init__(coordinator)
+    # Only date, color and probability are worth keeping in history
+    _unrecorded_attributes = frozenset(
+        {"short_date", "day", "source", "probabilities", "icon_color", "color_name", "color_emoji"}
+    )
+
+    def __init__(
+        self,
+        coordinator: ForecastCoordinator,
+        index: int,
+        entry: ConfigEntry,
+        *,
+        snapshots: TempoSnapshotPublisher,
+    ):
+        super().__init__(coordinator, snapshots)
 
         self.index = index + 1
-        self.tempo_day_change_time_str = entry.options.get(CONF_TEMPO_DAY_CHANGE_TIME, TEMPO_DAY_CHANGE_TIME)
         self._attr_unique_id = f"{entry.entry_id}_forecast_opendpe_j{self.index}"
+        self._attr_device_info = tempo_device_info(entry.entry_id)
 
     @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info shared by all forecast sensors."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.entry.entry_id)},
-            name=DEVICE_NAME,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL,
-        )
+    def _day(self) -> DaySnapshot:
+        # snapshot.forecast[0] is J+1
+        return self._snapshots.snapshot.forecast[self.index - 1]
 
     @property
     def translation_placeholders(self) -> dict[str, Any]:
@@ -51,38 +46,14 @@ class OpenDPEForecastSensor(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Sensor is available if data is in cache."""
-        day = get_tempo_date(self.index, self.tempo_day_change_time_str)
-        day_data = self.coordinator.get_data(day)
-        return day_data != None
+        return self._day.available
 
     @property
     def native_value(self) -> str | None:
         """Return current state."""
-        day = get_tempo_date(self.index, self.tempo_day_change_time_str)
-        day_data = self.coordinator.get_data(day)
-        if day_data is None:
-            return None
-            
-        return normalize_color(day_data.color)
+        return self._day.value
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Detailed entity attributes."""
-        day = get_tempo_date(self.index, self.tempo_day_change_time_str)
-        day_data = self.coordinator.get_data(day)
-        if day_data is None:
-            return {}
-            
-        attrs = asdict(day_data)
-        color_key = normalize_color(day_data.color)
-        attrs["icon_color"] = get_icon_color(self.coordinator.entry.options, color_key)
-
-        if color_key in COLORS:
-            attrs["color_name"] = COLORS[color_key]["name"]
-            attrs["color_emoji"] = COLORS[color_key]["emoji"]
-        else:
-            # Probability string case
-            attrs["color_name"] = day_data.color
-            attrs["color_emoji"] = day_data.color
-            
-        return attrs
+        return self._day.attributes
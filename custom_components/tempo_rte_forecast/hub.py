@@ -0,0 +1,459 @@
+"""Upstream fetch hub shared by every config entry.
+
+All entries hit the same public resources (tempoLight, api-couleur-tempo.fr,
+Open-DPE, data.gouv.fr). The hub lives in ``hass.data[DOMAIN]`` and:
+
+* single-flights concurrent requests for the same resource (one download,
+  every waiting coordinator gets the same parsed result);
+* memoizes successful results for ``HUB_RESULT_TTL`` seconds so entries
+  refreshed back to back (refresh service, reload) share the download;
+* remembers ETag / Last-Modified validators of the heavy, rarely changing
+  resources (Open-DPE JSON, tariff CSVs) and reuses the parsed result on 304;
+  on 200 their body is fed chunk by chunk to a ``StreamParser`` in the
+  executor while it downloads, never held whole in memory;
+* records per-source metrics (latency, bytes, status codes, parse time);
+* keeps a circuit breaker per source so a known-down upstream is skipped
+  until its cool-down is over (see ``breaker.py``).
+
+Shared results must be treated as read-only by the coordinators.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+import json
+import logging
+import time
+from typing import Any, Protocol, TypeVar
+
+import aiohttp
+from aiohttp import hdrs
+import async_timeout
+
+try:  # shipped with Home Assistant core
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    json_loads = json.loads
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
+
+from .breaker import CircuitBreaker, CircuitOpenError
+from .const import DOMAIN, HUB_RESULT_TTL
+from .metrics import FetchMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HUB = "hub"
+
+_T = TypeVar("_T")
+_T_co = TypeVar("_T_co", covariant=True)
+
+READ_CHUNK_SIZE = 64 * 1024
+
+# JSON bodies above this size are decoded in the executor (RTE season calendar)
+JSON_EXECUTOR_THRESHOLD = 32 * 1024
+
+
+class UpstreamHTTPError(Exception):
+    """Upstream answered with an unexpected HTTP status."""
+
+    def __init__(self, status: int) -> None:
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+class PayloadTooLargeError(Exception):
+    """Response body exceeds the configured maximum size."""
+
+    def __init__(self, size: int, max_bytes: int) -> None:
+        super().__init__(f"payload of {size} bytes exceeds {max_bytes} bytes")
+
+
+class StreamParser(Protocol[_T_co]):
+    """Incremental parser of a response body; both methods run in the executor."""
+
+    def feed(self, chunk: bytes) -> bool:
+        """Consume the next chunk; True once no more input is needed (download stopped)."""
+
+    def close(self) -> _T_co:
+        """End of input: the parsed result."""
+
+
+@dataclass(slots=True)
+class _ConditionalEntry:
+    """Validators of the last 200 response and the result parsed from it."""
+
+    etag: str | None
+    last_modified: str | None
+    result: Any
+
+
+class TempoFetchHub:
+    """Deduplicates upstream HTTP calls across config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.session = async_get_clientsession(hass)
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self._waiters: dict[Hashable, int] = {}
+        self._results: dict[Hashable, tuple[float, Any]] = {}
+        self._conditional: dict[Hashable, _ConditionalEntry] = {}
+        self.metrics = FetchMetrics()
+        self.breakers: dict[str, CircuitBreaker] = {}
+
+    def breaker(self, source: str) -> CircuitBreaker:
+        """Circuit breaker of ``source``, created closed on first use."""
+        breaker = self.breakers.get(source)
+        if breaker is None:
+            breaker = self.breakers[source] = CircuitBreaker(source)
+        return breaker
+
+    async def async_fetch(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[_T]],
+        *,
+        ttl: float = HUB_RESULT_TTL,
+    ) -> _T:
+        """Run ``factory`` once for all concurrent callers of ``key``.
+
+        ``None`` results and exceptions are never memoized; exceptions are raised
+        to every waiter. A waiter being cancelled only cancels the download when
+        it was the last one waiting for it.
+        """
+        loop = self.hass.loop
+        now = loop.time()
+        self._results = {k: v for k, v in self._results.items() if v[0] > now}
+        if (memo := self._results.get(key)) is not None:
+            _LOGGER.debug("[Hub] %s servi depuis le cache mémoire", key)
+            return memo[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = loop.create_task(self._async_run(key, factory, ttl))
+            self._inflight[key] = task
+        else:
+            _LOGGER.debug("[Hub] %s déjà en cours, partage du résultat", key)
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters.get(key, 0) <= 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            remaining = self._waiters.get(key, 1) - 1
+            if remaining > 0:
+                self._waiters[key] = remaining
+            else:
+                self._waiters.pop(key, None)
+
+    async def _async_run(
+        self, key: Hashable, factory: Callable[[], Awaitable[_T]], ttl: float
+    ) -> _T:
+        try:
+            result = await factory()
+            if result is not None and ttl > 0:
+                self._results[key] = (self.hass.loop.time() + ttl, result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def async_get_json(
+        self,
+        url: str,
+        log_prefix: str,
+        *,
+        params: Sequence[tuple[str, str]] | None = None,
+        source: str | None = None,
+    ) -> dict[str, Any] | list[Any] | None:
+        """GET JSON générique (RTE ou api-couleur-tempo.fr), partagé entre les entrées."""
+        key = ("json", url, tuple(params) if params else None)
+        return await self.async_fetch(
+            key, lambda: self._async_get_json(url, log_prefix, params=params, source=source)
+        )
+
+    async def _async_get_json(
+        self,
+        url: str,
+        log_prefix: str,
+        *,
+        params: Sequence[tuple[str, str]] | None = None,
+        source: str | None = None,
+    ) -> dict[str, Any] | list[Any] | None:
+        now = dt_util.now().astimezone(dt_util.get_time_zone("Europe/Paris"))
+        _LOGGER.debug(
+            "%s Appel à %s — URL: %s params=%s",
+            log_prefix,
+            now.strftime("%H:%M:%S"),
+            url,
+            params,
+        )
+
+        record = _Recorder(self, source)
+        if not record.allow():
+            _LOGGER.debug(
+                "%s Source ignorée : circuit ouvert (prochain essai dans %.0fs)",
+                log_prefix,
+                record.breaker.retry_in(),
+            )
+            return None
+        try:
+            async with async_timeout.timeout(15):
+                async with self.session.get(url, params=params) as response:
+                    _LOGGER.debug("%s Status HTTP: %s", log_prefix, response.status)
+
+                    body = await response.read()
+                    record.response(response.status, len(body))
+
+                    if response.status != 200:
+                        record.failure(
+                            f"HTTP {response.status}", upstream_down=_is_outage(response.status)
+                        )
+                        snippet = _snippet(body, 500)
+                        if response.status >= 500:
+                            _LOGGER.warning(
+                                "%s HTTP %s (service may be in maintenance) — %s",
+                                log_prefix,
+                                response.status,
+                                snippet,
+                            )
+                        else:
+                            _LOGGER.error(
+                                "%s Erreur HTTP %s — %s",
+                                log_prefix,
+                                response.status,
+                                snippet,
+                            )
+                        return None
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("%s Réponse (500 premiers chars): %s", log_prefix, _snippet(body, 500))
+
+            try:
+                with record.parsing():
+                    if len(body) > JSON_EXECUTOR_THRESHOLD:
+                        data = await self.hass.async_add_executor_job(json_loads, body)
+                    else:
+                        data = json_loads(body)
+                record.success()
+                return data
+            except ValueError as json_err:  # json/orjson JSONDecodeError, invalid UTF-8
+                record.failure(json_err)
+                _LOGGER.error("%s Erreur parsing JSON: %s", log_prefix, json_err)
+                _LOGGER.error("%s Contenu: %s", log_prefix, _snippet(body, 1000))
+                return None
+
+        except TimeoutError:
+            record.response(None)
+            record.failure("timeout")
+            _LOGGER.error("%s Timeout (15s)", log_prefix)
+            return None
+        except aiohttp.ClientError as err:
+            record.response(None)
+            record.failure(err)
+            _LOGGER.error("%s Erreur de connexion: %s", log_prefix, err)
+            return None
+        except Exception as err:
+            record.failure(err)
+            _LOGGER.error("%s Erreur inattendue: %s", log_prefix, err, exc_info=True)
+            return None
+
+    async def async_fetch_conditional(
+        self,
+        url: str,
+        parser: Callable[[], StreamParser[_T]],
+        *,
+        key: Hashable | None = None,
+        timeout: float = 20,
+        max_bytes: int | None = None,
+        source: str | None = None,
+    ) -> tuple[_T, bool]:
+        """GET with ``If-None-Match`` / ``If-Modified-Since`` validators remembered per ``key``.
+
+        Returns ``(result, modified)``. On HTTP 200 the body is fed to a new
+        ``parser()`` in the executor as it arrives, and the download stops as soon
+        as the parser needs no more input. On HTTP 304 the previously parsed result
+        is returned as is with ``modified=False``: no decode and no parse.
+        Raises ``UpstreamHTTPError`` on other non-200 statuses and
+        ``CircuitOpenError`` while the breaker of ``source`` is open.
+        """
+        cache_key = key if key is not None else url
+        return await self.async_fetch(
+            ("conditional", cache_key),
+            lambda: self._async_fetch_conditional(
+                url, parser, cache_key, timeout, max_bytes, _Recorder(self, source)
+            ),
+        )
+
+    async def _async_fetch_conditional(
+        self,
+        url: str,
+        new_parser: Callable[[], StreamParser[_T]],
+        cache_key: Hashable,
+        timeout: float,
+        max_bytes: int | None,
+        record: _Recorder,
+    ) -> tuple[_T, bool]:
+        cached = self._conditional.get(cache_key)
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers[hdrs.IF_NONE_MATCH] = cached.etag
+            if cached.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+
+        if not record.allow():
+            raise CircuitOpenError(record.breaker.source, record.breaker.retry_in())
+        try:
+            async with async_timeout.timeout(timeout):
+                async with self.session.get(url, headers=headers) as response:
+                    if response.status == 304 and cached is not None:
+                        record.response(304)
+                        record.success(not_modified=True)
+                        _LOGGER.debug("[Hub] %s non modifié (304)", url)
+                        return cached.result, False
+                    if response.status != 200:
+                        record.response(response.status)
+                        raise UpstreamHTTPError(response.status)
+                    parser = new_parser()
+                    size = await self._async_feed_parser(response, parser, max_bytes, record)
+                    record.response(response.status, size)
+                    etag = response.headers.get(hdrs.ETAG)
+                    last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+
+            with record.parsing():
+                result = await self.hass.async_add_executor_job(parser.close)
+        except BaseException as err:
+            if not record.responded and not isinstance(err, asyncio.CancelledError):
+                record.response(None)
+            if isinstance(err, Exception):
+                record.failure(
+                    "timeout" if isinstance(err, TimeoutError) else err,
+                    upstream_down=not isinstance(err, PayloadTooLargeError)
+                    and (not isinstance(err, UpstreamHTTPError) or _is_outage(err.status)),
+                )
+            raise
+        record.success()
+        if etag or last_modified:
+            self._conditional[cache_key] = _ConditionalEntry(etag, last_modified, result)
+        else:
+            self._conditional.pop(cache_key, None)
+        return result, True
+
+    async def _async_feed_parser(
+        self,
+        response: aiohttp.ClientResponse,
+        parser: StreamParser[Any],
+        max_bytes: int | None,
+        record: _Recorder,
+    ) -> int:
+        """Feed the body chunk by chunk, aborting as soon as it exceeds ``max_bytes``.
+
+        Returns the number of bytes read (less than the body when the parser stopped early).
+        """
+        if (
+            max_bytes is not None
+            and response.content_length is not None
+            and response.content_length > max_bytes
+        ):
+            raise PayloadTooLargeError(response.content_length, max_bytes)
+        size = 0
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            size += len(chunk)
+            if max_bytes is not None and size > max_bytes:
+                raise PayloadTooLargeError(size, max_bytes)
+            with record.parsing():
+                done = await self.hass.async_add_executor_job(parser.feed, chunk)
+            if done:
+                _LOGGER.debug("[Hub] %s: fin de lecture anticipée après %s octets", response.url, size)
+                break
+        return size
+
+
+class _Recorder:
+    """Records one fetch into the hub metrics and breaker (no-op without a source name)."""
+
+    __slots__ = ("_hub", "_metrics", "_parse_time", "_source", "_started", "breaker", "responded")
+
+    def __init__(self, hub: TempoFetchHub, source: str | None) -> None:
+        self._hub = hub
+        self._source = source
+        self._metrics = hub.metrics[source] if source else None
+        self.breaker = hub.breaker(source) if source else None
+        self._started = hub.hass.loop.time()
+        self._parse_time: float | None = None
+        self.responded = False
+
+    def allow(self) -> bool:
+        return self.breaker is None or self.breaker.allow()
+
+    def response(self, status: int | None, size: int = 0) -> None:
+        self.responded = True
+        if self._metrics is not None:
+            self._metrics.record_response(status, self._hub.hass.loop.time() - self._started, size)
+
+    @contextmanager
+    def parsing(self) -> Iterator[None]:
+        """Time one parse step; streamed bodies are parsed in several steps, summed."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._parse_time = (self._parse_time or 0.0) + time.perf_counter() - start
+
+    def _record_parse(self) -> None:
+        if self._parse_time is not None:
+            self._metrics.record_parse(self._parse_time)
+            self._parse_time = None
+
+    def success(self, *, not_modified: bool = False) -> None:
+        if self._metrics is not None:
+            self._record_parse()
+            self._metrics.record_success(not_modified=not_modified)
+            self.breaker.record_success()
+            self._hub.metrics.async_notify(self._source)
+
+    def failure(self, error: BaseException | str, *, upstream_down: bool = True) -> None:
+        """``upstream_down`` False for answers proving the source is up (4xx, oversized body)."""
+        if self._metrics is not None:
+            self._record_parse()
+            self._metrics.record_failure(error)
+            if upstream_down:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            self._hub.metrics.async_notify(self._source)
+
+
+def _is_outage(status: int) -> bool:
+    """HTTP statuses counted as the upstream being down by the breaker."""
+    return status >= 500 or status == 429
+
+
+def _snippet(body: bytes, size: int) -> str:
+    """Start of a body for logs, only decoded when actually logged."""
+    return body[:size].decode("utf-8", "replace")
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> TempoFetchHub:
+    """Return the hub shared by all entries, creating it on first use."""
+    reg = hass.data.setdefault(DOMAIN, {})
+    hub = reg.get(DATA_HUB)
+    if hub is None:
+        hub = reg[DATA_HUB] = TempoFetchHub(hass)
+    return hub
+
+
+@callback
+def async_release_hub(hass: HomeAssistant) -> None:
+    """Drop the hub once no entry uses it anymore."""
+    hass.data.get(DOMAIN, {}).pop(DATA_HUB, None)
@@ -0,0 +1,166 @@
+"""Per-source upstream fetch metrics, recorded by the fetch hub.
+
+One ``SourceMetrics`` per upstream (tempoLight, api-couleur-tempo.fr, RTE Full,
+Open-DPE light/full, each tariff CSV): latency histogram, bytes, HTTP status
+codes, parse time, success/failure counts and last success/failure. Exposed by
+the diagnostic sensors and ``diagnostics.py``.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.util import dt as dt_util
+
+SOURCE_TEMPO_LIGHT = "tempo_light"
+SOURCE_COULEUR_TEMPO = "couleur_tempo"
+SOURCE_RTE_FULL = "rte_full"
+SOURCE_OPENDPE = "opendpe_{service_type}"
+SOURCE_TARIFF = "tariff_{contract}"
+
+TEMPO_SOURCES = (SOURCE_TEMPO_LIGHT, SOURCE_COULEUR_TEMPO, SOURCE_RTE_FULL)
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open.
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def opendpe_source(service_type: str) -> str:
+    return SOURCE_OPENDPE.format(service_type=service_type)
+
+
+def tariff_source(contract: str) -> str:
+    return SOURCE_TARIFF.format(contract=contract.lower().replace(" ", "_"))
+
+
+class SourceMetrics:
+    """Counters of one upstream source."""
+
+    __slots__ = (
+        "source",
+        "successes",
+        "failures",
+        "not_modified",
+        "status_codes",
+        "latency_buckets",
+        "latency_total",
+        "last_latency",
+        "bytes_total",
+        "last_bytes",
+        "parse_total",
+        "last_parse",
+        "last_success",
+        "last_failure",
+        "last_error",
+    )
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.successes = 0
+        self.failures = 0
+        self.not_modified = 0
+        self.status_codes: Counter[int] = Counter()
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_total = 0.0
+        self.last_latency: float | None = None
+        self.bytes_total = 0
+        self.last_bytes: int | None = None
+        self.parse_total = 0.0
+        self.last_parse: float | None = None
+        self.last_success: datetime | None = None
+        self.last_failure: datetime | None = None
+        self.last_error: str | None = None
+
+    @property
+    def requests(self) -> int:
+        return self.successes + self.failures
+
+    def record_response(self, status: int | None, latency: float, size: int = 0) -> None:
+        """HTTP exchange finished (``status`` None when no response was received)."""
+        if status is not None:
+            self.status_codes[status] += 1
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.latency_total += latency
+        self.last_latency = latency
+        if size:
+            self.bytes_total += size
+            self.last_bytes = size
+
+    def record_parse(self, seconds: float) -> None:
+        self.parse_total += seconds
+        self.last_parse = seconds
+
+    def record_success(self, *, not_modified: bool = False) -> None:
+        self.successes += 1
+        if not_modified:
+            self.not_modified += 1
+        self.last_success = dt_util.utcnow()
+
+    def record_failure(self, error: BaseException | str) -> None:
+        self.failures += 1
+        self.last_failure = dt_util.utcnow()
+        self.last_error = error if isinstance(error, str) else f"{type(error).__name__}: {error}"
+
+    def as_dict(self) -> dict[str, Any]:
+        requests = self.requests
+        return {
+            "requests": requests,
+            "successes": self.successes,
+            "failures": self.failures,
+            "not_modified": self.not_modified,
+            "status_codes": {str(k): v for k, v in sorted(self.status_codes.items())},
+            "latency_last_ms": _ms(self.last_latency),
+            "latency_avg_ms": _ms(self.latency_total / requests) if requests else None,
+            "latency_histogram_ms": {
+                (f"le_{int(bound * 1000)}" if bound else "inf"): count
+                for bound, count in zip((*LATENCY_BUCKETS, None), self.latency_buckets)
+            },
+            "bytes_total": self.bytes_total,
+            "bytes_last": self.last_bytes,
+            "parse_last_ms": _ms(self.last_parse),
+            "parse_total_ms": _ms(self.parse_total),
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "last_failure": self.last_failure.isoformat() if self.last_failure else None,
+            "last_error": self.last_error,
+        }
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+class FetchMetrics:
+    """Metrics of every source, with per-source listeners."""
+
+    def __init__(self) -> None:
+        self._sources: dict[str, SourceMetrics] = {}
+        self._listeners: dict[str, list[CALLBACK_TYPE]] = {}
+
+    def __getitem__(self, source: str) -> SourceMetrics:
+        metrics = self._sources.get(source)
+        if metrics is None:
+            metrics = self._sources[source] = SourceMetrics(source)
+        return metrics
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        return {name: m.as_dict() for name, m in sorted(self._sources.items())}
+
+    @callback
+    def async_add_listener(self, source: str, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        listeners = self._listeners.setdefault(source, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove() -> None:
+            listeners.remove(update_callback)
+
+        return remove
+
+    @callback
+    def async_notify(self, source: str) -> None:
+        for update_callback in list(self._listeners.get(source, ())):
+            update_callback()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import callback
+
+from .breaker import CircuitBreaker
+from .entity import WriteOnChangeMixin, tempo_device_info
+from .metrics import FetchMetrics, SourceMetrics
+
+SOURCE_LABELS = {
+    "tempo_light": "RTE tempoLight",
+    "couleur_tempo": "api-couleur-tempo.fr",
+    "rte_full": "RTE Full",
+    "opendpe_light": "Open-DPE (light)",
+    "opendpe_full": "Open-DPE (full)",
+    "tariff_base": "data.gouv.fr Base",
+    "tariff_heures_creuses": "data.gouv.fr Heures Creuses",
+    "tariff_tempo": "data.gouv.fr Tempo",
+}
+
+
+class FetchMetricsSensor(WriteOnChangeMixin, SensorEntity):
+    """Diagnostic sensor: last fetch latency of one upstream source.
+
+    Counters and the circuit breaker state (why a source is being skipped) are attributes.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "fetch_latency"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_should_poll = False
+
+    def __init__(
+        self, metrics: FetchMetrics, breaker: CircuitBreaker, source: str, entry: ConfigEntry
+    ) -> None:
+        self._metrics = metrics
+        self._breaker = breaker
+        self._source = source
+        self._attr_unique_id = f"{entry.entry_id}_fetch_{source}"
+        self._attr_device_info = tempo_device_info(entry.entry_id)
+
+    @property
+    def _data(self) -> SourceMetrics:
+        return self._metrics[self._source]
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._metrics.async_add_listener(self._source, self._handle_metrics_update)
+        )
+
+    @callback
+    def _handle_metrics_update(self) -> None:
+        self.async_write_ha_state_if_changed()
+
+    @property
+    def translation_placeholders(self) -> dict[str, Any]:
+        return {"source": SOURCE_LABELS.get(self._source, self._source)}
+
+    @property
+    def native_value(self) -> float | None:
+        latency = self._data.last_latency
+        return None if latency is None else round(latency * 1000, 1)
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        return {**self._data.as_dict(), "breaker": self._breaker.as_dict()}
@@ -2,10 +2,9 @@ from __future__ import annotations
 
 import logging
 from datetime import date, datetime, timedelta
-import async_timeout
-import io
-import csv
 import copy
+import hashlib
+import json
 from typing import Any
 
 from homeassistant.core import HomeAssistant, callback
@@ -13,7 +12,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.event import async_track_time_change
 from homeassistant.util import dt as dt_util
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     CONF_CONTRACT,
@@ -23,11 +21,14 @@ from .const import (
     DEFAULT_SUBSCRIBED_POWER,
     CONF_PRICE_UPDATE_INTERVAL,
     DEFAULT_PRICE_UPDATE_INTERVAL,
-    PRICE_BASE_URL,
-    PRICE_HPHC_URL,
-    PRICE_TEMPO_URL,
+    PRICE_CSV_MAX_BYTES,
 )
-from .utils import parse_offpeak_ranges, is_offpeak
+from .colors import resolve_color
+from .utils import OffpeakTimeline, parse_offpeak_ranges, is_offpeak
+from .hub import async_get_hub
+from .metrics import tariff_source
+from .storage import TempoStore
+from .tariffs import TARIFF_GRIDS, TariffCsvParser, TariffIndex
 from .tempo_coordinator import TempoDataCoordinator
 from .utils import get_tempo_date
 
@@ -45,6 +46,12 @@ FALLBACK_PRICES = {
     },
 }
 
+def _content_version(data: dict[str, Any]) -> str:
+    """Short hash of the price data, ``last_update`` excluded."""
+    payload = json.dumps(data, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
 class PriceCoordinator(DataUpdateCoordinator):
     """Coordinator for managing electricity prices."""
 
@@ -55,17 +62,22 @@ class PriceCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name="Price Coordinator",
             update_interval=None,  # Updates are triggered by time changes
+            always_update=False,  # unchanged content (same version) does not notify entities
         )
         self.entry = entry
         self.tempo_coordinator = tempo_coordinator
-        self.session = async_get_clientsession(hass)
+        self.hub = async_get_hub(hass)
         self._offpeak_ranges = []
         self._contract = "Base"
         self._subscribed_power = DEFAULT_SUBSCRIBED_POWER
         self._price_update_interval = DEFAULT_PRICE_UPDATE_INTERVAL
         self._prices = copy.deepcopy(FALLBACK_PRICES)
-        self._last_price_update = None
+        self._last_price_update = None  # last change of the grid content (not of a 304 check)
         self._scheduled_update_listeners = []
+        self._store: TempoStore | None = None
+        self._tariff_indexes: dict[str, TariffIndex] = {}
+        self._grid_checked: dict[str, datetime | None] = {}
+        self._grid_updated: dict[str, datetime | None] = {}
         self._setup_from_options()
 
         # Calculate 5 minutes before Tempo day change
@@ -85,9 +97,104 @@ class PriceCoordinator(DataUpdateCoordinator):
                 second=update_time.second,
             )
         )
-        # Initial prices fetch
+
+    @callback
+    def async_start(self) -> None:
+        """Initial prices resolution, downloading the grid only if it is due.
+
+        Called after ``async_restore``: scheduled from the constructor, the task
+        would start eagerly and download the grid before the restored one is seen.
+        """
         self.hass.async_create_task(self._update_prices())
 
+    @callback
+    def async_restore(self, store: TempoStore) -> bool:
+        """Restore the tariff indexes downloaded previously by this entry.
+
+        Must be called before ``async_start``, so the update interval check of the
+        initial ``_update_prices`` sees the restored timestamp. The current
+        power/contract prices are resolved from the index immediately.
+        """
+        self._store = store
+        store.register("prices", self._as_storage)
+        grids = store.section("prices").get("grids", {})
+        for contract, grid in grids.items():
+            if contract not in TARIFF_GRIDS:
+                continue
+            try:
+                index = TariffIndex.from_storage(grid["periods"])
+            except (KeyError, TypeError, ValueError) as err:
+                _LOGGER.debug("[Store] %s grid not restored: %s", contract, err)
+                continue
+            self._tariff_indexes[contract] = index
+            self._grid_checked[contract] = dt_util.parse_datetime(grid.get("checked") or "")
+            self._grid_updated[contract] = dt_util.parse_datetime(
+                grid.get("updated") or grid.get("checked") or ""
+            )
+
+        if self._contract not in self._tariff_indexes or not self._apply_index():
+            return False
+        self._last_price_update = self._grid_updated.get(self._contract)
+        _LOGGER.info(
+            "[Store] Prices restored for %s (%s kVA), grid checked %s",
+            self._contract,
+            self._subscribed_power,
+            self._grid_checked.get(self._contract),
+        )
+        return True
+
+    @callback
+    def _as_storage(self) -> dict[str, Any]:
+        return {
+            "grids": {
+                contract: {
+                    "checked": checked.isoformat() if (checked := self._grid_checked.get(contract)) else None,
+                    "updated": updated.isoformat() if (updated := self._grid_updated.get(contract)) else None,
+                    "periods": index.as_storage(),
+                }
+                for contract, index in self._tariff_indexes.items()
+            }
+        }
+
+    @property
+    def contract(self) -> str:
+        return self._contract
+
+    @property
+    def subscribed_power(self) -> str:
+        return self._subscribed_power
+
+    @property
+    def timeline(self) -> OffpeakTimeline:
+        """Compiled off-peak ranges plus the Tempo day change."""
+        return self._timeline
+
+    def get_prices_at(
+        self, day: date, *, power: str | None = None, contract: str | None = None
+    ) -> dict[str, Any] | None:
+        """In-memory lookup: prices of ``contract``/``power`` valid at ``day``.
+
+        Defaults to the configured contract and power. ``None`` if that grid was
+        never downloaded or has no matching interval.
+        """
+        index = self._tariff_indexes.get(contract or self._contract)
+        if index is None:
+            return None
+        return index.lookup(power or self._subscribed_power, day)
+
+    def _apply_index(self) -> bool:
+        """Resolve today's prices of the configured contract/power from its index."""
+        today = dt_util.now(dt_util.get_time_zone("Europe/Paris")).date()
+        prices = self.get_prices_at(today)
+        if not prices:
+            return False
+        if self._contract == "Tempo":
+            # Keep the "unknown" color bucket of the fallback grid
+            self._prices["Tempo"] = {**self._prices.get("Tempo", {}), **prices}
+        else:
+            self._prices[self._contract] = prices
+        return True
+
     @callback
     def _setup_from_options(self):
         """Set up the coordinator from config entry options."""
@@ -97,6 +204,10 @@ class PriceCoordinator(DataUpdateCoordinator):
         self._price_update_interval = options.get(CONF_PRICE_UPDATE_INTERVAL, DEFAULT_PRICE_UPDATE_INTERVAL)
         offpeak_ranges_str = options.get(CONF_OFFPEAK_RANGES, DEFAULT_OFFPEAK_RANGES)
         self._offpeak_ranges = parse_offpeak_ranges(offpeak_ranges_str)
+        # Day timeline: off-peak transitions plus the Tempo day change (color switch)
+        self._timeline = self._offpeak_ranges.with_boundaries(
+            self.tempo_coordinator.tempo_day_change_time
+        )
         _LOGGER.info(
             "Price coordinator setup: Contract='%s', Power='%s kVA', Off-peak ranges=%s, Update interval: %s day(s)",
             self._contract,
@@ -113,15 +224,8 @@ class PriceCoordinator(DataUpdateCoordinator):
             remove_listener()
         self._scheduled_update_listeners.clear()
 
-        trigger_times = set()
-        
-        # Add offpeak ranges transitions
-        for start, end in self._offpeak_ranges:
-            trigger_times.add(start)
-            trigger_times.add(end)
-            
-        # Add Tempo day change time
-        trigger_times.add(self.tempo_coordinator.tempo_day_change_time)
+        # Offpeak ranges transitions and Tempo day change time, from the compiled timeline
+        trigger_times = self._timeline.boundaries
 
         _LOGGER.debug("Scheduling prices updates at: %s", [t.strftime("%H:%M:%S") for t in trigger_times])
 
@@ -144,202 +248,73 @@ class PriceCoordinator(DataUpdateCoordinator):
     async def _update_prices(
         self, _now: datetime | None = None, *, force: bool = False
     ) -> None:
-        """Fetch and parse prices from data.gouv.fr."""
+        """Resolve today's prices from the tariff index, downloading the grid when due."""
+        checked = self._grid_checked.get(self._contract)
+        download = force or self._contract not in self._tariff_indexes or not checked
         # Check if update is needed based on interval
-        if not force and self._last_price_update:
+        if not download:
             # Ensure interval is at least 1
             interval = max(1, self._price_update_interval)
-            days_since_last_update = (dt_util.now() - self._last_price_update).days
-            if days_since_last_update < interval:
+            days_since_last_update = (dt_util.now() - checked).days
+            download = days_since_last_update >= interval
+            if not download:
                 _LOGGER.debug(
-                    "Price update skipped, only %s day(s) since last update (interval: %s days)",
+                    "Price download skipped, only %s day(s) since last update (interval: %s days)",
                     days_since_last_update,
                     interval,
                 )
-                return
-
-        _LOGGER.info("Attempting to update prices from data.gouv.fr for contract: %s", self._contract)
-        
-        new_prices = self._prices.copy()
-        has_updated = False
-        
-        try:
-            if self._contract == "Base":
-                try:
-                    base_prices = await self._fetch_and_parse_csv(PRICE_BASE_URL, self._parse_base_prices)
-                    if base_prices:
-                        new_prices["Base"] = base_prices
-                        has_updated = True
-                except Exception as e:
-                    _LOGGER.warning("Failed to update Base prices: %s", e)
-
-            elif self._contract == "Heures Creuses":
-                try:
-                    hphc_prices = await self._fetch_and_parse_csv(PRICE_HPHC_URL, self._parse_hphc_prices)
-                    if hphc_prices:
-                        new_prices["Heures Creuses"] = hphc_prices
-                        has_updated = True
-                except Exception as e:
-                    _LOGGER.warning("Failed to update HP/HC prices: %s", e)
-
-            elif self._contract == "Tempo":
-                try:
-                    tempo_prices = await self._fetch_and_parse_csv(PRICE_TEMPO_URL, self._parse_tempo_prices)
-                    if tempo_prices:
-                        if "Tempo" not in new_prices:
-                            new_prices["Tempo"] = {}
-                        new_prices["Tempo"].update(tempo_prices)
-                        has_updated = True
-                except Exception as e:
-                    _LOGGER.warning("Failed to update Tempo prices: %s", e)
-            
-            if not has_updated:
-                _LOGGER.warning("Failed to update prices for %s. Keeping previous prices.", self._contract)
-            else:
-                self._prices = new_prices
-                self._last_price_update = dt_util.now()
-                _LOGGER.info("Successfully updated prices from data.gouv.fr")
-                await self.async_refresh()
-
-        except Exception as e:
-            _LOGGER.error("Unexpected error during price update: %s. Keeping previous prices.", e, exc_info=True)
-
-    async def _fetch_and_parse_csv(self, url: str, parser_func: callable) -> dict:
-        """Generic function to fetch a CSV and parse it."""
-        async with async_timeout.timeout(20):
-            response = await self.session.get(url)
-            response.raise_for_status()
-            content_bytes = await response.read()
-        
-        # Tentative de décodage UTF-8 (avec gestion du BOM), sinon repli sur Latin-1
-        try:
-            content = content_bytes.decode('utf-8')
-            if content.startswith('\ufeff'):
-                content = content[1:]
-        except UnicodeDecodeError:
-            content = content_bytes.decode('latin-1')
-
-        csv_file = io.StringIO(content)
-        return parser_func(csv_file)
-
-    def _get_csv_reader(self, csv_file: io.StringIO) -> csv.DictReader:
-        """Create a DictReader with cleaned headers."""
-        # Détermination du délimiteur et nettoyage des entêtes
-        pos = csv_file.tell()
-        first_line = csv_file.readline()
-        csv_file.seek(pos)
-        
-        delimiter = ';' if ';' in first_line else ','
-        
-        # Lecture des entêtes pour les nettoyer (strip)
-        reader = csv.reader(csv_file, delimiter=delimiter)
-        try:
-            headers = next(reader)
-        except StopIteration:
-            return csv.DictReader(csv_file, delimiter=delimiter)
-            
-        cleaned_headers = [h.strip() for h in headers]
-        return csv.DictReader(csv_file, fieldnames=cleaned_headers, delimiter=delimiter)
-
-    def _parse_date(self, date_str: str) -> date | None:
-        if not date_str:
-            return None
-        for fmt in ("%Y-%m-%d", "%d/%m/%Y"):
-            try:
-                return datetime.strptime(date_str, fmt).date()
-            except ValueError:
-                pass
-        return None
-
-    def _is_row_active(self, row: dict, target_date: date) -> bool:
-        start_date = self._parse_date(row.get("DATE_DEBUT"))
-        end_date = self._parse_date(row.get("DATE_FIN"))
-        
-        if not start_date:
-            return False
-        
-        if start_date > target_date:
-            return False
-        
-        if end_date and end_date < target_date:
-            return False
-            
-        return True
-
-    def _parse_base_prices(self, csv_file: io.StringIO) -> dict:
-        """Parse Base price CSV."""
-        reader = self._get_csv_reader(csv_file)
-        target_date = dt_util.now(dt_util.get_time_zone("Europe/Paris")).date()
-
-        for row in reader:
-            if row.get("P_SOUSCRITE", "").strip() != self._subscribed_power:
-                continue
-            
-            if not self._is_row_active(row, target_date):
-                continue
-
-            try:
-                price = float(row["PART_VARIABLE_TTC"].replace(',', '.'))
-                _LOGGER.debug("Found Base price for %s kVA: %s", self._subscribed_power, price)
-                return {"HP": price}
-            except ValueError:
-                continue
-        _LOGGER.warning("Base price not found for %s kVA", self._subscribed_power)
-        return {}
-
-    def _parse_hphc_prices(self, csv_file: io.StringIO) -> dict:
-        """Parse HP/HC price CSV."""
-        reader = self._get_csv_reader(csv_file)
-        target_date = dt_util.now(dt_util.get_time_zone("Europe/Paris")).date()
-
-        for row in reader:
-            if row.get("P_SOUSCRITE", "").strip() != self._subscribed_power:
-                continue
-            
-            if not self._is_row_active(row, target_date):
-                continue
-
-            try:
-                hp_price = float(row["PART_VARIABLE_HP_TTC"].replace(',', '.'))
-                hc_price = float(row["PART_VARIABLE_HC_TTC"].replace(',', '.'))
-                prices = {"HP": hp_price, "HC": hc_price}
-                _LOGGER.debug("Found HP/HC prices for %s kVA: %s", self._subscribed_power, prices)
-                return prices
-            except ValueError:
-                continue
-        
-        _LOGGER.warning("HP/HC prices not fully found for %s kVA", self._subscribed_power)
-        return {}
-
-    def _parse_tempo_prices(self, csv_file: io.StringIO) -> dict:
-        """Parse Tempo price CSV."""
-        reader = self._get_csv_reader(csv_file)
-        target_date = dt_util.now(dt_util.get_time_zone("Europe/Paris")).date()
-
-        for row in reader:
-            if row.get("P_SOUSCRITE", "").strip() != self._subscribed_power:
-                continue
-            
-            if not self._is_row_active(row, target_date):
-                continue
 
+        if download:
+            _LOGGER.info("Attempting to update prices from data.gouv.fr for contract: %s", self._contract)
             try:
-                prices = {"blue": {}, "white": {}, "red": {}}
-                
-                prices["blue"]["HC"] = float(row["PART_VARIABLE_HCBleu_TTC"].replace(',', '.'))
-                prices["blue"]["HP"] = float(row["PART_VARIABLE_HPBleu_TTC"].replace(',', '.'))
-                prices["white"]["HC"] = float(row["PART_VARIABLE_HCBlanc_TTC"].replace(',', '.'))
-                prices["white"]["HP"] = float(row["PART_VARIABLE_HPBlanc_TTC"].replace(',', '.'))
-                prices["red"]["HC"] = float(row["PART_VARIABLE_HCRouge_TTC"].replace(',', '.'))
-                prices["red"]["HP"] = float(row["PART_VARIABLE_HPRouge_TTC"].replace(',', '.'))
-                
-                _LOGGER.debug("Found Tempo prices for %s kVA: %s", self._subscribed_power, prices)
-                return prices
-            except ValueError:
-                continue
-
-        _LOGGER.warning("Tempo prices not fully found for %s kVA", self._subscribed_power)
-        return {}
+                await self._async_refresh_index()
+            except Exception as e:
+                _LOGGER.warning("Failed to update %s prices: %s", self._contract, e)
+
+        previous = self._prices.get(self._contract)
+        if self._contract not in self._tariff_indexes or not self._apply_index():
+            _LOGGER.warning(
+                "Prices not found for %s (%s kVA). Keeping previous prices.",
+                self._contract,
+                self._subscribed_power,
+            )
+            return
+
+        if self._prices.get(self._contract) != previous:
+            _LOGGER.info("Prices updated for %s (%s kVA)", self._contract, self._subscribed_power)
+            await self.async_refresh()
+
+    async def _async_refresh_index(self) -> None:
+        """Download (conditional) and index the grid of the configured contract."""
+        contract = self._contract
+        url, _row_parser = TARIFF_GRIDS[contract]
+        index, modified = await self.hub.async_fetch_conditional(
+            url,
+            lambda: TariffCsvParser(contract),
+            key=("tariff", url),
+            timeout=20,
+            max_bytes=PRICE_CSV_MAX_BYTES,
+            source=tariff_source(contract),
+        )
+        if not index:
+            raise ValueError(f"empty {contract} price grid")
+        if not modified:
+            _LOGGER.info("Price grid for %s not modified since last download", contract)
+        previous = self._tariff_indexes.get(contract)
+        now = dt_util.now()
+        # prices_last_update only moves when the grid content does: a daily 304 re-check
+        # leaves the price data (and its version) unchanged
+        if (
+            previous is None
+            or self._grid_updated.get(contract) is None
+            or (index is not previous and index.as_storage() != previous.as_storage())
+        ):
+            self._grid_updated[contract] = now
+        self._tariff_indexes[contract] = index
+        self._grid_checked[contract] = now
+        self._last_price_update = self._grid_updated[contract]
+        if self._store is not None:
+            self._store.async_schedule_save()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Calculate the current prices data."""
@@ -350,51 +325,38 @@ class PriceCoordinator(DataUpdateCoordinator):
             is_hc = False
             current_period = "HP"
         else:
-            is_hc = is_offpeak(now, self._offpeak_ranges)
+            is_hc = is_offpeak(now, self._timeline)
             current_period = "HC" if is_hc else "HP"
 
-        price = 0.0
+        # None when no real price resolves (unknown Tempo color, period missing from the
+        # grid): never a made-up 0.0 that consumers would charge
+        price: float | None = None
         tempo_color = "unknown"
 
         if self._contract == "Base":
-            price = self._prices.get("Base", {}).get("HP", 0.0)
+            price = self._prices.get("Base", {}).get("HP")
         elif self._contract == "Heures Creuses":
-            price = self._prices.get("Heures Creuses", {}).get(current_period, 0.0)
+            price = self._prices.get("Heures Creuses", {}).get(current_period)
         elif self._contract == "Tempo":
             tempo_day_change_time_str = self.tempo_coordinator.tempo_day_change_time_str
             today_date_str = get_tempo_date(0, tempo_day_change_time_str)
             tempo_color = self.tempo_coordinator.get_data(today_date_str) or "unknown"
             tempo_color = tempo_color.lower()
 
-            price = self._prices.get("Tempo", {}).get(tempo_color, {}).get(current_period, 0.0)
+            color = resolve_color(tempo_color)
+            if color is not None and color.known:
+                price = self._prices.get("Tempo", {}).get(color.key, {}).get(current_period)
 
-        # Calculate next change time
-        next_change = None
-        trigger_times = set()
-        for start, end in self._offpeak_ranges:
-            trigger_times.add(start)
-            trigger_times.add(end)
-        trigger_times.add(self.tempo_coordinator.tempo_day_change_time)
-        
-        current_time = now.time()
-        sorted_triggers = sorted(list(trigger_times))
-        
-        for t in sorted_triggers:
-            if t > current_time:
-                next_change = t
-                break
-        
-        if next_change is None and sorted_triggers:
-            next_change = sorted_triggers[0]
+        # Calculate next change time (binary search in the compiled timeline)
+        next_change = self._timeline.next_transition(now.time())
 
-        return {
+        data = {
             "price": price,
             "is_hc": is_hc,
             "is_hp": not is_hc,
             "current_period": current_period,
             "contract": self._contract,
             "tempo_color": tempo_color if self._contract == "Tempo" else None,
-            "last_update": now.isoformat(),
             "prices_last_update": self._last_price_update.isoformat() if self._last_price_update else None,
             "contract_prices": self._prices.get(self._contract, {}),
             "subscribed_power": self._subscribed_power,
@@ -407,3 +369,11 @@ class PriceCoordinator(DataUpdateCoordinator):
             "is_red_hc": tempo_color == "red" and current_period == "HC",
             "next_period_change": next_change.strftime("%H:%M:%S") if next_change else None,
         }
+        version = _content_version(data)
+        previous = self.data
+        if previous is not None and previous.get("version") == version:
+            # Same content: keep the previous object (and its last_update), no fan-out
+            return previous
+        data["version"] = version
+        data["last_update"] = now.isoformat()
+        return data
@@ -2,41 +2,48 @@ from __future__ import annotations
 
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from datetime import datetime
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CURRENCY_EURO, ATTR_ATTRIBUTION
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.const import CURRENCY_EURO, ATTR_ATTRIBUTION, EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, DEVICE_NAME, DEVICE_MANUFACTURER, DEVICE_MODEL, COLORS
+from .entity import WriteOnChangeMixin, tempo_device_info
 from .prices_coordinator import PriceCoordinator
-from .utils import get_icon_color, normalize_color
+from .colors import IconPalette, color_of, resolve_color
 
 ATTRIBUTION = "Prix basés sur les options de l'intégration"
 
-class PriceSensor(CoordinatorEntity[PriceCoordinator], SensorEntity):
+class PriceSensor(WriteOnChangeMixin, CoordinatorEntity[PriceCoordinator], SensorEntity):
     """Sensor for the current electricity price."""
 
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = f"{CURRENCY_EURO}/kWh"
     _attr_has_entity_name = True
     _attr_translation_key = "price"
+    # Static or derivable from the recorded period/color: not stored on every write
+    _unrecorded_attributes = frozenset({
+        "contract",
+        "last_update",
+        "prices_last_update",
+        "icon_color",
+        "is_blue_hp",
+        "is_blue_hc",
+        "is_white_hp",
+        "is_white_hc",
+        "is_red_hp",
+        "is_red_hc",
+        "next_period_change",
+    })
 
     def __init__(self, coordinator: PriceCoordinator, entry: ConfigEntry):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entry = entry
+        self._attr_device_info = tempo_device_info(entry.entry_id)
         self._attr_unique_id = f"{entry.entry_id}_current_price"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.entry.entry_id)},
-            name=DEVICE_NAME,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL,
-        )
+        self._palette = IconPalette(entry.options)
 
     @property
     def native_value(self) -> float | None:
@@ -53,8 +60,7 @@ class PriceSensor(CoordinatorEntity[PriceCoordinator], SensorEntity):
 
         data = self.coordinator.data
         tempo_color = data.get("tempo_color")
-        color_key = normalize_color(tempo_color)
-        
+
         attributes = {
             ATTR_ATTRIBUTION: ATTRIBUTION,
             "contract": data.get("contract"),
@@ -63,7 +69,7 @@ class PriceSensor(CoordinatorEntity[PriceCoordinator], SensorEntity):
             "current_period": data.get("current_period"),
             "last_update": data.get("last_update"),
             "prices_last_update": data.get("prices_last_update"),
-            "icon_color": get_icon_color(self.entry.options, color_key),
+            "icon_color": self._palette[color_of(tempo_color)],
             "is_blue_hp": data.get("is_blue_hp"),
             "is_blue_hc": data.get("is_blue_hc"),
             "is_white_hp": data.get("is_white_hp"),
@@ -77,20 +83,25 @@ class PriceSensor(CoordinatorEntity[PriceCoordinator], SensorEntity):
 
         return attributes
 
-class SpecificPriceSensor(CoordinatorEntity[PriceCoordinator], SensorEntity):
+class SpecificPriceSensor(WriteOnChangeMixin, CoordinatorEntity[PriceCoordinator], SensorEntity):
     """Sensor for a specific price component (e.g. 'Tempo Red HP')."""
 
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = f"{CURRENCY_EURO}/kWh"
     _attr_has_entity_name = True
     _attr_translation_key = "specific_price"
+    _unrecorded_attributes = frozenset({"subscribed_power", "icon_color"})
 
     def __init__(self, coordinator: PriceCoordinator, entry: ConfigEntry, key: str, color: str | None = None):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entry = entry
+        self._attr_device_info = tempo_device_info(entry.entry_id)
         self._key = key  # "HP" or "HC"
         self._color = color.lower() if color else None  # "blue", "white", "red" or None
+        self._tempo_color = resolve_color(self._color)
+        # Fixed icon color for specific sensors
+        self._icon_color = IconPalette(entry.options)[color_of(self._color)]
 
         slug_parts = [key.lower()]
         if self._color:
@@ -101,22 +112,12 @@ class SpecificPriceSensor(CoordinatorEntity[PriceCoordinator], SensorEntity):
     @property
     def translation_placeholders(self) -> dict[str, Any]:
         """Return translation placeholders."""
-        color_fr = COLORS.get(self._color, {}).get("name", self._color) if self._color else ""
+        color_fr = (self._tempo_color.name if self._tempo_color else self._color) if self._color else ""
         return {
             "period": self._key,
             "color": color_fr
         }
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.entry.entry_id)},
-            name=DEVICE_NAME,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL,
-        )
-
     @property
     def native_value(self) -> float | None:
         """Return the specific price."""
@@ -142,19 +143,16 @@ class SpecificPriceSensor(CoordinatorEntity[PriceCoordinator], SensorEntity):
         attributes = {
             "active": False,
             "subscribed_power": data.get("subscribed_power"),
+            "icon_color": self._icon_color,
         }
-        
-        # Fixed icon color for specific sensors
-        color_key = normalize_color(self._color)
-        attributes["icon_color"] = get_icon_color(self.entry.options, color_key)
-        
+
         current_period = data.get("current_period")
         contract = data.get("contract")
 
         if self._color:
             # Tempo
-            current_color = normalize_color(data.get("tempo_color", ""))
-            if current_color == self._color and current_period == self._key:
+            current_color = resolve_color(data.get("tempo_color"))
+            if current_color is not None and current_color is self._tempo_color and current_period == self._key:
                 attributes["active"] = True
         else:
             # Base or HC
@@ -164,3 +162,37 @@ class SpecificPriceSensor(CoordinatorEntity[PriceCoordinator], SensorEntity):
                 attributes["active"] = True
                 
         return attributes
+
+
+class PriceGridSensor(WriteOnChangeMixin, CoordinatorEntity[PriceCoordinator], SensorEntity):
+    """Diagnostic sensor: the full price grid of the contract, dated by its last change.
+
+    Rarely read, so kept off the price sensors and out of the recorder.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "price_grid"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _unrecorded_attributes = frozenset({"contract", "subscribed_power", "contract_prices"})
+
+    def __init__(self, coordinator: PriceCoordinator, entry: ConfigEntry):
+        super().__init__(coordinator)
+        self._attr_device_info = tempo_device_info(entry.entry_id)
+        self._attr_unique_id = f"{entry.entry_id}_price_grid"
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Last change of the price grid."""
+        updated = (self.coordinator.data or {}).get("prices_last_update")
+        return datetime.fromisoformat(updated) if updated else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        data = self.coordinator.data or {}
+        return {
+            "contract": data.get("contract"),
+            "subscribed_power": data.get("subscribed_power"),
+            "contract_prices": data.get("contract_prices"),
+        }
@@ -0,0 +1,129 @@
+"""Expected Tempo cost of the coming days from color probabilities and the price grid.
+
+The daily load profile is split once into HP and HC kWh with the off-peak
+timeline; each price grid then gives one cost per color (``hp * HP + hc * HC``),
+computed once per grid for the whole window. A day is the dot product of its
+color probabilities with those costs, and its range the cheapest and dearest
+color still possible. An RTE-confirmed color counts as certain.
+
+Without per-color probabilities (Open-DPE Light only gives the predicted
+color), a day is the cost of the predicted color and has no range: nothing is
+made up for the other colors.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import date, time
+from typing import Any
+
+from .colors import TEMPO_COLORS, resolve_color
+from .sensor_types import ForecastSensor
+from .utils import OffpeakTimeline
+
+HOURS_PER_DAY = 24
+# Each hour is sampled in the middle of its four quarters (half-hour off-peak bounds)
+_QUARTER_MINUTES = (7, 22, 37, 52)
+
+
+def parse_load_profile(value: str | None) -> tuple[float, ...] | None:
+    """24 hourly kWh values separated by ``,`` or ``;``, or one daily kWh spread evenly."""
+    if not value:
+        return None
+    try:
+        values = [float(p) for p in value.replace(";", ",").split(",") if p.strip()]
+    except ValueError:
+        return None
+    if len(values) == 1:
+        return (values[0] / HOURS_PER_DAY,) * HOURS_PER_DAY
+    if len(values) != HOURS_PER_DAY or any(v < 0 for v in values):
+        return None
+    return tuple(values)
+
+
+def split_profile(profile: tuple[float, ...], timeline: OffpeakTimeline) -> tuple[float, float]:
+    """(HP kWh, HC kWh) of one day of the profile."""
+    hc = 0.0
+    for hour, kwh in enumerate(profile):
+        offpeak = sum(timeline.is_offpeak(time(hour, m, 30)) for m in _QUARTER_MINUTES)
+        hc += kwh * offpeak / len(_QUARTER_MINUTES)
+    return sum(profile) - hc, hc
+
+
+@dataclass(frozen=True, slots=True)
+class DayProjection:
+    """Expected cost of one Tempo day and its range (EUR), ``None`` without probabilities."""
+
+    date: str
+    expected: float
+    low: float | None
+    high: float | None
+    confirmed: bool
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "date": self.date,
+            "expected": round(self.expected, 2),
+            "low": round(self.low, 2) if self.low is not None else None,
+            "high": round(self.high, 2) if self.high is not None else None,
+            "confirmed": self.confirmed,
+        }
+
+
+def project(
+    days: list[str],
+    confirmed: Mapping[str, str],
+    forecasts: Mapping[str, ForecastSensor],
+    prices_at: Callable[[date], Mapping[str, Any] | None],
+    energy: tuple[float, float],
+) -> list[DayProjection]:
+    """Projection of ``days`` (ISO dates); days without grid or usable forecast are skipped."""
+    hp, hc = energy
+    costs_by_grid: dict[int, dict[str, float]] = {}
+    projections: list[DayProjection] = []
+    for day in days:
+        grid = prices_at(date.fromisoformat(day))
+        if not grid:
+            continue
+        costs = costs_by_grid.get(id(grid))
+        if costs is None:
+            costs = costs_by_grid[id(grid)] = {
+                c.key: hp * grid[c.key]["HP"] + hc * grid[c.key]["HC"]
+                for c in TEMPO_COLORS
+                if c.key in grid
+            }
+
+        color = confirmed.get(day)
+        forecast = forecasts.get(day)
+        if color in costs:
+            probabilities: Mapping[str, float] | None = {color: 1.0}
+        else:
+            probabilities = forecast.probabilities if forecast else None
+            predicted = resolve_color(forecast.color) if forecast else None
+            if not probabilities and predicted is not None and predicted.key in costs:
+                projections.append(
+                    DayProjection(
+                        date=day,
+                        expected=costs[predicted.key],
+                        low=None,
+                        high=None,
+                        confirmed=False,
+                    )
+                )
+                continue
+        weights = {k: p for k, p in (probabilities or {}).items() if p > 0 and k in costs}
+        total = sum(weights.values())
+        if not total:
+            continue
+        possible = [costs[k] for k in weights]
+        projections.append(
+            DayProjection(
+                date=day,
+                expected=sum(p * costs[k] for k, p in weights.items()) / total,
+                low=min(possible),
+                high=max(possible),
+                confirmed=color in costs,
+            )
+        )
+    return projections
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CURRENCY_EURO
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .entity import WriteOnChangeMixin, tempo_device_info
+from .forecast_coordinator import ForecastCoordinator
+from .prices_coordinator import PriceCoordinator
+from .projection import DayProjection, project, split_profile
+from .snapshot import NUM_FORECAST_DAYS
+from .tempo_coordinator import TempoDataCoordinator
+from .utils import get_tempo_date
+
+
+class ExpectedCostSensor(WriteOnChangeMixin, CoordinatorEntity[ForecastCoordinator], SensorEntity):
+    """Expected Tempo cost of J+1..J+9 for the configured daily load profile.
+
+    State is the total over the days that could be projected; ``projected_days``
+    and ``skipped_days`` tell how much of the J+1..J+9 horizon it covers (days
+    without price grid or forecast are skipped). ``days`` holds the expected cost
+    and range of each projected day. Recomputed only when the forecast, a confirmed color in
+    the window or the price grid actually changed.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "expected_cost"
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_native_unit_of_measurement = CURRENCY_EURO
+    _attr_suggested_display_precision = 2
+    # The per-day breakdown is rewritten on every forecast: history keeps the totals
+    _unrecorded_attributes = frozenset({"days", "skipped_days", "daily_hp_kwh", "daily_hc_kwh"})
+
+    def __init__(
+        self,
+        coordinator: ForecastCoordinator,
+        tempo: TempoDataCoordinator,
+        prices: PriceCoordinator,
+        entry: ConfigEntry,
+        profile: tuple[float, ...],
+    ) -> None:
+        super().__init__(coordinator)
+        self._tempo = tempo
+        self._prices = prices
+        self._energy = split_profile(profile, prices.timeline)
+        self._attr_unique_id = f"{entry.entry_id}_expected_cost"
+        self._attr_device_info = tempo_device_info(entry.entry_id)
+        self._inputs: tuple[Any, ...] | None = None
+        self._days: list[str] = []
+        self._projection: list[DayProjection] = []
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        for coordinator in (self._tempo, self._prices):
+            self.async_on_remove(coordinator.async_add_listener(self._handle_coordinator_update))
+        self._recompute()
+
+    def _recompute(self) -> bool:
+        """Project again if an input changed; returns whether it did."""
+        days = [
+            get_tempo_date(offset, self._tempo.tempo_day_change_time_str)
+            for offset in range(1, NUM_FORECAST_DAYS + 1)
+        ]
+        confirmed = self._tempo.calendar.days
+        forecasts = self.coordinator.tempo_data or {}
+        grids = {d: self._prices.get_prices_at(date.fromisoformat(d), contract="Tempo") for d in days}
+        # Compared by value: a re-downloaded but identical forecast or grid projects nothing
+        inputs = (
+            tuple(days),
+            tuple(confirmed.get(d) for d in days),
+            tuple(forecasts.get(d) for d in days),
+            tuple(grids[d] for d in days),
+        )
+        if inputs == self._inputs:
+            return False
+        self._inputs = inputs
+        self._days = days
+        self._projection = project(
+            days, confirmed, forecasts, lambda day: grids[day.isoformat()], self._energy
+        )
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self._recompute():
+            self.async_write_ha_state_if_changed()
+
+    @property
+    def native_value(self) -> float | None:
+        if not self._projection:
+            return None
+        return round(sum(p.expected for p in self._projection), 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        hp, hc = self._energy
+        # No range over the window as soon as one day has none (no per-color probabilities)
+        ranged = self._projection and all(p.low is not None for p in self._projection)
+        projected = {p.date for p in self._projection}
+        return {
+            "projected_days": len(projected),
+            "horizon_days": len(self._days),
+            "skipped_days": [d for d in self._days if d not in projected],
+            "days": [p.as_dict() for p in self._projection],
+            "low": round(sum(p.low for p in self._projection), 2) if ranged else None,
+            "high": round(sum(p.high for p in self._projection), 2) if ranged else None,
+            "daily_hp_kwh": round(hp, 3),
+            "daily_hc_kwh": round(hc, 3),
+        }
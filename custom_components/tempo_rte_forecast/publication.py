@@ -0,0 +1,81 @@
+"""Learned publication window of the J+1 Tempo color.
+
+RTE publishes J+1 at a varying time in the morning. Each day the time at which
+the adaptive poll first saw a valid J+1 is remembered (minute of day, Paris
+time); the polling window is the 10th-90th percentile range of the last
+``PUBLICATION_HISTORY_DAYS`` observations, widened by a margin.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import time
+import math
+from typing import Any
+
+from .const import (
+    PUBLICATION_HISTORY_DAYS,
+    PUBLICATION_MIN_OBSERVATIONS,
+    PUBLICATION_WINDOW_MARGIN,
+)
+
+
+def _minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def _time(minutes: int) -> time:
+    minutes = min(max(minutes, 0), 24 * 60 - 1)
+    return time(minutes // 60, minutes % 60)
+
+
+class PublicationWindow:
+    """Publication minute of J+1 by day, bounded history."""
+
+    __slots__ = ("observations",)
+
+    def __init__(self) -> None:
+        # {day published (J): minute of day}, oldest first
+        self.observations: dict[str, int] = {}
+
+    def record(self, day: str, moment: time) -> None:
+        """First valid J+1 seen on ``day`` at ``moment``; one observation per day."""
+        if day in self.observations:
+            return
+        self.observations[day] = _minutes(moment)
+        for old in sorted(self.observations)[:-PUBLICATION_HISTORY_DAYS]:
+            del self.observations[old]
+
+    @property
+    def learned(self) -> bool:
+        return len(self.observations) >= PUBLICATION_MIN_OBSERVATIONS
+
+    def window(self, default_start: time, default_end: time, floor: time) -> tuple[time, time]:
+        """Polling window of the day; never starts before ``floor`` (Tempo day change)."""
+        if not self.learned:
+            start, end = _minutes(default_start), _minutes(default_end)
+        else:
+            values = sorted(self.observations.values())
+            last = len(values) - 1
+            start = values[int(0.1 * last)] - PUBLICATION_WINDOW_MARGIN
+            end = values[math.ceil(0.9 * last)] + PUBLICATION_WINDOW_MARGIN
+        return _time(max(start, _minutes(floor))), _time(end)
+
+    def as_storage(self) -> dict[str, Any]:
+        return {"observations": dict(sorted(self.observations.items()))}
+
+    def restore(self, data: Mapping[str, Any]) -> None:
+        observations = data.get("observations") or {}
+        if isinstance(observations, Mapping):
+            for day in sorted(observations)[-PUBLICATION_HISTORY_DAYS:]:
+                minute = observations[day]
+                if isinstance(day, str) and isinstance(minute, int):
+                    self.observations[day] = minute
+
+    def as_dict(self, window: tuple[time, time]) -> dict[str, Any]:
+        start, end = window
+        return {
+            "learned": self.learned,
+            "window": f"{start.isoformat('minutes')}-{end.isoformat('minutes')}",
+            "observations": {d: _time(m).isoformat("minutes") for d, m in self.observations.items()},
+        }
@@ -0,0 +1,198 @@
+"""Incremental Tempo season calendar.
+
+The RTE Full calendar of a season is downloaded once (first run, or once a new
+season has started on August 1st); afterwards refreshes only merge the days
+whose color actually changed. For the first days after August 1st the previous
+season is kept and loaded too. The next season is never requested ahead: RTE
+has no calendar for it before it starts.
+
+Each season records the last day its full download covered. A season loaded
+while still in progress is downloaded again (at most once a day) only if days
+are missing since its start, e.g. after Home Assistant was stopped for a while.
+
+Days per color and per season are counted as days are merged, so used and
+remaining days of the season are O(1) reads.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from datetime import date, timedelta
+from typing import Any
+
+from .colors import BLUE, BY_CODE, BY_KEY, RED, WHITE, resolve_color
+from .utils import get_tempo_season
+
+# Days after August 1st during which the previous season is loaded too
+SEASON_BOUNDARY_DAYS = 7
+
+# White and red days RTE may place in a season; blue takes every other day
+SEASON_QUOTAS = {WHITE.key: 43, RED.key: 22}
+
+
+def season_of(day: str | date) -> str:
+    if isinstance(day, str):
+        day = date.fromisoformat(day)
+    return get_tempo_season(day)
+
+
+def previous_season(season: str) -> str:
+    start = int(season[:4])
+    return f"{start - 1}-{start}"
+
+
+def season_start(season: str) -> date:
+    return date(int(season[:4]), 8, 1)
+
+
+def season_end(season: str) -> date:
+    """July 31st, last day of the season."""
+    return date(int(season[:4]) + 1, 7, 31)
+
+
+def season_length(season: str) -> int:
+    """Days from August 1st to July 31st (366 when the season includes February 29th)."""
+    return (season_end(season) - season_start(season)).days + 1
+
+
+def season_quota(season: str, color: str) -> int:
+    if color == BLUE.key:
+        return season_length(season) - sum(SEASON_QUOTAS.values())
+    return SEASON_QUOTAS.get(color, 0)
+
+
+def seasons_needed(today: str) -> list[str]:
+    """Season of J, plus the previous one during the first days after August 1st."""
+    today_date = date.fromisoformat(today)
+    return sorted(
+        {season_of(today_date), season_of(today_date - timedelta(days=SEASON_BOUNDARY_DAYS))}
+    )
+
+
+def known_colors(values: Mapping[str, Any]) -> dict[str, str]:
+    """``{date: color key}`` of the recognized colors of an upstream calendar."""
+    return {
+        day: color.key
+        for day, raw in values.items()
+        if isinstance(raw, str) and (color := resolve_color(raw)) is not None and color.known
+    }
+
+
+class SeasonCalendar:
+    """Known colors by date (canonical keys) and how far each season was loaded."""
+
+    __slots__ = ("days", "loaded", "_counts")
+
+    def __init__(self) -> None:
+        # Flat view shared with the coordinator (``_cached_data``)
+        self.days: dict[str, str] = {}
+        # {season: last day (ISO) covered by its full download}
+        self.loaded: dict[str, str] = {}
+        # {season: {color: days}}, kept in step with ``days``
+        self._counts: dict[str, Counter[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def get(self, day: str) -> str | None:
+        return self.days.get(day)
+
+    def used(self, season: str, color: str) -> int:
+        """Days of ``color`` already placed by RTE in ``season`` (J+1 included once announced)."""
+        counts = self._counts.get(season)
+        return counts[color] if counts else 0
+
+    def known_days(self, season: str) -> int:
+        counts = self._counts.get(season)
+        return sum(counts.values()) if counts else 0
+
+    def remaining(self, season: str, color: str) -> int:
+        return max(0, season_quota(season, color) - self.used(season, color))
+
+    def _set(self, day: str, color: str) -> None:
+        previous = self.days.get(day)
+        self.days[day] = color
+        counts = self._counts.setdefault(season_of(day), Counter())
+        if previous is not None:
+            counts[previous] -= 1
+        counts[color] += 1
+
+    def seasons_to_load(self, seasons: Iterable[str], today: str) -> list[str]:
+        """Seasons never loaded, or loaded in progress and now missing days up to J."""
+        return [s for s in seasons if self._needs_loading(s, today)]
+
+    def _needs_loading(self, season: str, today: str) -> bool:
+        through = self.loaded.get(season)
+        if through is None:
+            return True
+        if through >= season_end(season).isoformat() or through >= today:
+            # Complete, or already downloaded today
+            return False
+        elapsed = (min(date.fromisoformat(today), season_end(season)) - season_start(season)).days + 1
+        return self.known_days(season) < elapsed
+
+    def merge(self, values: Mapping[str, Any]) -> dict[str, str]:
+        """Apply upstream ``{date: color}``; returns only the days that changed.
+
+        Unrecognized values (``NON_DEFINI``, empty...) never overwrite a known color.
+        """
+        changed: dict[str, str] = {}
+        days = self.days
+        for day, raw in values.items():
+            color = resolve_color(raw) if isinstance(raw, str) else None
+            if color is None or not color.known:
+                continue
+            if days.get(day) != color.key:
+                self._set(day, color.key)
+                changed[day] = color.key
+        return changed
+
+    def load_season(self, season: str, values: Mapping[str, Any], today: str) -> dict[str, str]:
+        """Merge a full season calendar, loaded up to its last day or ``today``."""
+        changed = self.merge(values)
+        last = max(
+            (d for d in values if isinstance(d, str) and season_of(d) == season), default=today
+        )
+        through = max(last, today, self.loaded.get(season, ""))
+        self.loaded[season] = min(through, season_end(season).isoformat())
+        return changed
+
+    def prune(self, keep: Iterable[str]) -> None:
+        """Forget seasons older than the one preceding ``keep`` (history of the last season kept)."""
+        oldest = previous_season(min(keep))
+        # In place: ``days`` is shared with the coordinator
+        for day in [d for d in self.days if season_of(d) < oldest]:
+            del self.days[day]
+        for season in [s for s in self.loaded if s < oldest]:
+            del self.loaded[season]
+        for season in [s for s in self._counts if s < oldest]:
+            del self._counts[season]
+
+    def as_storage(self) -> dict[str, Any]:
+        """Compact: {date: color code} plus how far each season was loaded."""
+        return {
+            "days": {
+                d: BY_KEY[c].code for d, c in sorted(self.days.items()) if c in BY_KEY
+            },
+            "seasons": dict(sorted(self.loaded.items())),
+        }
+
+    def restore(self, data: Mapping[str, Any]) -> dict[str, str]:
+        restored = {
+            d: color.key
+            for d, c in (data.get("days") or {}).items()
+            if (color := BY_CODE.get(c)) is not None and color.known
+        }
+        for day, color in restored.items():
+            self._set(day, color)
+        seasons = data.get("seasons") or {}
+        if isinstance(seasons, list):
+            # Former format (names only): loaded at an unknown date, completed if days are missing
+            seasons = dict.fromkeys(seasons, "")
+        self.loaded.update(
+            (s, through)
+            for s, through in seasons.items()
+            if isinstance(s, str) and isinstance(through, str)
+        )
+        return restored
@@ -0,0 +1,71 @@
+"""Used and remaining Tempo days of the current season, per color."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .colors import BY_KEY, IconPalette
+from .entity import WriteOnChangeMixin, tempo_device_info
+from .season_calendar import season_of, season_quota
+from .tempo_coordinator import TempoDataCoordinator
+from .utils import get_tempo_date
+
+KIND_USED = "used"
+KIND_REMAINING = "remaining"
+
+
+class SeasonDaysSensor(WriteOnChangeMixin, CoordinatorEntity[TempoDataCoordinator], SensorEntity):
+    """Days of one color used (or remaining) in the current Tempo season.
+
+    Read from the counters kept by the season calendar, never recounted.
+    """
+
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.DAYS
+    _unrecorded_attributes = frozenset({"quota", "icon_color"})
+
+    def __init__(
+        self, coordinator: TempoDataCoordinator, entry: ConfigEntry, color: str, kind: str
+    ) -> None:
+        super().__init__(coordinator)
+        self._color = BY_KEY[color]
+        self._kind = kind
+        self._attr_translation_key = f"season_days_{kind}"
+        self._attr_unique_id = f"{entry.entry_id}_season_{color}_{kind}"
+        self._attr_device_info = tempo_device_info(entry.entry_id)
+        self._icon_color = IconPalette(entry.options)[self._color]
+
+    @property
+    def _season(self) -> str:
+        return season_of(get_tempo_date(0, self.coordinator.tempo_day_change_time_str))
+
+    @property
+    def translation_placeholders(self) -> dict[str, Any]:
+        return {"color": self._color.name}
+
+    @property
+    def available(self) -> bool:
+        """Counts are only complete once the full season calendar was loaded."""
+        return self._season in self.coordinator.calendar.loaded
+
+    @property
+    def native_value(self) -> int:
+        calendar = self.coordinator.calendar
+        if self._kind == KIND_USED:
+            return calendar.used(self._season, self._color.key)
+        return calendar.remaining(self._season, self._color.key)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        season = self._season
+        return {
+            "season": season,
+            "quota": season_quota(season, self._color.key),
+            "icon_color": self._icon_color,
+        }
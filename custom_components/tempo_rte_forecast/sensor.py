@@ -5,13 +5,23 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import TempoConfigEntry
-from .const import CONF_CONTRACT
+from .const import CONF_CONTRACT, CONF_ENERGY_ENTITY, CONF_LOAD_PROFILE
+from .snapshot import NUM_FORECAST_DAYS
 
 from .tempo_sensor import TempoSensor, TempoNextDayCombinedSensor
 
 from .forecast_sensor import OpenDPEForecastSensor
 
-from .prices_sensor import PriceSensor, SpecificPriceSensor
+from .prices_sensor import PriceGridSensor, PriceSensor, SpecificPriceSensor
+
+from .cost_sensor import EnergyCostSensor
+from .projection import parse_load_profile
+from .projection_sensor import ExpectedCostSensor
+
+from .season_sensor import KIND_REMAINING, KIND_USED, SeasonDaysSensor
+
+from .metrics import TEMPO_SOURCES, opendpe_source, tariff_source
+from .metrics_sensor import FetchMetricsSensor
 
 
 async def async_setup_entry(
@@ -23,6 +33,7 @@ async def async_setup_entry(
     coordinator = entry.runtime_data.tempo_coordinator
     forecast_coordinator = entry.runtime_data.forecast_coordinator
     price_coordinator = entry.runtime_data.price_coordinator
+    snapshots = entry.runtime_data.snapshots
 
     async_add_entities(
         [
@@ -30,29 +41,40 @@ async def async_setup_entry(
                 coordinator,
                 0,
                 entry,
-                forecast_coordinator=forecast_coordinator,
+                snapshots=snapshots,
             ),
             TempoSensor(
                 coordinator,
                 1,
                 entry,
-                forecast_coordinator=forecast_coordinator,
+                snapshots=snapshots,
             ),
         ]
     )
 
     # Add forecast sensors from Open DPE
-    NUM_FORECAST_DAYS = 9  # J+1 to J+9
+    sensors = [
+        TempoNextDayCombinedSensor(coordinator, entry, snapshots=snapshots)
+    ]
 
-    sensors = [TempoNextDayCombinedSensor(coordinator, forecast_coordinator, entry)]
-    
     for index in range(0, NUM_FORECAST_DAYS):
-        sensors.append(OpenDPEForecastSensor(forecast_coordinator, index, entry=entry))
+        sensors.append(
+            OpenDPEForecastSensor(forecast_coordinator, index, entry=entry, snapshots=snapshots)
+        )
 
-    async_add_entities(sensors, True)
+    # No update_before_add: entities read the restored snapshot, a refresh would
+    # re-download both sources on every warm start
+    async_add_entities(sensors)
+
+    # Used / remaining days of the season per color
+    async_add_entities(
+        SeasonDaysSensor(coordinator, entry, color, kind)
+        for color in ("blue", "white", "red")
+        for kind in (KIND_USED, KIND_REMAINING)
+    )
 
     # Add prices sensor
-    price_sensors = [PriceSensor(price_coordinator, entry)]
+    price_sensors = [PriceSensor(price_coordinator, entry), PriceGridSensor(price_coordinator, entry)]
 
     # Add specific sensors based on contract type
     contract = entry.options.get(CONF_CONTRACT, "Tempo")
@@ -68,3 +90,31 @@ async def async_setup_entry(
             price_sensors.append(SpecificPriceSensor(price_coordinator, entry, key="HC", color=color))
 
     async_add_entities(price_sensors)
+
+    # Accumulated cost of the configured kWh meter
+    if energy_entity := entry.options.get(CONF_ENERGY_ENTITY):
+        async_add_entities([EnergyCostSensor(price_coordinator, entry, energy_entity)])
+
+    # Expected Tempo cost of J+1..J+9 for the configured load profile
+    profile = parse_load_profile(entry.options.get(CONF_LOAD_PROFILE))
+    if contract == "Tempo" and profile:
+        async_add_entities(
+            [
+                ExpectedCostSensor(
+                    forecast_coordinator, coordinator, price_coordinator, entry, profile
+                )
+            ]
+        )
+
+    # Diagnostic sensors: per-source fetch metrics (shared hub)
+    sources = [
+        *TEMPO_SOURCES,
+        opendpe_source(forecast_coordinator.service_type),
+        tariff_source(price_coordinator.contract),
+    ]
+    async_add_entities(
+        FetchMetricsSensor(
+            coordinator.hub.metrics, coordinator.hub.breaker(source), source, entry
+        )
+        for source in sources
+    )
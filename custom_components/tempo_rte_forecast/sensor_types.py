@@ -41,6 +41,7 @@ class ForecastSensor:
     color: str                                          # "bleu", "blanc", "rouge" (normalized to lowercase)
     probability: Optional[float | str]                  # 0.67 for example (for 67%)
     source: str = "open_dpe"
+    probabilities: Optional[dict[str, float]] = None    # {"blue": 0.7, "white": 0.2, "red": 0.1}
 
 
 #   Tempo color model
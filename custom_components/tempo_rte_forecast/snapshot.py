@@ -0,0 +1,278 @@
+"""Per-update snapshot shared by the Tempo and Open-DPE sensors.
+
+Each Tempo or forecast coordinator update rebuilds one immutable snapshot holding
+the resolved J, J+1 and J+1..J+9 days with their state and precomputed attributes.
+Entities only index into it: no date computation, coordinator lookup or color
+normalization per property access.
+
+Updates of both coordinators are coalesced: the refresh service or a shared
+trigger updating Tempo then forecast back to back rebuilds the snapshot and
+writes each entity once.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass
+import logging
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .colors import BLUE, RED, UNKNOWN, WHITE, IconPalette, TempoColor, resolve_color
+from .const import CONF_TEMPO_DAY_CHANGE_TIME, SNAPSHOT_COALESCE_DELAY, TEMPO_DAY_CHANGE_TIME
+from .entity import WriteOnChangeMixin
+from .forecast_coordinator import ForecastCoordinator
+from .tempo_coordinator import TempoDataCoordinator
+from .utils import get_tempo_date
+
+_LOGGER = logging.getLogger(__name__)
+
+NUM_FORECAST_DAYS = 9  # J+1 to J+9
+
+
+@dataclass(frozen=True, slots=True)
+class DaySnapshot:
+    """Resolved state of one sensor day."""
+
+    date: str
+    value: str | None
+    available: bool
+    attributes: Mapping[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class TempoSnapshot:
+    """Everything the Tempo/forecast entities of an entry expose, for one update."""
+
+    tempo: tuple[DaySnapshot, ...]  # J, J+1 (RTE, Open-DPE fallback)
+    combined: DaySnapshot  # J+1 synthesis
+    forecast: tuple[DaySnapshot, ...]  # J+1 .. J+9 (Open-DPE), index 0 = J+1
+
+
+def _resolve(raw: str | None) -> tuple[TempoColor, str]:
+    """Canonical color and state key (non-color strings kept lowercased)."""
+    color = resolve_color(raw)
+    if color is not None:
+        return color, color.key
+    return UNKNOWN, raw.lower() if raw else UNKNOWN.key
+
+
+def _tempo_day(
+    tempo: TempoDataCoordinator,
+    forecast: ForecastCoordinator,
+    palette: IconPalette,
+    day: str,
+    index: int,
+) -> DaySnapshot:
+    """RTE value if present; else Open-DPE row for the same Tempo calendar day if any."""
+    day_data = tempo.get_data(day)
+    if day_data is not None:
+        color, color_key = _resolve(day_data)
+        data_source = "api" if day in tempo.tempo_data else "cache"
+    elif (fd := forecast.get_data(day)) and fd.color:
+        color, color_key = _resolve(fd.color)
+        data_source = "opendpe"
+    else:
+        color, color_key = UNKNOWN, UNKNOWN.key
+        data_source = "none"
+
+    attributes = {
+        "date": day,
+        "color": color.name,
+        "color_en": color.name_en,
+        "color_code": color.code,
+        "color_emoji": color.emoji,
+        "is_blue": color is BLUE,
+        "is_white": color is WHITE,
+        "is_red": color is RED,
+        "icon_color": palette[color],
+        "data_source": data_source,
+    }
+    if index == 1:
+        attributes["tomorrow_is_blue"] = color is BLUE
+        attributes["tomorrow_is_white"] = color is WHITE
+        attributes["tomorrow_is_red"] = color is RED
+
+    # Always available: real color from RTE/forecast, or explicit ``unknown``
+    return DaySnapshot(day, color_key, True, MappingProxyType(attributes))
+
+
+def _combined_day(
+    tempo: TempoDataCoordinator,
+    forecast: ForecastCoordinator,
+    palette: IconPalette,
+    day: str,
+) -> DaySnapshot:
+    """RTE J+1 if known, else ``❓ <forecast emoji>``."""
+    rte_data = tempo.get_data(day)
+    forecast_data = forecast.get_data(day)
+
+    rte, rte_key = _resolve(rte_data)
+    if forecast_data:
+        forecast_color, forecast_key = _resolve(forecast_data.color)
+        known_forecast = forecast_color.known or forecast_key == UNKNOWN.key
+        forecast_name = forecast_color.name if known_forecast else forecast_key
+        forecast_emoji = forecast_color.emoji if known_forecast else forecast_key
+    else:
+        forecast_color = UNKNOWN
+        forecast_name = UNKNOWN.name
+        forecast_emoji = "unknown"
+
+    # Color logic for icon: RTE first, then Forecast
+    active = rte if rte.known else forecast_color
+
+    if rte.known:
+        value = rte_key
+    elif forecast_data and forecast_data.color:
+        value = f"{UNKNOWN.emoji} {forecast_emoji}"
+    else:
+        value = rte_key
+
+    attributes = {
+        "date": day,
+        "rte_status": rte.name,
+        "rte_emoji": rte.emoji,
+        "forecast_status": forecast_name,
+        "forecast_emoji": forecast_emoji,
+        "active_source": "RTE" if rte.known else "OpenDPE",
+        "color_emoji": rte.emoji if rte.known else f"{UNKNOWN.emoji} {forecast_emoji}",
+        "icon_color": palette[rte],
+        "tomorrow_is_blue": active is BLUE,
+        "tomorrow_is_white": active is WHITE,
+        "tomorrow_is_red": active is RED,
+    }
+    # RTE or Open-DPE may be in error while the other still has stale data
+    available = rte_data is not None or forecast_data is not None
+    return DaySnapshot(day, value, available, MappingProxyType(attributes))
+
+
+def _forecast_day(forecast: ForecastCoordinator, palette: IconPalette, day: str) -> DaySnapshot:
+    day_data = forecast.get_data(day)
+    if day_data is None:
+        return DaySnapshot(day, None, False, MappingProxyType({}))
+
+    attrs = asdict(day_data)
+    color, color_key = _resolve(day_data.color)
+    attrs["icon_color"] = palette[color]
+    if color.known or color_key == UNKNOWN.key:
+        attrs["color_name"] = color.name
+        attrs["color_emoji"] = color.emoji
+    else:
+        # Probability string case
+        attrs["color_name"] = day_data.color
+        attrs["color_emoji"] = day_data.color
+    return DaySnapshot(day, color_key, True, MappingProxyType(attrs))
+
+
+def build_snapshot(
+    tempo: TempoDataCoordinator,
+    forecast: ForecastCoordinator,
+    options: Mapping[str, Any],
+    palette: IconPalette | None = None,
+) -> TempoSnapshot:
+    """Resolve every day exposed by the entities, once."""
+    if palette is None:
+        palette = IconPalette(options)
+    change_time = options.get(CONF_TEMPO_DAY_CHANGE_TIME, TEMPO_DAY_CHANGE_TIME)
+    days = [get_tempo_date(i, change_time) for i in range(NUM_FORECAST_DAYS + 1)]
+    return TempoSnapshot(
+        tempo=tuple(_tempo_day(tempo, forecast, palette, days[i], i) for i in (0, 1)),
+        combined=_combined_day(tempo, forecast, palette, days[1]),
+        forecast=tuple(_forecast_day(forecast, palette, d) for d in days[1:]),
+    )
+
+
+class TempoSnapshotPublisher:
+    """Rebuilds the snapshot after Tempo / forecast updates and notifies the entities.
+
+    Coordinator notifications within ``SNAPSHOT_COALESCE_DELAY`` are batched:
+    one rebuild, then one callback per subscribed entity.
+    """
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        tempo: TempoDataCoordinator,
+        forecast: ForecastCoordinator,
+    ) -> None:
+        self._entry = entry
+        self._tempo = tempo
+        self._forecast = forecast
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._listeners: list[CALLBACK_TYPE] = []
+        self.palette = IconPalette(entry.options)
+        self.snapshot = build_snapshot(tempo, forecast, entry.options, self.palette)
+        self._debouncer = Debouncer(
+            tempo.hass,
+            _LOGGER,
+            cooldown=SNAPSHOT_COALESCE_DELAY,
+            immediate=False,
+            function=self._async_publish,
+        )
+
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Subscribe to both coordinators; returns the unsubscribe callback."""
+        self._unsubs = [
+            self._tempo.async_add_listener(self._debouncer.async_schedule_call),
+            self._forecast.async_add_listener(self._debouncer.async_schedule_call),
+        ]
+        return self.async_stop
+
+    @callback
+    def async_stop(self) -> None:
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        self._debouncer.async_cancel()
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Called once per coalesced update, after the snapshot was rebuilt."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove
+
+    @callback
+    def _async_publish(self) -> None:
+        self.snapshot = build_snapshot(
+            self._tempo, self._forecast, self._entry.options, self.palette
+        )
+        for update_callback in list(self._listeners):
+            update_callback()
+
+
+class SnapshotEntity(WriteOnChangeMixin, Entity):
+    """Entity written on coalesced snapshot updates rather than on each coordinator."""
+
+    _attr_should_poll = False
+
+    def __init__(
+        self, coordinator: DataUpdateCoordinator[Any], snapshots: TempoSnapshotPublisher
+    ) -> None:
+        self.coordinator = coordinator
+        self._snapshots = snapshots
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._snapshots.async_add_listener(self._handle_snapshot_update))
+
+    @callback
+    def _handle_snapshot_update(self) -> None:
+        self.async_write_ha_state_if_changed()
+
+    async def async_update(self) -> None:
+        """``update_entity`` service: refresh the coordinator (like ``CoordinatorEntity``)."""
+        if not self.enabled:
+            return
+        await self.coordinator.async_request_refresh()
@@ -0,0 +1,302 @@
+"""Tempo colors and tariffs imported as recorder long-term statistics.
+
+Two external statistics, one hourly row each:
+
+* ``tempo_rte_forecast:tempo_color``: color code of the Tempo day the hour
+  belongs to (1 blue, 2 white, 3 red), from the season calendar;
+* ``tempo_rte_forecast:price_<contract>_<power>kva``: price of the hour
+  (EUR/kWh) for the configured contract, power and off-peak ranges, from the
+  tariff index (color of the day for Tempo).
+
+Each import compares the hours the calendar and the tariff index can give with
+the hours already in the recorder (read back once, then tracked in memory) and
+adds only the missing ones: the first run backfills every day held by the
+calendar, later runs append the new hours and fill earlier gaps, such as hours
+skipped while a grid or a color was missing.
+
+Past seasons, which the live calendar does not keep, are backfilled once per
+run: the last ``STATISTICS_BACKFILL_SEASONS`` seasons whose colors are not in
+the recorder yet are fetched from RTE Full (one request each), imported, and
+not kept in memory. Rows are built in the executor and never go past the
+current hour.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import date, datetime, time, timedelta
+import logging
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    statistics_during_period,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+try:  # Home Assistant 2025.6+
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # pragma: no cover
+    StatisticMeanType = None
+
+from .colors import BY_KEY
+from .const import DOMAIN, STATISTICS_BACKFILL_SEASONS
+from .prices_coordinator import PriceCoordinator
+from .season_calendar import previous_season, season_length, season_of, season_start
+from .tempo_coordinator import TempoDataCoordinator
+from .utils import OffpeakTimeline, get_tempo_date
+
+_LOGGER = logging.getLogger(__name__)
+
+STATISTIC_TEMPO_COLOR = f"{DOMAIN}:tempo_color"
+
+_HOUR = timedelta(hours=1)
+
+
+def price_statistic_id(contract: str, power: str) -> str:
+    return f"{DOMAIN}:price_{contract.lower().replace(' ', '_')}_{power}kva"
+
+
+def _metadata(statistic_id: str, name: str, unit: str | None) -> StatisticMetaData:
+    metadata: dict[str, Any] = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": name,
+        "source": DOMAIN,
+        "statistic_id": statistic_id,
+        "unit_of_measurement": unit,
+        "unit_class": None,
+    }
+    if StatisticMeanType is not None:
+        metadata["mean_type"] = StatisticMeanType.ARITHMETIC
+    return metadata  # type: ignore[return-value]
+
+
+def _hours(since: datetime, until: datetime, change_time: time):
+    """UTC hour starts in ``[since, until)`` with their Paris wall time and Tempo day."""
+    tz = dt_util.get_time_zone("Europe/Paris")
+    change = timedelta(hours=change_time.hour, minutes=change_time.minute)
+    start = since
+    while start < until:
+        local = start.astimezone(tz)
+        tempo_day = (local.replace(tzinfo=None) - change).date().isoformat()
+        yield start, local, tempo_day
+        start += _HOUR
+
+
+def build_color_rows(
+    days: Mapping[str, str], change_time: time, since: datetime, until: datetime
+) -> list[StatisticData]:
+    rows: list[StatisticData] = []
+    for start, _local, tempo_day in _hours(since, until, change_time):
+        color = BY_KEY.get(days.get(tempo_day, ""))
+        if color is None or not color.known:
+            continue
+        rows.append(StatisticData(start=start, mean=color.code, min=color.code, max=color.code))
+    return rows
+
+
+def build_price_rows(
+    days: Mapping[str, str],
+    prices_at: Callable[[date], Mapping[str, Any] | None],
+    contract: str,
+    timeline: OffpeakTimeline,
+    change_time: time,
+    since: datetime,
+    until: datetime,
+) -> list[StatisticData]:
+    rows: list[StatisticData] = []
+    grids: dict[str, Mapping[str, Any] | None] = {}
+    for start, local, tempo_day in _hours(since, until, change_time):
+        if tempo_day not in grids:
+            grids[tempo_day] = prices_at(date.fromisoformat(tempo_day))
+        grid = grids[tempo_day]
+        if not grid:
+            continue
+        period = "HC" if contract != "Base" and timeline.is_offpeak(local.time()) else "HP"
+        if contract == "Tempo":
+            grid = grid.get(days.get(tempo_day, "")) or {}
+        price = grid.get(period)
+        if price is None:
+            continue
+        rows.append(StatisticData(start=start, mean=price, min=price, max=price))
+    return rows
+
+
+class TempoStatisticsImporter:
+    """Imports the missing color and price hours after each coordinator update."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        tempo: TempoDataCoordinator,
+        prices: PriceCoordinator,
+    ) -> None:
+        self.hass = hass
+        self._tempo = tempo
+        self._prices = prices
+        self._running = False
+        self._pending = False
+        # {statistic_id: (read back from, hour starts present in the recorder)}
+        self._imported: dict[str, tuple[datetime, set[float]]] = {}
+        self._backfilled = False
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Import now, then after every Tempo / price update. Returns the stop callback."""
+        removers = [
+            self._tempo.async_add_listener(self._schedule_import),
+            self._prices.async_add_listener(self._schedule_import),
+        ]
+        self._schedule_import()
+
+        @callback
+        def async_stop() -> None:
+            for remove in removers:
+                remove()
+
+        return async_stop
+
+    @callback
+    def _schedule_import(self) -> None:
+        if self._running:
+            # Coalesce: one more pass once the current one is done
+            self._pending = True
+            return
+        self._running = True
+        self.hass.async_create_background_task(self._async_import(), f"{DOMAIN} statistics import")
+
+    async def _async_import(self) -> None:
+        try:
+            while True:
+                self._pending = False
+                await self._async_import_once()
+                if not self._pending:
+                    return
+        except Exception as err:
+            _LOGGER.warning("[Statistics] Import impossible: %s", err)
+        finally:
+            self._running = False
+
+    def _first_hour(self, day: date, change_time: time) -> datetime:
+        """First hour (UTC) of the Tempo day ``day``, floored to the hour."""
+        # Statistics rows start on the hour, whatever the day change time (06:30...):
+        # each hour is still assigned to the Tempo day of its own wall time
+        tz = dt_util.get_time_zone("Europe/Paris")
+        return dt_util.as_utc(datetime.combine(day, change_time, tz)).replace(
+            minute=0, second=0, microsecond=0
+        )
+
+    async def _async_past_seasons(self, change_time: time) -> dict[str, str]:
+        """Colors of the past seasons missing from both the live calendar and the recorder."""
+        season = season_of(get_tempo_date(0, self._tempo.tempo_day_change_time_str))
+        seasons = []
+        for _ in range(STATISTICS_BACKFILL_SEASONS):
+            season = previous_season(season)
+            seasons.append(season)
+        imported = await self._async_imported_hours(
+            STATISTIC_TEMPO_COLOR, self._first_hour(season_start(seasons[-1]), change_time)
+        )
+        history: dict[str, str] = {}
+        for season in seasons:
+            if season in self._tempo.calendar.loaded:
+                continue
+            start = self._first_hour(season_start(season), change_time).timestamp()
+            end = start + season_length(season) * 86400
+            if sum(1 for ts in imported if start <= ts < end) >= (season_length(season) - 1) * 24:
+                continue  # already imported by a previous run
+            colors = await self._tempo.async_fetch_past_season(season)
+            if not colors:
+                _LOGGER.warning("[Statistics] Saison %s indisponible pour l'historique", season)
+                continue
+            _LOGGER.info("[Statistics] Historique de la saison %s: %s jours", season, len(colors))
+            history.update(colors)
+        return history
+
+    async def _async_imported_hours(self, statistic_id: str, first: datetime) -> set[float]:
+        """Hour starts (timestamps) already imported from ``first`` on.
+
+        Read from the recorder the first time, and again only for the hours
+        before what was read when the calendar grew backwards.
+        """
+        read_since, imported = self._imported.get(statistic_id, (None, set()))
+        if read_since is not None and first >= read_since:
+            return imported
+        stats = await get_instance(self.hass).async_add_executor_job(
+            statistics_during_period,
+            self.hass,
+            first,
+            read_since,
+            {statistic_id},
+            "hour",
+            None,
+            {"mean"},
+        )
+        imported.update(row["start"] for row in stats.get(statistic_id, ()))
+        self._imported[statistic_id] = (first, imported)
+        return imported
+
+    async def _async_add_missing(
+        self, metadata: StatisticMetaData, rows: list[StatisticData], first: datetime
+    ) -> int:
+        """Import the rows whose hour is not in the recorder yet; returns how many."""
+        imported = await self._async_imported_hours(metadata["statistic_id"], first)
+        missing = [row for row in rows if row["start"].timestamp() not in imported]
+        if missing:
+            async_add_external_statistics(self.hass, metadata, missing)
+            imported.update(row["start"].timestamp() for row in missing)
+        return len(missing)
+
+    async def _async_import_once(self) -> None:
+        change_time = self._tempo.tempo_day_change_time
+        history: dict[str, str] = {}
+        if not self._backfilled:
+            history = await self._async_past_seasons(change_time)
+            self._backfilled = not history
+        days = {**history, **self._tempo.calendar.days}
+        if not days:
+            return
+        first = self._first_hour(date.fromisoformat(min(days)), change_time)
+        until = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+
+        if first >= until:
+            return
+
+        rows = await self.hass.async_add_executor_job(
+            build_color_rows, days, change_time, first, until
+        )
+        added = await self._async_add_missing(
+            _metadata(STATISTIC_TEMPO_COLOR, "Tempo color (1 blue, 2 white, 3 red)", None),
+            rows,
+            first,
+        )
+        if added:
+            _LOGGER.info("[Statistics] %s heures de couleur Tempo importées", added)
+
+        prices = self._prices
+        rows = await self.hass.async_add_executor_job(
+            build_price_rows,
+            days,
+            prices.get_prices_at,
+            prices.contract,
+            prices.timeline,
+            change_time,
+            first,
+            until,
+        )
+        added = await self._async_add_missing(
+            _metadata(
+                price_statistic_id(prices.contract, prices.subscribed_power),
+                f"{prices.contract} {prices.subscribed_power} kVA price",
+                "EUR/kWh",
+            ),
+            rows,
+            first,
+        )
+        if added:
+            _LOGGER.info("[Statistics] %s heures de prix %s importées", added, prices.contract)
+        # Past seasons imported: not fetched again during this run
+        self._backfilled = True
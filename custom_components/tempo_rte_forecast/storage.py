@@ -0,0 +1,77 @@
+"""Persistent on-disk cache shared by the Tempo, forecast and price coordinators.
+
+One ``Store`` file per config entry (``.storage/tempo_rte_forecast.<entry_id>``).
+Each coordinator registers a section provider; saves are debounced so several
+coordinator updates landing close together produce a single write.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TempoStore:
+    """Versioned store holding the last valid data of every coordinator."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store for a config entry."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._providers: dict[str, Callable[[], Any]] = {}
+        self.data: dict[str, Any] = {}
+
+    async def async_load(self) -> dict[str, Any]:
+        """Load the stored sections (empty dict on first run or unreadable file)."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning("[Store] Lecture du cache impossible, démarrage à froid: %s", err)
+            stored = None
+        self.data = stored if isinstance(stored, dict) else {}
+        _LOGGER.debug("[Store] Sections restaurées: %s", list(self.data))
+        return self.data
+
+    def section(self, key: str) -> dict[str, Any]:
+        """Return a loaded section (empty dict when absent)."""
+        value = self.data.get(key)
+        return value if isinstance(value, dict) else {}
+
+    @callback
+    def register(self, key: str, provider: Callable[[], Any]) -> None:
+        """Register the callable producing the serialized section ``key``."""
+        self._providers[key] = provider
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Debounced save: coalesces updates within ``STORAGE_SAVE_DELAY`` seconds."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write immediately (entry unload)."""
+        if self._providers:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the file (entry removal)."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        data = dict(self.data)
+        for key, provider in self._providers.items():
+            try:
+                data[key] = provider()
+            except Exception as err:
+                _LOGGER.warning("[Store] Section '%s' non sérialisable: %s", key, err)
+        self.data = data
+        return data
@@ -0,0 +1,223 @@
+"""Tariff grids (data.gouv.fr) indexed by subscribed power and validity interval.
+
+Each CSV is parsed once, in the executor while it downloads, into a
+``TariffIndex`` holding every power level and every ``DATE_DEBUT``/``DATE_FIN``
+interval. Looking up the prices of any power at any date is then a binary
+search, with no network round trip.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Callable
+import codecs
+import csv
+from dataclasses import dataclass
+from datetime import date
+import logging
+from typing import Any
+
+from .const import PRICE_BASE_URL, PRICE_HPHC_URL, PRICE_TEMPO_URL
+
+_LOGGER = logging.getLogger(__name__)
+
+# Tempo color key -> CSV column suffix
+_TEMPO_COLUMNS = {"blue": "Bleu", "white": "Blanc", "red": "Rouge"}
+
+
+@dataclass(frozen=True, slots=True)
+class TariffPeriod:
+    """Prices valid for one power level between ``start`` and ``end`` (inclusive)."""
+
+    start: date
+    end: date | None
+    prices: dict[str, Any]
+
+    def covers(self, day: date) -> bool:
+        return self.start <= day and (self.end is None or day <= self.end)
+
+
+class TariffIndex:
+    """Every power level and validity interval of a price grid."""
+
+    __slots__ = ("_periods", "_starts")
+
+    def __init__(self, periods: dict[str, list[TariffPeriod]]) -> None:
+        self._periods = {
+            power: sorted(rows, key=lambda p: p.start) for power, rows in periods.items()
+        }
+        self._starts = {
+            power: [p.start.toordinal() for p in rows]
+            for power, rows in self._periods.items()
+        }
+
+    def __bool__(self) -> bool:
+        return bool(self._periods)
+
+    @property
+    def powers(self) -> list[str]:
+        """Subscribed powers present in the grid, numerically sorted."""
+        return sorted(self._periods, key=lambda p: (len(p), p))
+
+    @property
+    def period_count(self) -> int:
+        return sum(len(rows) for rows in self._periods.values())
+
+    def lookup(self, power: str, day: date) -> dict[str, Any] | None:
+        """Prices for ``power`` at ``day`` (latest interval starting on or before it)."""
+        periods = self._periods.get(power)
+        if not periods:
+            return None
+        i = bisect_right(self._starts[power], day.toordinal()) - 1
+        # Intervals may overlap (open-ended row not yet closed): walk back from the latest start.
+        while i >= 0:
+            if periods[i].covers(day):
+                return periods[i].prices
+            i -= 1
+        return None
+
+    def as_storage(self) -> dict[str, list[list[Any]]]:
+        """Compact rows: {power: [[start, end, prices], ...]}."""
+        return {
+            power: [
+                [p.start.isoformat(), p.end.isoformat() if p.end else None, p.prices]
+                for p in rows
+            ]
+            for power, rows in self._periods.items()
+        }
+
+    @classmethod
+    def from_storage(cls, data: dict[str, list[list[Any]]]) -> TariffIndex:
+        periods: dict[str, list[TariffPeriod]] = {}
+        for power, rows in data.items():
+            for start, end, prices in rows:
+                periods.setdefault(power, []).append(
+                    TariffPeriod(
+                        date.fromisoformat(start),
+                        date.fromisoformat(end) if end else None,
+                        prices,
+                    )
+                )
+        return cls(periods)
+
+
+def _price(row: dict[str, str], column: str) -> float:
+    return float(row[column].replace(',', '.'))
+
+
+def _row_base(row: dict[str, str]) -> dict[str, Any]:
+    return {"HP": _price(row, "PART_VARIABLE_TTC")}
+
+
+def _row_hphc(row: dict[str, str]) -> dict[str, Any]:
+    return {
+        "HP": _price(row, "PART_VARIABLE_HP_TTC"),
+        "HC": _price(row, "PART_VARIABLE_HC_TTC"),
+    }
+
+
+def _row_tempo(row: dict[str, str]) -> dict[str, Any]:
+    return {
+        color: {
+            "HC": _price(row, f"PART_VARIABLE_HC{suffix}_TTC"),
+            "HP": _price(row, f"PART_VARIABLE_HP{suffix}_TTC"),
+        }
+        for color, suffix in _TEMPO_COLUMNS.items()
+    }
+
+
+# Contract -> (CSV URL, row parser)
+TARIFF_GRIDS: dict[str, tuple[str, Callable[[dict[str, str]], dict[str, Any]]]] = {
+    "Base": (PRICE_BASE_URL, _row_base),
+    "Heures Creuses": (PRICE_HPHC_URL, _row_hphc),
+    "Tempo": (PRICE_TEMPO_URL, _row_tempo),
+}
+
+
+def parse_date(date_str: str | None) -> date | None:
+    """Parse ``YYYY-MM-DD`` or ``DD/MM/YYYY`` without going through strptime."""
+    if not date_str:
+        return None
+    date_str = date_str.strip()
+    try:
+        if len(date_str) == 10 and date_str[2] == "/" and date_str[5] == "/":
+            return date(int(date_str[6:]), int(date_str[3:5]), int(date_str[:2]))
+        return date.fromisoformat(date_str)
+    except ValueError:
+        return None
+
+
+class TariffCsvParser:
+    """Incremental grid parser, fed the CSV chunks as they download (executor).
+
+    Records are one per line. Each line is decoded as UTF-8 (BOM stripped), else
+    Latin-1 from there on. No early exit: the index keeps every power level and
+    every validity interval, so the whole file is always read.
+    """
+
+    def __init__(self, contract: str) -> None:
+        self._contract = contract
+        _url, self._row_parser = TARIFF_GRIDS[contract]
+        self._pending = b""
+        self._started = False
+        self._encoding = "utf-8"
+        self._fieldnames: list[str] | None = None
+        self._delimiter = ","
+        self._periods: dict[str, list[TariffPeriod]] = {}
+
+    def feed(self, chunk: bytes) -> bool:
+        data = self._pending + chunk
+        if not self._started:
+            if len(data) < len(codecs.BOM_UTF8):
+                self._pending = data
+                return False
+            self._started = True
+            data = data.removeprefix(codecs.BOM_UTF8)
+        lines = data.split(b"\n")
+        self._pending = lines.pop()
+        self._add_lines(lines)
+        return False
+
+    def close(self) -> TariffIndex:
+        if self._pending:
+            self._add_lines([self._pending.removeprefix(codecs.BOM_UTF8)])
+            self._pending = b""
+        index = TariffIndex(self._periods)
+        _LOGGER.debug("%s grid indexed: powers %s", self._contract, index.powers)
+        return index
+
+    def _decode(self, line: bytes) -> str:
+        if self._encoding == "utf-8":
+            try:
+                return line.decode("utf-8")
+            except UnicodeDecodeError:
+                self._encoding = "latin-1"
+        return line.decode("latin-1")
+
+    def _add_lines(self, lines: list[bytes]) -> None:
+        text = [self._decode(line).rstrip("\r") for line in lines]
+        if self._fieldnames is None:
+            while text and not text[0].strip():
+                del text[0]
+            if not text:
+                return
+            # Cleaned headers and auto-detected delimiter
+            header = text.pop(0)
+            self._delimiter = ';' if ';' in header else ','
+            headers = next(csv.reader([header], delimiter=self._delimiter), [])
+            self._fieldnames = [h.strip() for h in headers]
+        for row in csv.DictReader(text, fieldnames=self._fieldnames, delimiter=self._delimiter):
+            self._add_row(row)
+
+    def _add_row(self, row: dict[str, str]) -> None:
+        power = (row.get("P_SOUSCRITE") or "").strip()
+        start = parse_date(row.get("DATE_DEBUT"))
+        if not power or start is None:
+            return
+        try:
+            prices = self._row_parser(row)
+        except (KeyError, ValueError, AttributeError):
+            return
+        self._periods.setdefault(power, []).append(
+            TariffPeriod(start, parse_date(row.get("DATE_FIN")), prices)
+        )
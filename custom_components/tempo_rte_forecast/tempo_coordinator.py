@@ -1,21 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import date, datetime, time
+from datetime import datetime, time, timedelta
 from collections.abc import Sequence
 from typing import Any
-import aiohttp
-import async_timeout
-import json
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.event import async_track_point_in_time, async_track_time_change
 from homeassistant.util import dt as dt_util
 
 from .coordinator_retry import RetryWhenNoUpdateIntervalMixin
+from .hub import async_get_hub
+from .metrics import SOURCE_COULEUR_TEMPO, SOURCE_RTE_FULL, SOURCE_TEMPO_LIGHT
 from .const import (
     TEMPO_DAY_CHANGE_TIME,
     RTE_API_URL,
@@ -25,12 +24,22 @@ from .const import (
     TEMPO_RETRY_DELAY_MINUTES,
     CONF_TEMPO_DAY_CHANGE_TIME,
     CONF_TEMPO_RETRY_DELAY,
+    CONF_RETRY_MAX_BACKOFF,
+    DEFAULT_RETRY_MAX_BACKOFF_MINUTES,
     CONF_RTE_TEMPO_COLOR_REFRESH_TIME,
     DEFAULT_RTE_TEMPO_COLOR_REFRESH_TIME,
     CONF_EDF_TEMPO_COLOR_REFRESH_TIME,
     DEFAULT_EDF_TEMPO_COLOR_REFRESH_TIME,
+    CONF_TEMPO_HEDGE_DELAY,
+    DEFAULT_TEMPO_HEDGE_DELAY,
+    CONF_TEMPO_FETCH_DEADLINE,
+    DEFAULT_TEMPO_FETCH_DEADLINE,
+    PUBLICATION_POLL_INTERVAL,
 )
-from .utils import get_tempo_date, get_tempo_season
+from .publication import PublicationWindow
+from .season_calendar import SeasonCalendar, known_colors, season_of, seasons_needed
+from .storage import TempoStore
+from .utils import get_tempo_date, normalize_color
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,17 +62,71 @@ class TempoDataCoordinator(RetryWhenNoUpdateIntervalMixin, DataUpdateCoordinator
         self.edf_tempo_refresh_time_str = entry.options.get(CONF_EDF_TEMPO_COLOR_REFRESH_TIME, DEFAULT_EDF_TEMPO_COLOR_REFRESH_TIME)
         self.edf_tempo_refresh_time = time.fromisoformat(self.edf_tempo_refresh_time_str)
         self.retry_delay = entry.options.get(CONF_TEMPO_RETRY_DELAY, TEMPO_RETRY_DELAY_MINUTES)
+        self.retry_max_backoff = float(
+            entry.options.get(CONF_RETRY_MAX_BACKOFF, DEFAULT_RETRY_MAX_BACKOFF_MINUTES)
+        ) * 60
+        self.hedge_delay = float(entry.options.get(CONF_TEMPO_HEDGE_DELAY, DEFAULT_TEMPO_HEDGE_DELAY))
+        self.fetch_deadline = float(entry.options.get(CONF_TEMPO_FETCH_DEADLINE, DEFAULT_TEMPO_FETCH_DEADLINE))
 
         self.tempo_data = {}
-        self._cached_data = {}  # Cache pour garder les dernières données valides
+        # Calendrier des saisons : la saison complète n'est téléchargée qu'une fois,
+        # ensuite seuls les jours modifiés sont fusionnés.
+        self._calendar = SeasonCalendar()
+        self._cached_data = self._calendar.days  # Cache pour garder les dernières données valides
         self._last_api_call = None
         self._data_fetched_today = False
         self._scheduled_listeners: list = []
+        self._store: TempoStore | None = None
         
-        # Utilisation d'une session partagée. La vérification SSL est activée par défaut.
-        self.session = async_get_clientsession(hass)
+        # Hub partagé entre les entrées : un seul téléchargement par source.
+        self.hub = async_get_hub(hass)
+
+        # Sonde J+1 adaptative dans la fenêtre de publication apprise
+        self._publication = PublicationWindow()
+        self._unsub_publication_poll: CALLBACK_TYPE | None = None
 
         self._schedule_updates()
+        self._schedule_publication_poll()
+
+    @callback
+    def async_restore(self, store: TempoStore) -> bool:
+        """Restaure le calendrier depuis le cache disque.
+
+        Retourne True si J et J+1 sont déjà connus (pas besoin d'appel API au démarrage).
+        """
+        self._store = store
+        store.register("tempo", self._as_storage)
+        store.register("publication", self._publication.as_storage)
+        self._publication.restore(store.section("publication"))
+        restored = self._calendar.restore(store.section("tempo"))
+        if not restored:
+            return False
+
+        today = get_tempo_date(0, self.tempo_day_change_time_str)
+        tomorrow = get_tempo_date(1, self.tempo_day_change_time_str)
+        _LOGGER.info(
+            "[Store] %s couleurs restaurées - J: %s, J+1: %s",
+            len(restored),
+            restored.get(today),
+            restored.get(tomorrow, "N/A"),
+        )
+        if today not in restored or tomorrow not in restored:
+            return False
+
+        self.tempo_data = dict(self._cached_data)
+        self._data_fetched_today = True
+        self._last_api_call = dt_util.now().astimezone(dt_util.get_time_zone("Europe/Paris")).strftime("%Y-%m-%d")
+        return True
+
+    @property
+    def calendar(self) -> SeasonCalendar:
+        """Calendrier des saisons connues (lecture seule pour les consommateurs)."""
+        return self._calendar
+
+    @callback
+    def _as_storage(self) -> dict[str, Any]:
+        """Format compact: {date: code couleur} + saisons complètes déjà chargées."""
+        return self._calendar.as_storage()
 
     def _schedule_updates(self) -> None:
         """Programme les mises à jour aux heures clés."""
@@ -117,6 +180,63 @@ class TempoDataCoordinator(RetryWhenNoUpdateIntervalMixin, DataUpdateCoordinator
         self._last_api_call = today_date
         await self.async_refresh()
 
+    def publication_window(self) -> tuple[time, time]:
+        """Fenêtre de sonde J+1 : apprise, sinon entre les heures RTE et EDF configurées."""
+        return self._publication.window(
+            self.rte_tempo_refresh_time, self.edf_tempo_refresh_time, self.tempo_day_change_time
+        )
+
+    @callback
+    def _schedule_publication_poll(self) -> None:
+        """Programme la prochaine sonde J+1 : toutes les 5 min dans la fenêtre, sinon à son ouverture."""
+        if self._unsub_publication_poll is not None:
+            self._unsub_publication_poll()
+        tz = dt_util.get_time_zone("Europe/Paris")
+        now = dt_util.now(tz)
+        start, end = self.publication_window()
+        window_start = datetime.combine(now.date(), start, tz)
+        if now < window_start:
+            next_poll = window_start
+        elif now < datetime.combine(now.date(), end, tz) and not self._data_fetched_today:
+            next_poll = now + timedelta(seconds=PUBLICATION_POLL_INTERVAL)
+        else:
+            next_poll = datetime.combine(now.date() + timedelta(days=1), start, tz)
+        self._unsub_publication_poll = async_track_point_in_time(
+            self.hass, self._async_publication_poll, next_poll
+        )
+
+    async def _async_publication_poll(self, _now: datetime) -> None:
+        self._unsub_publication_poll = None
+        try:
+            if not self._data_fetched_today:
+                await self._async_probe_tomorrow()
+        finally:
+            self._schedule_publication_poll()
+
+    async def _async_probe_tomorrow(self) -> None:
+        """Sonde légère (tempoLight, sinon api-couleur-tempo.fr) ; refresh complet dès que J+1 est publiée."""
+        today = get_tempo_date(0, self.tempo_day_change_time_str)
+        tomorrow = get_tempo_date(1, self.tempo_day_change_time_str)
+        probe = await self._fetch_light_values({}, today, tomorrow)
+        if self._day_needs_couleur_tempo_fill(probe or {}, tomorrow):
+            probe = await self._fetch_couleur_tempo_values({}, today, tomorrow)
+        if self._day_needs_couleur_tempo_fill(probe or {}, tomorrow):
+            _LOGGER.debug("[Publication] J+1 (%s) pas encore publiée", tomorrow)
+            return
+
+        _LOGGER.info("[Publication] J+1 (%s) publiée, récupération", tomorrow)
+        # tempoLight / api-couleur-tempo.fr resservis par le cache mémoire du hub
+        await self.async_refresh()
+        if not self._data_fetched_today:
+            return
+        now = dt_util.now(dt_util.get_time_zone("Europe/Paris"))
+        self._last_api_call = now.strftime("%Y-%m-%d")
+        self._publication.record(self._last_api_call, now.time())
+        if self._store is not None:
+            self._store.async_schedule_save()
+        start, end = self.publication_window()
+        _LOGGER.debug("[Publication] Fenêtre de publication J+1: %s-%s", start, end)
+
     async def _trigger_day_change(self, _now: datetime | None = None) -> None:
         """Changement de période HP/HC ou de jour."""
         now = dt_util.now().astimezone(dt_util.get_time_zone("Europe/Paris"))
@@ -134,31 +254,28 @@ class TempoDataCoordinator(RetryWhenNoUpdateIntervalMixin, DataUpdateCoordinator
             _LOGGER.warning("[Validation] Données vides reçues de l'API (dict vide ou None)")
             return False
 
-        # Normalise les données en minuscules
-        normalized_data = {d: c.lower() if c else None for d, c in new_data.items()}
-
         today = get_tempo_date(0, self.tempo_day_change_time_str)
         tomorrow = get_tempo_date(1, self.tempo_day_change_time_str)
 
         _LOGGER.debug("[Validation] Date J calculée: %s, Date J+1: %s", today, tomorrow)
-        _LOGGER.debug("[Validation] Nombre total d'entrées reçues: %s", len(normalized_data))
+        _LOGGER.debug("[Validation] Nombre total d'entrées reçues: %s", len(new_data))
 
         # Vérifie que les données essentielles sont présentes
-        today_color = normalized_data.get(today)
-        tomorrow_color = normalized_data.get(tomorrow)
+        today_color = normalize_color(new_data[today]) if new_data.get(today) else None
+        tomorrow_color = normalize_color(new_data[tomorrow]) if new_data.get(tomorrow) else None
 
-        # Mise à jour du cache avec les données valides
-        valid_entries = {d: c for d, c in normalized_data.items() if c in COLORS}
-        self._cached_data.update(valid_entries)
-        cached_count = len(valid_entries)
-        _LOGGER.info("[Validation] Cache mis à jour (%s entrées) - J: %s, J+1: %s", cached_count, today_color, tomorrow_color or 'N/A')
+        # Mise à jour du cache : seuls les jours dont la couleur a changé sont fusionnés
+        changed = self._calendar.merge(new_data)
+        if changed and self._store is not None:
+            self._store.async_schedule_save()
+        _LOGGER.info("[Validation] Cache mis à jour (%s jours modifiés) - J: %s, J+1: %s", len(changed), today_color, tomorrow_color or 'N/A')
 
         _LOGGER.debug("[Validation] Couleur J (%s): %s", today, today_color)
         _LOGGER.debug("[Validation] Couleur J+1 (%s): %s", tomorrow, tomorrow_color)
 
         if not today_color:
             _LOGGER.warning("[Validation] Date J (%s) absente des données API", today)
-            _LOGGER.debug("[Validation] Dates disponibles (dernières 10): %s", sorted(normalized_data.keys())[-10:])
+            _LOGGER.debug("[Validation] Dates disponibles (dernières 10): %s", sorted(new_data.keys())[-10:])
             return False
 
         if today_color not in COLORS:
@@ -170,7 +287,8 @@ class TempoDataCoordinator(RetryWhenNoUpdateIntervalMixin, DataUpdateCoordinator
             _LOGGER.warning("[Validation] Couleur J+1 invalide: '%s' (attendu: %s)", tomorrow_color, list(COLORS.keys()))
             return False
 
-        self.tempo_data = normalized_data
+        days = self._calendar.days
+        self.tempo_data = {d: days[d] for d in new_data if d in days}
         return True
 
     async def _fetch_json_url(
@@ -179,65 +297,14 @@ class TempoDataCoordinator(RetryWhenNoUpdateIntervalMixin, DataUpdateCoordinator
         log_prefix: str,
         *,
         params: Sequence[tuple[str, str]] | None = None,
+        source: str | None = None,
     ) -> dict[str, Any] | list[Any] | None:
-        """GET JSON générique (RTE ou api-couleur-tempo.fr)."""
-        now = dt_util.now().astimezone(dt_util.get_time_zone("Europe/Paris"))
-        _LOGGER.debug(
-            "%s Appel à %s — URL: %s params=%s",
-            log_prefix,
-            now.strftime("%H:%M:%S"),
-            url,
-            params,
-        )
-
-        try:
-            async with async_timeout.timeout(15):
-                async with self.session.get(url, params=params) as response:
-                    _LOGGER.debug("%s Status HTTP: %s", log_prefix, response.status)
-
-                    if response.status != 200:
-                        response_text = await response.text()
-                        snippet = response_text[:500]
-                        if response.status >= 500:
-                            _LOGGER.warning(
-                                "%s HTTP %s (service may be in maintenance) — %s",
-                                log_prefix,
-                                response.status,
-                                snippet,
-                            )
-                        else:
-                            _LOGGER.error(
-                                "%s Erreur HTTP %s — %s",
-                                log_prefix,
-                                response.status,
-                                snippet,
-                            )
-                        return None
-
-                    response_text = await response.text()
-                    _LOGGER.debug("%s Réponse (500 premiers chars): %s", log_prefix, response_text[:500])
+        """GET JSON générique (RTE ou api-couleur-tempo.fr) via le hub partagé."""
+        return await self.hub.async_get_json(url, log_prefix, params=params, source=source)
 
-                    try:
-                        data = json.loads(response_text)
-                        return data
-                    except json.JSONDecodeError as json_err:
-                        _LOGGER.error("%s Erreur parsing JSON: %s", log_prefix, json_err)
-                        _LOGGER.error("%s Contenu: %s", log_prefix, response_text[:1000])
-                        return None
-
-        except TimeoutError:
-            _LOGGER.error("%s Timeout (15s)", log_prefix)
-            return None
-        except aiohttp.ClientError as err:
-            _LOGGER.error("%s Erreur de connexion: %s", log_prefix, err)
-            return None
-        except Exception as err:
-            _LOGGER.error("%s Erreur inattendue: %s", log_prefix, err, exc_info=True)
-            return None
-
-    async def _fetch_rte_data(self, url: str) -> dict[str, Any] | None:
+    async def _fetch_rte_data(self, url: str, source: str) -> dict[str, Any] | None:
         """Récupère les données JSON depuis une URL RTE donnée."""
-        raw = await self._fetch_json_url(url, "[RTE]")
+        raw = await self._fetch_json_url(url, "[RTE]", source=source)
         if raw is None or isinstance(raw, list):
             return None
         return raw
@@ -267,32 +334,44 @@ class TempoDataCoordinator(RetryWhenNoUpdateIntervalMixin, DataUpdateCoordinator
         mapping = {"bleu": "blue", "blanc": "white", "rouge": "red"}
         return mapping.get(lib)
 
-    async def _apply_couleur_tempo_buffer(
+    async def _fetch_light_values(
         self, values: dict[str, Any], today: str, tomorrow: str
-    ) -> None:
-        """Complète J / J+1 via GET /api/joursTempo?dateJour[]=… (une requête pour toutes les dates manquantes)."""
+    ) -> dict[str, Any] | None:
+        """Source 1 : API RTE tempoLight."""
+        data = await self._fetch_rte_data(RTE_API_URL, SOURCE_TEMPO_LIGHT)
+        if data:
+            v = data.get("values", {})
+            if isinstance(v, dict):
+                return dict(v)
+        return None
+
+    async def _fetch_couleur_tempo_values(
+        self, values: dict[str, Any], today: str, tomorrow: str
+    ) -> dict[str, Any] | None:
+        """Source 2 : J / J+1 via GET /api/joursTempo?dateJour[]=… (une requête pour toutes les dates manquantes)."""
         missing = [
             d
             for d in (today, tomorrow)
             if self._day_needs_couleur_tempo_fill(values, d)
         ]
         if not missing:
-            return
+            return None
 
         batch_url = f"{COULEUR_TEMPO_API_BASE}/api/joursTempo"
         query_params: list[tuple[str, str]] = [("dateJour[]", d) for d in missing]
         raw = await self._fetch_json_url(
-            batch_url, "[CouleurTempo]", params=query_params
+            batch_url, "[CouleurTempo]", params=query_params, source=SOURCE_COULEUR_TEMPO
         )
         if raw is None:
-            return
+            return None
         if not isinstance(raw, list):
             _LOGGER.warning(
                 "[CouleurTempo] Réponse /api/joursTempo inattendue (type %s)",
                 type(raw).__name__,
             )
-            return
+            return None
 
+        found: dict[str, Any] = {}
         missing_set = set(missing)
         for payload in raw:
             if not isinstance(payload, dict):
@@ -307,39 +386,175 @@ class TempoDataCoordinator(RetryWhenNoUpdateIntervalMixin, DataUpdateCoordinator
                     day,
                 )
                 continue
-            values[day] = color
+            found[day] = color
             _LOGGER.info("[CouleurTempo] Complément pour %s: %s", day, color)
+        return found
+
+    async def _fetch_full_values(
+        self, values: dict[str, Any], today: str, tomorrow: str
+    ) -> dict[str, Any] | None:
+        """Source 3 (dernier recours) : calendrier saison API Full RTE."""
+        _LOGGER.info(
+            "Données encore incomplètes après api-couleur-tempo, tentative API Full RTE"
+        )
+        # J et J+1 peuvent appartenir à deux saisons (31 juillet) : téléchargements en parallèle
+        seasons = sorted({season_of(today), season_of(tomorrow)})
+        values_full: dict[str, Any] = {}
+        for season, season_values in zip(
+            seasons, await asyncio.gather(*(self._fetch_season(s) for s in seasons))
+        ):
+            if season_values:
+                self._calendar.load_season(season, season_values, today)
+                values_full.update(season_values)
+        return values_full or None
+
+    async def _fetch_season(self, season: str) -> dict[str, Any] | None:
+        """Calendrier complet d'une saison (API Full RTE)."""
+        data_full = await self._fetch_rte_data(
+            RTE_API_FULL_URL.format(season=season), SOURCE_RTE_FULL
+        )
+        if data_full:
+            values_full = data_full.get("values", {})
+            if isinstance(values_full, dict) and values_full:
+                return values_full
+        return None
+
+    async def async_fetch_past_season(self, season: str) -> dict[str, str]:
+        """Couleurs d'une saison passée (API Full RTE), hors calendrier courant (historique des statistiques)."""
+        return known_colors(await self._fetch_season(season) or {})
+
+    async def _async_load_seasons(self, today: str) -> None:
+        """Charge le calendrier complet des saisons utiles (en parallèle), complété si des jours manquent."""
+        needed = seasons_needed(today)
+        missing = self._calendar.seasons_to_load(needed, today)
+        if not missing:
+            return
+        _LOGGER.info("[Saison] Chargement du calendrier complet: %s", ", ".join(missing))
+        results = await asyncio.gather(
+            *(self._fetch_season(s) for s in missing), return_exceptions=True
+        )
+        loaded = False
+        for season, season_values in zip(missing, results):
+            if isinstance(season_values, BaseException) or not season_values:
+                _LOGGER.warning("[Saison] Calendrier %s indisponible, nouvel essai au prochain rafraîchissement", season)
+                continue
+            changed = self._calendar.load_season(season, season_values, today)
+            loaded = True
+            _LOGGER.info("[Saison] %s chargée (%s jours modifiés)", season, len(changed))
+        self._calendar.prune(needed)
+        if loaded and self._store is not None:
+            self._store.async_schedule_save()
+
+    def _merge_source_values(
+        self, results: dict[str, dict[str, Any]], today: str, tomorrow: str
+    ) -> dict[str, Any]:
+        """Fusionne les sources : tempoLight, complété par le tampon, puis le calendrier Full."""
+        values: dict[str, Any] = dict(results.get("light") or {})
+        for day, color in (results.get("buffer") or {}).items():
+            if self._day_needs_couleur_tempo_fill(values, day):
+                values[day] = color
+        full = results.get("full")
+        if full and (
+            self._day_needs_couleur_tempo_fill(values, today)
+            or self._day_needs_couleur_tempo_fill(values, tomorrow)
+        ):
+            merged = dict(full)
+            merged.update(
+                (d, c) for d, c in values.items() if not self._day_needs_couleur_tempo_fill(values, d)
+            )
+            values = merged
+        return values
+
+    async def _async_fetch_values(self, today: str, tomorrow: str) -> dict[str, Any]:
+        """Chaîne de sources en mode « hedged ».
+
+        La source suivante démarre dès que la précédente a échoué / est incomplète, ou
+        après ``hedge_delay`` secondes sans réponse. La première réponse donnant J et J+1
+        gagne, les requêtes restantes sont annulées. ``fetch_deadline`` borne la chaîne.
+        """
+        sources = (
+            ("light", self._fetch_light_values),
+            ("buffer", self._fetch_couleur_tempo_values),
+            ("full", self._fetch_full_values),
+        )
+        loop = self.hass.loop
+        deadline = loop.time() + self.fetch_deadline
+        results: dict[str, dict[str, Any]] = {}
+        pending: dict[asyncio.Task, str] = {}
+        started = 0
+
+        def start_next() -> None:
+            nonlocal started
+            name, factory = sources[started]
+            started += 1
+            values = self._merge_source_values(results, today, tomorrow)
+            pending[loop.create_task(factory(values, today, tomorrow))] = name
+
+        def is_complete(values: dict[str, Any]) -> bool:
+            return not (
+                self._day_needs_couleur_tempo_fill(values, today)
+                or self._day_needs_couleur_tempo_fill(values, tomorrow)
+            )
+
+        start_next()
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    _LOGGER.warning(
+                        "[API] Délai global de %ss dépassé, abandon de: %s",
+                        self.fetch_deadline,
+                        ", ".join(pending.values()),
+                    )
+                    break
+                can_hedge = started < len(sources)
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=min(remaining, self.hedge_delay) if can_hedge else remaining,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    if can_hedge:
+                        _LOGGER.info(
+                            "[API] %s sans réponse après %ss, lancement de '%s' en parallèle",
+                            ", ".join(pending.values()),
+                            self.hedge_delay,
+                            sources[started][0],
+                        )
+                        start_next()
+                    continue
+
+                for task in done:
+                    name = pending.pop(task)
+                    try:
+                        source_values = task.result()
+                    except Exception as err:
+                        _LOGGER.error("[API] Source '%s' en erreur: %s", name, err)
+                        continue
+                    if source_values:
+                        results[name] = source_values
+
+                if is_complete(self._merge_source_values(results, today, tomorrow)):
+                    break
+                if not pending and started < len(sources):
+                    start_next()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return self._merge_source_values(results, today, tomorrow)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Récupération des données depuis l'API RTE (tempoLight) avec fallback."""
         today = get_tempo_date(0, self.tempo_day_change_time_str)
         tomorrow = get_tempo_date(1, self.tempo_day_change_time_str)
 
-        # 1. API RTE tempoLight
-        data = await self._fetch_rte_data(RTE_API_URL)
-        values: dict[str, Any] = {}
-        if data:
-            v = data.get("values", {})
-            if isinstance(v, dict):
-                values = dict(v)
-
-        # 2. Tampon api-couleur-tempo.fr (données RTE agrégées) pour J / J+1 manquants
-        await self._apply_couleur_tempo_buffer(values, today, tomorrow)
-
-        # 3. Dernier recours : calendrier saison API Full RTE
-        if self._day_needs_couleur_tempo_fill(values, today) or self._day_needs_couleur_tempo_fill(
-            values, tomorrow
-        ):
-            _LOGGER.info(
-                "Données encore incomplètes après api-couleur-tempo, tentative API Full RTE"
-            )
-            today_dt = date.fromisoformat(today)
-            season = get_tempo_season(today_dt)
-            data_full = await self._fetch_rte_data(RTE_API_FULL_URL.format(season=season))
-            if data_full:
-                values_full = data_full.get("values", {})
-                if isinstance(values_full, dict) and values_full:
-                    values = values_full
+        # 1. tempoLight, 2. tampon api-couleur-tempo.fr, 3. calendrier saison API Full RTE
+        # En parallèle : chargement unique du calendrier complet de la (des) saison(s).
+        values, _ = await asyncio.gather(
+            self._async_fetch_values(today, tomorrow),
+            self._async_load_seasons(today),
+        )
 
         # 4. Traitement des données récupérées (Light, tampon, ou Full)
         if values:
@@ -381,6 +596,9 @@ class TempoDataCoordinator(RetryWhenNoUpdateIntervalMixin, DataUpdateCoordinator
         for remove_listener in self._scheduled_listeners:
             remove_listener()
         self._scheduled_listeners.clear()
+        if self._unsub_publication_poll is not None:
+            self._unsub_publication_poll()
+            self._unsub_publication_poll = None
         await super().async_shutdown()
 
     def get_data(self, date: str) -> str | None:
@@ -1,19 +1,12 @@
 from __future__ import annotations
+from bisect import bisect_right
 from datetime import date, datetime, timedelta, time
 import logging
+from collections.abc import Mapping
+from typing import Any
 from homeassistant.util import dt as dt_util
-from .const import (
-    TEMPO_DAY_CHANGE_TIME,
-    COLORS,
-    CONF_ICON_COLOR_BLUE,
-    CONF_ICON_COLOR_WHITE,
-    CONF_ICON_COLOR_RED,
-    CONF_ICON_COLOR_UNKNOWN,
-    DEFAULT_ICON_COLOR_BLUE,
-    DEFAULT_ICON_COLOR_WHITE,
-    DEFAULT_ICON_COLOR_RED,
-    DEFAULT_ICON_COLOR_UNKNOWN,
-)
+from .colors import IconPalette, color_of, resolve_color
+from .const import TEMPO_DAY_CHANGE_TIME
 
 def get_tempo_date(offset_days: int = 0, tempo_day_change_time_str: str = TEMPO_DAY_CHANGE_TIME) -> str:
     _LOGGER = logging.getLogger(__name__)
@@ -29,12 +22,98 @@ def get_tempo_date(offset_days: int = 0, tempo_day_change_time_str: str = TEMPO_
     target_date = now - change_time_delta + timedelta(days=offset_days)
     return target_date.strftime("%Y-%m-%d")
 
-def parse_offpeak_ranges(ranges_str: str) -> list[tuple[time, time]]:
-    """Parse a string of time ranges into a list of time tuples."""
+class OffpeakTimeline:
+    """Compiled, sorted boundary table of a day.
+
+    Boundaries are the starts/ends of the off-peak ranges (plus optional extra
+    transition times, e.g. the Tempo day change). The HP/HC state of each
+    segment between two boundaries is computed once, so "current period",
+    "next transition" and "time until transition" are binary searches whatever
+    the number of ranges. Iterating yields the ``(start, end)`` ranges.
+    """
+
+    __slots__ = ("ranges", "_bounds", "_offpeak")
+
+    def __init__(
+        self,
+        ranges: list[tuple[time, time]],
+        extra_boundaries: tuple[time, ...] = (),
+    ) -> None:
+        self.ranges = list(ranges)
+        bounds = {_seconds(t) for r in self.ranges for t in r}
+        bounds.update(_seconds(t) for t in extra_boundaries)
+        self._bounds = sorted(bounds)
+        self._offpeak = [
+            _in_ranges(_time_of(b), self.ranges) for b in self._bounds
+        ]
+
+    def __iter__(self):
+        return iter(self.ranges)
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def __bool__(self) -> bool:
+        return bool(self.ranges)
+
+    def with_boundaries(self, *extra: time) -> OffpeakTimeline:
+        """Same ranges, with additional transition times."""
+        return OffpeakTimeline(self.ranges, extra)
+
+    @property
+    def boundaries(self) -> list[time]:
+        """Sorted transition times of the day."""
+        return [_time_of(b) for b in self._bounds]
+
+    def is_offpeak(self, current: time) -> bool:
+        if not self._bounds:
+            return False
+        # Before the first boundary: still in the last segment of the previous day
+        return self._offpeak[bisect_right(self._bounds, _seconds(current)) - 1]
+
+    def next_transition(self, current: time) -> time | None:
+        if not self._bounds:
+            return None
+        i = bisect_right(self._bounds, _seconds(current))
+        return _time_of(self._bounds[i % len(self._bounds)])
+
+    def seconds_until_transition(self, current: time) -> int | None:
+        if not self._bounds:
+            return None
+        sec = _seconds(current)
+        i = bisect_right(self._bounds, sec)
+        if i < len(self._bounds):
+            return self._bounds[i] - sec
+        return self._bounds[0] + 86400 - sec
+
+
+def _seconds(t: time) -> int:
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
+def _time_of(seconds: int) -> time:
+    return time(seconds // 3600, seconds % 3600 // 60, seconds % 60)
+
+
+def _in_ranges(current_time: time, offpeak_ranges) -> bool:
+    for start_time, end_time in offpeak_ranges:
+        # Case 1: Range does not cross midnight (e.g., 01:00-05:00)
+        if start_time < end_time:
+            if start_time <= current_time < end_time:
+                return True
+        # Case 2: Range crosses midnight (e.g., 22:00-06:00)
+        else:
+            if current_time >= start_time or current_time < end_time:
+                return True
+    return False
+
+
+def parse_offpeak_ranges(ranges_str: str) -> OffpeakTimeline:
+    """Parse a string of time ranges into a compiled timeline."""
     _LOGGER = logging.getLogger(__name__)
     ranges = []
     if not ranges_str:
-        return ranges
+        return OffpeakTimeline(ranges)
     for part in ranges_str.split(','):
         part = part.strip()
         if not part:
@@ -46,21 +125,13 @@ def parse_offpeak_ranges(ranges_str: str) -> list[tuple[time, time]]:
             ranges.append((start_time, end_time))
         except ValueError as e:
             _LOGGER.error("Plage horaire invalide '%s': %s", part, e)
-    return ranges
+    return OffpeakTimeline(ranges)
 
-def is_offpeak(now: datetime, offpeak_ranges: list[tuple[time, time]]) -> bool:
+def is_offpeak(now: datetime, offpeak_ranges: OffpeakTimeline | list[tuple[time, time]]) -> bool:
     """Check if the current time is within any of the off-peak ranges."""
-    current_time = now.time()
-    for start_time, end_time in offpeak_ranges:
-        # Case 1: Range does not cross midnight (e.g., 01:00-05:00)
-        if start_time < end_time:
-            if start_time <= current_time < end_time:
-                return True
-        # Case 2: Range crosses midnight (e.g., 22:00-06:00)
-        else:
-            if current_time >= start_time or current_time < end_time:
-                return True
-    return False
+    if isinstance(offpeak_ranges, OffpeakTimeline):
+        return offpeak_ranges.is_offpeak(now.time())
+    return _in_ranges(now.time(), offpeak_ranges)
 
 def get_tempo_season(date_ref: date | datetime | None = None) -> str:
     """Retourne la saison Tempo actuelle (ex: '2024-2025'). Changement au 1er août."""
@@ -73,58 +144,28 @@ def get_tempo_season(date_ref: date | datetime | None = None) -> str:
     return f"{start_year}-{start_year + 1}"
 
 def normalize_color(color: str | None) -> str:
-    """Normalize color name to English key."""
+    """Normalize color name to English key (non-color strings are returned lowercased)."""
     if not color:
         return "unknown"
-    color = color.lower()
-    mapping = {
-        "bleu": "blue",
-        "blue": "blue",
-        "blanc": "white",
-        "white": "white",
-        "rouge": "red",
-        "red": "red",
-    }
-    return mapping.get(color, color)
-
-def get_icon_color(options: dict, color_key: str) -> str:
-    """Get icon color from options."""
-    if color_key == "blue":
-        return options.get(CONF_ICON_COLOR_BLUE, DEFAULT_ICON_COLOR_BLUE)
-    if color_key == "white":
-        return options.get(CONF_ICON_COLOR_WHITE, DEFAULT_ICON_COLOR_WHITE)
-    if color_key == "red":
-        return options.get(CONF_ICON_COLOR_RED, DEFAULT_ICON_COLOR_RED)
-    return options.get(CONF_ICON_COLOR_UNKNOWN, DEFAULT_ICON_COLOR_UNKNOWN)
+    resolved = resolve_color(color)
+    return resolved.key if resolved is not None else color.lower()
+
+def get_icon_color(options: Mapping[str, Any], color_key: str) -> str:
+    """Get icon color from options (prefer a per-entry ``IconPalette`` on hot paths)."""
+    return IconPalette(options)[color_key]
 
 def get_color_code(data: str | None) -> int:
-    """Retourne le code couleur pour une date donnée (avec cache)."""
-    color_key = normalize_color(data)
-    if color_key in COLORS:
-        return COLORS[color_key]["code"]
-    
-    return COLORS["unknown"]["code"]
+    """Retourne le code couleur."""
+    return color_of(data).code
 
 def get_color_name(data: str | None) -> str:
-    """Retourne le nom de la couleur pour une date donnée (avec cache)."""
-    color_key = normalize_color(data)
-    if color_key in COLORS:
-        return COLORS[color_key]["name"]
-    
-    return COLORS["unknown"]["name"]
+    """Retourne le nom de la couleur."""
+    return color_of(data).name
 
 def get_color_name_en(data: str | None) -> str:
-    """Retourne le nom anglais de la couleur pour une date donnée (avec cache)."""
-    color_key = normalize_color(data)
-    if color_key in COLORS:
-        return COLORS[color_key]["name_en"]
-    
-    return COLORS["unknown"]["name_en"]
+    """Retourne le nom anglais de la couleur."""
+    return color_of(data).name_en
 
 def get_color_emoji(data: str | None) -> str:
-    """Retourne l'emoji de la couleur pour une date donnée (avec cache)."""
-    color_key = normalize_color(data)
-    if color_key in COLORS:
-        return COLORS[color_key]["emoji"]
-    
-    return COLORS["unknown"]["emoji"]
+    """Retourne l'emoji de la couleur."""
+    return color_of(data).emoji